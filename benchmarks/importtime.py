@@ -0,0 +1,120 @@
+"""Import time of the integration and the heavy dependencies it pulls in.
+
+Imports each target in a fresh interpreter with `python -X importtime` and
+reports the total time of the modules it loads and which heavy dependencies (Pillow,
+cryptography, numpy, bleak, Home Assistant) were loaded on the way. Setup
+should not need Pillow or cryptography, they belong to the features that
+use them.
+
+Targets are module names relative to the integration package, "" is the
+package itself including its Home Assistant setup module. Targets that need
+a dependency missing from the environment are reported as skipped.
+
+Usage:
+    python benchmarks/importtime.py [TARGET ...] [--runs 5] [--top 10]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.idotmatrix"
+PACKAGE_PATH = os.path.join(ROOT, "custom_components", "idotmatrix")
+
+DEFAULT_TARGETS = ("client", "client.connectionManager", "ledfx_gateway", "coordinator", "")
+HEAVY = ("PIL", "cryptography", "numpy", "bleak", "homeassistant")
+
+# Loads a module without running the integration's Home Assistant setup, like
+# the other benchmarks. The package itself is imported normally.
+BOOTSTRAP = """
+import sys, types
+for name, path in (("custom_components", {root!r}), ({package!r}, {package_path!r})):
+    package = types.ModuleType(name)
+    package.__path__ = [path]
+    sys.modules[name] = package
+"""
+
+
+def import_times(target: Optional[str]) -> tuple[dict[str, int], str]:
+    """Import a target in a fresh interpreter, None only runs the bootstrap.
+
+    Returns the self time in microseconds per imported module, and the error
+    message if the import failed.
+    """
+    code = BOOTSTRAP.format(
+        root=os.path.dirname(PACKAGE_PATH), package=PACKAGE, package_path=PACKAGE_PATH
+    ) if target else ""
+    if target is not None:
+        code += f"\nimport {PACKAGE}.{target}\n" if target else f"\nimport {PACKAGE}\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    times: dict[str, int] = {}
+    error = ""
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            error = line
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        times.setdefault(fields[2].strip(), int(fields[0]))
+    return times, error if result.returncode else ""
+
+
+def measure(target: str, runs: int, baseline: set[str]) -> tuple[dict[str, float], str]:
+    """Return the median self time of every module the target imports."""
+    samples = []
+    for _ in range(runs):
+        times, error = import_times(target)
+        if error:
+            return {}, error
+        samples.append(times)
+    names = set.intersection(*(set(times) for times in samples)) - baseline
+    return {name: statistics.median(times[name] for times in samples) for name in names}, ""
+
+
+def total(times: dict[str, float], prefix: str) -> float:
+    """Return the time spent in a package and its submodules in ms."""
+    return sum(
+        own for name, own in times.items() if name == prefix or name.startswith(prefix + ".")
+    ) / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", help="modules relative to the integration package")
+    parser.add_argument("--runs", type=int, default=5, help="runs per target, the median is reported")
+    parser.add_argument("--top", type=int, default=0, help="also list the N slowest modules per target")
+    args = parser.parse_args()
+
+    targets = args.targets or list(DEFAULT_TARGETS)
+    # Modules the interpreter loads anyway do not count
+    baseline = set(import_times(None)[0])
+    print(f"{'target':>26} {'total':>9}  heavy dependencies loaded (ms)")
+    for target in targets:
+        label = target or "(package)"
+        times, error = measure(target, max(1, args.runs), baseline)
+        if error:
+            print(f"{label:>26} {'skipped':>9}  {error.strip()}")
+            continue
+        heavy = ", ".join(
+            f"{name} {total(times, name):.1f}" for name in HEAVY if total(times, name)
+        ) or "none"
+        print(f"{label:>26} {sum(times.values()) / 1000:>7.1f}ms  {heavy}")
+        if args.top:
+            for name, own in sorted(times.items(), key=lambda item: -item[1])[:args.top]:
+                print(f"{'':>26} {own / 1000:>7.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
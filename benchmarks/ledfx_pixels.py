@@ -0,0 +1,133 @@
+"""Benchmark of the LedFx gateway pixel buffer updates.
+
+Feeds representative WLED datagrams (DRGB, DRGBW and DNRGB) through the
+gateway's buffer update and compares it with the former per-pixel loop.
+
+Usage:
+    python benchmarks/ledfx_pixels.py [--iterations N]
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.idotmatrix"
+PACKAGE_PATH = os.path.join(ROOT, "custom_components", "idotmatrix")
+
+
+def load_gateway_module():
+    """Load ledfx_gateway.py without running the integration's Home Assistant setup."""
+    for name, path in (("custom_components", os.path.dirname(PACKAGE_PATH)), (PACKAGE, PACKAGE_PATH)):
+        if name not in sys.modules:
+            package = types.ModuleType(name)
+            package.__path__ = [path]
+            sys.modules[name] = package
+    return importlib.import_module(f"{PACKAGE}.ledfx_gateway")
+
+
+def make_datagrams(screen_size: int) -> dict[str, list[bytes]]:
+    """Build one frame worth of datagrams per WLED protocol."""
+    rng = random.Random(0)
+    num_pixels = screen_size * screen_size
+    rgb = bytes(rng.getrandbits(8) for _ in range(num_pixels * 3))
+    rgbw = bytes(rng.getrandbits(8) for _ in range(num_pixels * 4))
+
+    dnrgb = []
+    per_packet = 489
+    for start in range(0, num_pixels, per_packet):
+        chunk = rgb[start * 3:(start + per_packet) * 3]
+        dnrgb.append(bytes([4, 1, start >> 8, start & 0xFF]) + chunk)
+
+    datagrams = {"DNRGB": dnrgb}
+    # DRGB/DRGBW hold at most 490 / 367 pixels per datagram in WLED,
+    # LedFx still sends a whole 32x32 frame in one oversized datagram
+    if num_pixels * 3 + 2 <= 65507:
+        datagrams["DRGB"] = [bytes([2, 1]) + rgb]
+    if num_pixels * 4 + 2 <= 65507:
+        datagrams["DRGBW"] = [bytes([3, 1]) + rgbw]
+    return datagrams
+
+
+def legacy_update_rgb(buffer: bytearray, screen_size: int, pixel_data: bytes, start_idx: int = 0) -> None:
+    """The former per-pixel loop, kept as reference."""
+    num_pixels = len(pixel_data) // 3
+    for i in range(num_pixels):
+        pixel_idx = start_idx + i
+        if pixel_idx >= screen_size * screen_size:
+            break
+        buffer_idx = pixel_idx * 3
+        data_idx = i * 3
+        buffer[buffer_idx] = pixel_data[data_idx]
+        buffer[buffer_idx + 1] = pixel_data[data_idx + 1]
+        buffer[buffer_idx + 2] = pixel_data[data_idx + 2]
+
+
+def legacy_update_rgbw(buffer: bytearray, screen_size: int, pixel_data: bytes) -> None:
+    """The former per-pixel RGBW loop, kept as reference."""
+    num_pixels = len(pixel_data) // 4
+    for i in range(num_pixels):
+        if i >= screen_size * screen_size:
+            break
+        buffer_idx = i * 3
+        data_idx = i * 4
+        buffer[buffer_idx] = pixel_data[data_idx]
+        buffer[buffer_idx + 1] = pixel_data[data_idx + 1]
+        buffer[buffer_idx + 2] = pixel_data[data_idx + 2]
+
+
+def legacy_process(buffer: bytearray, screen_size: int, data: bytes) -> None:
+    if data[0] == 2:
+        legacy_update_rgb(buffer, screen_size, data[2:])
+    elif data[0] == 4:
+        legacy_update_rgb(buffer, screen_size, data[4:], (data[2] << 8) | data[3])
+    elif data[0] == 3:
+        legacy_update_rgbw(buffer, screen_size, data[2:])
+
+
+def bench_gateway(module, screen_size: int, datagrams: list[bytes], iterations: int) -> tuple[float, bytes]:
+    gateway = module.LedFxGateway(coordinator=None, screen_size=screen_size)
+    # Only the synchronous decode into the buffer is measured, not PNG encoding or BLE
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for data in datagrams:
+            gateway._process_frame(data)
+    return time.perf_counter() - start, bytes(gateway._pixel_buffer)
+
+
+def bench_legacy(screen_size: int, datagrams: list[bytes], iterations: int) -> tuple[float, bytes]:
+    buffer = bytearray(screen_size * screen_size * 3)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for data in datagrams:
+            legacy_process(buffer, screen_size, data)
+    return time.perf_counter() - start, bytes(buffer)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    module = load_gateway_module()
+    print(f"{'size':>6} {'protocol':>8} {'legacy us/frame':>16} {'slice us/frame':>15} {'speedup':>8}")
+    for screen_size in (16, 32, 64):
+        for name, datagrams in make_datagrams(screen_size).items():
+            legacy_time, legacy_buffer = bench_legacy(screen_size, datagrams, args.iterations)
+            new_time, new_buffer = bench_gateway(module, screen_size, datagrams, args.iterations)
+            if legacy_buffer != new_buffer:
+                raise SystemExit(f"buffer mismatch for {name} at {screen_size}x{screen_size}")
+            legacy_us = legacy_time / args.iterations * 1e6
+            new_us = new_time / args.iterations * 1e6
+            print(
+                f"{screen_size:>3}x{screen_size:<2} {name:>8} {legacy_us:>16.1f} {new_us:>15.1f} {legacy_us / new_us:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
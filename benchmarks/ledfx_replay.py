@@ -0,0 +1,180 @@
+"""Replay of recorded or synthetic LedFx streams through the gateway.
+
+Feeds datagrams into LedFxGateway at real or accelerated speed, against a
+simulated Bluetooth link instead of a device, and reports the achieved FPS,
+skip ratios, encode time and bytes per frame.
+
+Captures are recorded with the idotmatrix.ledfx_capture_start service. The
+synthetic streams are generated on the fly:
+
+    noise    every pixel changes every frame (worst case for the link)
+    sparkle  a few random pixels light up on black per frame
+    static   the same frame over and over
+
+Usage:
+    python benchmarks/ledfx_replay.py [CAPTURE ...] [--synthetic noise sparkle static]
+        [--size 32] [--speed 1.0] [--rate 20000] [--latency 20]
+        [--save-synthetic DIR]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.idotmatrix"
+PACKAGE_PATH = os.path.join(ROOT, "custom_components", "idotmatrix")
+
+SYNTHETIC = ("noise", "sparkle", "static")
+
+
+def load_module(name: str):
+    """Load an integration module without running the integration's Home Assistant setup."""
+    for package_name, path in (("custom_components", os.path.dirname(PACKAGE_PATH)), (PACKAGE, PACKAGE_PATH)):
+        if package_name not in sys.modules:
+            package = types.ModuleType(package_name)
+            package.__path__ = [path]
+            sys.modules[package_name] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+class SimulatedConnection:
+    """Stands in for the BLE link: every send takes latency + size / rate."""
+
+    def __init__(self, rate: float, latency: float):
+        self.rate = rate
+        self.latency = latency
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def send(self, data, response: bool = False) -> bool:
+        await asyncio.sleep(self.latency + len(data) / self.rate)
+        return True
+
+
+def synthetic_records(kind: str, size: int, fps: float = 30.0, seconds: float = 10.0) -> list:
+    """Build (source, offset seconds, datagram) records of a DNRGB stream."""
+    capture = load_module("ledfx_capture")
+    rng = random.Random(0)
+    num_pixels = size * size
+    per_packet = 489
+    frame = bytearray(num_pixels * 3)
+    if kind == "static":
+        frame[:] = bytes(rng.getrandbits(8) for _ in range(len(frame)))
+
+    records = []
+    for index in range(int(fps * seconds)):
+        if kind == "noise":
+            frame[:] = rng.randbytes(len(frame))
+        elif kind == "sparkle":
+            frame[:] = bytes(len(frame))
+            for _ in range(max(1, num_pixels // 100)):
+                pixel = rng.randrange(num_pixels) * 3
+                frame[pixel:pixel + 3] = bytes(rng.getrandbits(8) for _ in range(3))
+        offset = index / fps
+        for start in range(0, num_pixels, per_packet):
+            chunk = frame[start * 3:(start + per_packet) * 3]
+            records.append(
+                (capture.CAPTURE_WLED, offset, bytes([4, 2, start >> 8, start & 0xFF]) + chunk)
+            )
+            offset += 0.0005
+    return records
+
+
+async def replay(records: list, size: int, speed: float, rate: float, latency: float) -> dict:
+    """Feed the records into a gateway and return its stats."""
+    gateway_module = load_module("ledfx_gateway")
+    capture = load_module("ledfx_capture")
+    gateway = gateway_module.LedFxGateway(
+        None,
+        host="127.0.0.1",
+        port=0,
+        screen_size=size,
+        ddp_port=None,
+        connection=SimulatedConnection(rate, latency),
+    )
+    gateway.set_max_fps(60)
+    handlers = {
+        capture.CAPTURE_WLED: gateway._on_data_received,
+        capture.CAPTURE_DDP: gateway._on_ddp_received,
+        capture.CAPTURE_E131: gateway._on_e131_received,
+        capture.CAPTURE_ARTNET: gateway._on_artnet_received,
+    }
+
+    await gateway.start()
+    started = time.monotonic()
+    for source, offset, data in records:
+        delay = started + offset / speed - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        handlers[source](data)
+    # let the last frame drain
+    await asyncio.sleep(latency + 0.2)
+    duration = time.monotonic() - started
+    stats = gateway.stats
+    await gateway.stop()
+    stats["duration"] = duration
+    return stats
+
+
+def report(name: str, stats: dict) -> None:
+    """Print one result row."""
+    sent = stats["frames_sent"]
+    offered = sent + stats["frames_skipped"]
+    encode = stats["latency_ms"].get("encode", {})
+    glass = stats["latency_ms"].get("glass", {})
+    print(
+        f"{name:>18} {sent / stats['duration']:>7.1f} "
+        f"{stats['frames_skipped'] / offered if offered else 0:>8.0%} "
+        f"{stats['frames_superseded']:>8} "
+        f"{encode.get('p50', 0):>8.1f} {encode.get('p95', 0):>8.1f} "
+        f"{stats['bytes_sent'] / sent if sent else 0:>9.0f} "
+        f"{stats['keyframes_sent']:>5}/{stats['delta_frames_sent']:<5} "
+        f"{glass.get('p50', 0):>8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("captures", nargs="*", help="capture files to replay")
+    parser.add_argument("--synthetic", nargs="*", choices=SYNTHETIC, help="synthetic streams to replay (default: all when no capture is given)")
+    parser.add_argument("--size", type=int, default=32, help="panel size")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor")
+    parser.add_argument("--rate", type=float, default=20000, help="simulated link throughput in bytes/s")
+    parser.add_argument("--latency", type=float, default=20, help="simulated per-send latency in ms")
+    parser.add_argument("--seconds", type=float, default=10, help="length of the synthetic streams")
+    parser.add_argument("--save-synthetic", metavar="DIR", help="write the synthetic streams as capture files")
+    args = parser.parse_args()
+
+    capture = load_module("ledfx_capture")
+    runs = [(os.path.basename(path), list(capture.read_capture(path))) for path in args.captures]
+    synthetic = args.synthetic if args.synthetic is not None else ([] if runs else list(SYNTHETIC))
+    for kind in synthetic:
+        records = synthetic_records(kind, args.size, seconds=args.seconds)
+        if args.save_synthetic:
+            os.makedirs(args.save_synthetic, exist_ok=True)
+            capture.write_capture(os.path.join(args.save_synthetic, f"{kind}_{args.size}.idmcap"), records)
+        runs.append((kind, records))
+
+    print(
+        f"{args.size}x{args.size}, speed x{args.speed}, link {args.rate:.0f} B/s + {args.latency:.0f} ms\n"
+        f"{'stream':>18} {'fps':>7} {'skipped':>8} {'supersed':>8} {'enc p50':>8} {'enc p95':>8} "
+        f"{'B/frame':>9} {'key/delta':>11} {'glass':>8}"
+    )
+    for name, records in runs:
+        stats = asyncio.run(replay(records, args.size, args.speed, args.rate, args.latency / 1000))
+        report(name, stats)
+
+
+if __name__ == "__main__":
+    main()
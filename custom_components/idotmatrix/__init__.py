@@ -8,6 +8,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, CONF_MAC
 from .client.connectionManager import ConnectionManager
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,12 +35,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     from .coordinator import IDotMatrixCoordinator
     coordinator = IDotMatrixCoordinator(hass, entry)
     await coordinator.async_load_settings()
+    await coordinator.async_load_font_catalog()
+    await coordinator.async_load_scenes()
     await coordinator.async_config_entry_first_refresh()
     
     # Store coordinator instance
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await async_setup_services(hass)
     
     # Restore LedFx gateway state after platforms are set up
     await coordinator.async_restore_ledfx_state()
@@ -52,8 +56,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = hass.data[DOMAIN].get(entry.entry_id)
     if coordinator and hasattr(coordinator, 'async_stop_ledfx_gateway'):
         await coordinator.async_stop_ledfx_gateway()
+    if coordinator:
+        await coordinator.async_cancel_device_update()
+        await coordinator.async_stop_fun_text()
+        await coordinator.async_stop_playlist()
+        await coordinator.async_flush_settings()
     
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_unload_services(hass)
 
     return unload_ok
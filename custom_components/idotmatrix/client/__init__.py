@@ -6,21 +6,26 @@ Library to configure any iDotMatrix compatible 16x16 or 32x32 pixel display with
 
 from .version import __version__
 from . import logger
-from .connectionManager import ConnectionManager
-from .modules.clock import Clock
-from .modules.chronograph import Chronograph
-from .modules.common import Common
-from .modules.countdown import Countdown
-from .modules.eco import Eco
-from .modules.fullscreenColor import FullscreenColor
-from .modules.gif import Gif
-from .modules.graffiti import Graffiti
-from .modules.image import Image
-from .modules.musicSync import MusicSync
-from .modules.scoreboard import Scoreboard
-from .modules.system import System
-from .modules.text import Text
-from .modules.effect import Effect
+from . import modules
+
+# Classes are imported on first attribute access (PEP 562), so importing the
+# package does not pull in Pillow or cryptography before a feature needs them.
+# The module classes come from the lazy loader of the modules package.
+
+
+def __getattr__(name: str):
+    if name == "ConnectionManager":
+        from .connectionManager import ConnectionManager as value
+    elif name in modules._LAZY_ATTRIBUTES:
+        value = getattr(modules, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __author__ = "Kalle Minkner, Jon-Mailes Graeffe"
@@ -35,9 +40,12 @@ __all__ = [
     "Countdown",
     "Eco",
     "FullscreenColor",
+    "FontCatalog",
+    "FrameDelta",
     "Gif",
     "Graffiti",
     "Image",
+    "MediaLibrary",
     "MusicSync",
     "Scoreboard",
     "System",
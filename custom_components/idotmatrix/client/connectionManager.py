@@ -3,7 +3,7 @@ from bleak import BleakClient, BleakScanner, AdvertisementData
 from .const import UUID_READ_DATA, UUID_WRITE_DATA, BLUETOOTH_DEVICE_NAME
 import logging
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class SingletonMeta(type):
@@ -23,12 +23,37 @@ class SingletonMeta(type):
 
 class ConnectionManager(metaclass=SingletonMeta):
     logging = logging.getLogger(__name__)
+    _byAddress: Dict[str, "ConnectionManager"] = {}
 
     def __init__(self) -> None:
         self.address: Optional[str] = None
         self.client: Optional[BleakClient] = None
         self.hass = None
 
+    @classmethod
+    def forAddress(cls, address: str) -> "ConnectionManager":
+        """Returns a connection of its own for a device address, e.g. one panel of a tiled wall.
+
+        The singleton is returned for its own address, so a device never has two connections.
+
+        Args:
+            address (str): bluetooth address of the device
+
+        Returns:
+            ConnectionManager: connection for the address, created on first use
+        """
+        primary = cls()
+        if primary and primary.address and primary.address.upper() == address.upper():
+            return primary
+        key = address.upper()
+        if key not in cls._byAddress:
+            # bypass SingletonMeta for a separate instance
+            connection = type.__call__(cls)
+            connection.address = address
+            connection.hass = primary.hass if primary else None
+            cls._byAddress[key] = connection
+        return cls._byAddress[key]
+
     def set_hass(self, hass):
         """Set Home Assistant instance for proxy support."""
         self.hass = hass
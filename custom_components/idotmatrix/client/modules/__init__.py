@@ -1,14 +1,36 @@
-from .clock import Clock
-from .chronograph import Chronograph
-from .common import Common
-from .countdown import Countdown
-from .eco import Eco
-from .fullscreenColor import FullscreenColor
-from .gif import Gif
-from .graffiti import Graffiti
-from .image import Image
-from .musicSync import MusicSync
-from .scoreboard import Scoreboard
-from .system import System
-from .text import Text
-from .effect import Effect
\ No newline at end of file
+from importlib import import_module
+
+# Modules are imported on first attribute access (PEP 562), so importing the
+# package does not pull in Pillow or cryptography before a feature needs them.
+# The client package re-exports these names through this loader.
+_LAZY_ATTRIBUTES = {
+    "Clock": ".clock",
+    "Chronograph": ".chronograph",
+    "Common": ".common",
+    "Countdown": ".countdown",
+    "Eco": ".eco",
+    "FullscreenColor": ".fullscreenColor",
+    "FontCatalog": ".fontCatalog",
+    "FrameDelta": ".frameDelta",
+    "Gif": ".gif",
+    "Graffiti": ".graffiti",
+    "Image": ".image",
+    "MediaLibrary": ".mediaLibrary",
+    "MusicSync": ".musicSync",
+    "Scoreboard": ".scoreboard",
+    "System": ".system",
+    "Text": ".text",
+    "Effect": ".effect",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
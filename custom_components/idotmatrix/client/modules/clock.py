@@ -41,6 +41,41 @@ class Clock:
             self.logging.error(f"Could not set the time indicator: {error}")
             return False
 
+    def buildMode(
+        self,
+        style: int,
+        visibleDate: bool = True,
+        hour24: bool = True,
+        r: int = 255,
+        g: int = 255,
+        b: int = 255,
+    ) -> bytearray:
+        """Builds the clock mode command without validating or sending it, e.g. for a scene.
+
+        Args:
+            style (int): Style of the clock.
+            visibleDate (bool): Whether the date should be shown or not. Defaults to True.
+            hour24 (bool): 12 or 24 hour format. Defaults to True.
+            r (int, optional): Color red. Defaults to 255.
+            g (int, optional): Color green. Defaults to 255.
+            b (int, optional): Color blue. Defaults to 255.
+
+        Returns:
+            bytearray: the command
+        """
+        return bytearray(
+            [
+                8,
+                0,
+                6,
+                1,
+                (style | (128 if visibleDate else 0)) | (64 if hour24 else 0),
+                r % 256,
+                g % 256,
+                b % 256,
+            ]
+        )
+
     async def setMode(
         self,
         style: int,
@@ -84,18 +119,7 @@ class Clock:
                     "Clock.setMode expects parameter b to be between 0 and 255"
                 )
                 return False
-            data: bytearray = bytearray(
-                [
-                    8,
-                    0,
-                    6,
-                    1,
-                    (style | (128 if visibleDate else 0)) | (64 if hour24 else 0),
-                    r % 256,
-                    g % 256,
-                    b % 256,
-                ]
-            )
+            data = self.buildMode(style, visibleDate, hour24, r, g, b)
             if self.conn:
                 await self.conn.connect()
                 await self.conn.send(data=data)
@@ -100,6 +100,25 @@ class Common:
             self.logging.error(f"Could not rotate the screen of the device: {error}")
             return False
 
+    def buildBrightness(self, brightness_percent: int) -> bytearray:
+        """Builds the brightness command without validating or sending it, e.g. for a scene.
+
+        Args:
+            brightness_percent (int): brightness in percent (5-100).
+
+        Returns:
+            bytearray: the command
+        """
+        return bytearray(
+            [
+                5,
+                0,
+                4,
+                128,
+                brightness_percent,
+            ]
+        )
+
     async def setBrightness(self, brightness_percent: int) -> Union[bool, bytearray]:
         """Set screen brightness. Range 5-100 (%).
 
@@ -115,15 +134,7 @@ class Common:
                     "Common.setBrightness parameter brightness_percent is not in range between 5 and 100"
                 )
                 return False
-            data = bytearray(
-                [
-                    5,
-                    0,
-                    4,
-                    128,
-                    brightness_percent,
-                ]
-            )
+            data = self.buildBrightness(brightness_percent)
             if self.conn:
                 await self.conn.connect()
                 await self.conn.send(data=data)
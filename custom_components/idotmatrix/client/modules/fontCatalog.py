@@ -0,0 +1,370 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+import json
+import logging
+import os
+import struct
+import threading
+
+from .glyphAtlas import GlyphAtlas, atlasSource, compileFont
+
+
+FONT_EXTENSIONS = (".otf", ".ttf", ".bdf")
+# using open source font from https://www.fontspace.com/rain-font-f22577
+DEFAULT_FONT = "Rain-DRM3.otf"
+INDEX_VERSION = 1
+
+
+def _mergeRanges(codepoints: List[int]) -> List[List[int]]:
+    """Collapses code points into sorted inclusive [first, last] ranges."""
+    ranges: List[List[int]] = []
+    for codepoint in sorted(set(codepoints)):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ranges
+
+
+def parseBdf(file_path: str) -> dict:
+    """Reads the metrics and glyph coverage of a BDF bitmap font.
+
+    Args:
+        file_path (str): path to the font file
+
+    Returns:
+        dict: family, native pixel size, ascent and descent in pixels, cell size and coverage ranges
+    """
+    properties: Dict[str, str] = {}
+    bounding_box: List[int] = []
+    codepoints = []
+    with open(file_path, "r", encoding="latin-1") as file:
+        for line in file:
+            key, _, value = line.strip().partition(" ")
+            if key == "ENCODING":
+                codepoint = int(value.split()[0])
+                if codepoint >= 0:
+                    codepoints.append(codepoint)
+            elif key == "FONTBOUNDINGBOX":
+                bounding_box = [int(field) for field in value.split()]
+            elif key in ("FAMILY_NAME", "PIXEL_SIZE", "FONT_ASCENT", "FONT_DESCENT"):
+                properties[key] = value.strip().strip('"')
+    if len(bounding_box) != 4:
+        raise ValueError("missing FONTBOUNDINGBOX")
+
+    width, height, _, offset_y = bounding_box
+    ascent = int(properties.get("FONT_ASCENT", height + offset_y))
+    descent = int(properties.get("FONT_DESCENT", -offset_y))
+    return {
+        "format": "bdf",
+        "family": properties.get("FAMILY_NAME") or os.path.splitext(os.path.basename(file_path))[0],
+        "pixel_size": int(properties.get("PIXEL_SIZE", ascent + descent)),
+        "ascent": ascent,
+        "descent": descent,
+        "cell": [width, height],
+        "coverage": _mergeRanges(codepoints),
+    }
+
+
+def _sfntName(data: bytes, offset: int) -> Optional[str]:
+    """Returns the typographic family name of a name table, else the family name."""
+    _, count, strings = struct.unpack_from(">HHH", data, offset)
+    names: Dict[Tuple[int, int], str] = {}
+    for index in range(count):
+        platform, _, _, name_id, length, start = struct.unpack_from(
+            ">HHHHHH", data, offset + 6 + index * 12
+        )
+        if name_id not in (1, 16) or platform not in (0, 1, 3):
+            continue
+        raw = data[offset + strings + start:offset + strings + start + length]
+        value = raw.decode("latin-1") if platform == 1 else raw.decode("utf-16-be", "replace")
+        # Windows names win over the older Macintosh ones
+        names.setdefault((name_id, platform == 1), value)
+    for key in ((16, False), (1, False), (16, True), (1, True)):
+        if names.get(key):
+            return names[key]
+    return None
+
+
+def _sfntCoverage(data: bytes, offset: int) -> List[List[int]]:
+    """Returns the code point ranges mapped to a glyph by a cmap table."""
+    _, count = struct.unpack_from(">HH", data, offset)
+    subtables = {}
+    for index in range(count):
+        platform, encoding, start = struct.unpack_from(">HHI", data, offset + 4 + index * 8)
+        subtables[(platform, encoding)] = offset + start
+
+    # Full Unicode (format 12) first, then the BMP (format 4)
+    for key in ((3, 10), (0, 4), (0, 6), (3, 1), (0, 3), (0, 1), (0, 0)):
+        table = subtables.get(key)
+        if table is None:
+            continue
+        table_format = struct.unpack_from(">H", data, table)[0]
+        if table_format == 12:
+            groups = struct.unpack_from(">I", data, table + 12)[0]
+            ranges = []
+            for index in range(groups):
+                first, last, glyph = struct.unpack_from(">III", data, table + 16 + index * 12)
+                if glyph == 0:
+                    first += 1
+                if first <= last:
+                    ranges.append([first, last])
+            merged: List[List[int]] = []
+            for first, last in sorted(ranges):
+                if merged and first <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], last)
+                else:
+                    merged.append([first, last])
+            return merged
+        if table_format == 4:
+            segments = struct.unpack_from(">H", data, table + 6)[0] // 2
+            ends = table + 14
+            starts = ends + segments * 2 + 2
+            deltas = starts + segments * 2
+            range_offsets = deltas + segments * 2
+            codepoints = []
+            for segment in range(segments):
+                last = struct.unpack_from(">H", data, ends + segment * 2)[0]
+                first = struct.unpack_from(">H", data, starts + segment * 2)[0]
+                delta = struct.unpack_from(">h", data, deltas + segment * 2)[0]
+                range_offset = struct.unpack_from(">H", data, range_offsets + segment * 2)[0]
+                for codepoint in range(first, min(last, 0xFFFE) + 1):
+                    if range_offset == 0:
+                        glyph = (codepoint + delta) & 0xFFFF
+                    else:
+                        position = range_offsets + segment * 2 + range_offset + (codepoint - first) * 2
+                        glyph = struct.unpack_from(">H", data, position)[0] if position + 2 <= len(data) else 0
+                        if glyph:
+                            glyph = (glyph + delta) & 0xFFFF
+                    if glyph:
+                        codepoints.append(codepoint)
+            return _mergeRanges(codepoints)
+    return []
+
+
+def parseSfnt(file_path: str) -> dict:
+    """Reads the metrics and glyph coverage of a TrueType or OpenType font.
+
+    Args:
+        file_path (str): path to the font file
+
+    Returns:
+        dict: family, ascent and descent as fractions of the font size, cell size in em and coverage ranges
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    tag, count = struct.unpack_from(">4sH", data, 0)
+    if tag not in (b"\x00\x01\x00\x00", b"OTTO", b"true"):
+        raise ValueError("not a TrueType or OpenType font")
+    tables = {}
+    for index in range(count):
+        name, _, offset, _ = struct.unpack_from(">4sIII", data, 12 + index * 16)
+        tables[name] = offset
+    for required in (b"head", b"hhea", b"cmap"):
+        if required not in tables:
+            raise ValueError(f"missing {required.decode()} table")
+
+    units_per_em = struct.unpack_from(">H", data, tables[b"head"] + 18)[0] or 1000
+    ascender, descender, _, advance_max = struct.unpack_from(">hhhH", data, tables[b"hhea"] + 4)
+    family = _sfntName(data, tables[b"name"]) if b"name" in tables else None
+    return {
+        "format": "opentype" if tag == b"OTTO" else "truetype",
+        "family": family or os.path.splitext(os.path.basename(file_path))[0],
+        "pixel_size": None,
+        "ascent": round(ascender / units_per_em, 4),
+        "descent": round(-descender / units_per_em, 4),
+        "cell": [round(advance_max / units_per_em, 4), round((ascender - descender) / units_per_em, 4)],
+        "coverage": _sfntCoverage(data, tables[b"cmap"]),
+    }
+
+
+class FontCatalog:
+    """Index of the fonts in a folder with their metrics and glyph coverage.
+
+    The index is kept as JSON next to the other integration data and a font is
+    only parsed again when its size or mtime changed. Bitmap fonts report their
+    native pixel size and metrics in pixels, scalable fonts report None and
+    metrics as fractions of the requested size.
+
+    The glyph atlases of bitmap fonts are compiled into a folder named after
+    the index when indexing.
+    """
+
+    logging = logging.getLogger(__name__)
+
+    def __init__(self, fonts_dir: str, index_path: str, atlas_dir: Optional[str] = None) -> None:
+        self.fonts_dir = fonts_dir
+        self.index_path = index_path
+        self.atlas_dir = atlas_dir or os.path.splitext(index_path)[0]
+        self._lock = threading.Lock()
+        self._fonts: Dict[str, dict] = {}
+        self._starts: Dict[str, List[int]] = {}
+        self._atlases: Dict[str, Optional[GlyphAtlas]] = {}
+        self.loaded = False
+
+    def _loadIndex(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_path, "r") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != INDEX_VERSION or index.get("fonts_dir") != self.fonts_dir:
+            return {}
+        return index.get("fonts", {})
+
+    def _saveIndex(self) -> None:
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        with open(f"{self.index_path}.tmp", "w") as file:
+            json.dump({"version": INDEX_VERSION, "fonts_dir": self.fonts_dir, "fonts": self._fonts}, file)
+        os.replace(f"{self.index_path}.tmp", self.index_path)
+
+    def build(self) -> Dict[str, object]:
+        """Indexes every font of the folder, reusing the entries of unchanged files. Blocking.
+
+        Returns:
+            Dict[str, object]: amount of total, parsed and unchanged fonts and the failed file names
+        """
+        with self._lock:
+            index = self._loadIndex()
+            fonts: Dict[str, dict] = {}
+            parsed = 0
+            failed = []
+            names = os.listdir(self.fonts_dir) if os.path.isdir(self.fonts_dir) else []
+            for name in sorted(names):
+                if not name.lower().endswith(FONT_EXTENSIONS):
+                    continue
+                file_path = os.path.join(self.fonts_dir, name)
+                stat = os.stat(file_path)
+                entry = index.get(name)
+                if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                    fonts[name] = entry
+                    continue
+                try:
+                    entry = parseBdf(file_path) if name.lower().endswith(".bdf") else parseSfnt(file_path)
+                except (OSError, ValueError, struct.error) as error:
+                    self.logging.warning(f"could not index font {name}: {error}")
+                    failed.append(name)
+                    continue
+                entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                fonts[name] = entry
+                parsed += 1
+
+            self._fonts = fonts
+            self._starts = {
+                name: [first for first, _ in entry["coverage"]] for name, entry in fonts.items()
+            }
+            if parsed or set(index) != set(fonts):
+                self._saveIndex()
+            self._atlases = {}
+            for name, entry in fonts.items():
+                if entry["pixel_size"]:
+                    self._openAtlas(name)
+            # forget the atlases of removed fonts and of older scalable renders
+            current = {f"{name}.{entry['pixel_size']}.atlas" for name, entry in fonts.items() if entry["pixel_size"]}
+            if os.path.isdir(self.atlas_dir):
+                for file_name in os.listdir(self.atlas_dir):
+                    if file_name.endswith(".atlas") and file_name not in current:
+                        os.remove(os.path.join(self.atlas_dir, file_name))
+            self.loaded = True
+            self.logging.info(f"indexed {len(fonts)} fonts ({parsed} parsed, {len(failed)} failed)")
+            return {
+                "total": len(fonts),
+                "parsed": parsed,
+                "unchanged": len(fonts) - parsed,
+                "failed": failed,
+            }
+
+    def _openAtlas(self, name: str) -> Optional[GlyphAtlas]:
+        if name not in self._atlases:
+            entry = self._fonts[name]
+            atlas_path = os.path.join(self.atlas_dir, f"{name}.{entry['pixel_size']}.atlas")
+            try:
+                if atlasSource(atlas_path) != (entry["mtime_ns"], entry["size"]):
+                    compileFont(os.path.join(self.fonts_dir, name), atlas_path)
+                    self.logging.debug(f"compiled glyph atlas {atlas_path}")
+                self._atlases[name] = GlyphAtlas(atlas_path)
+            except (ImportError, OSError, ValueError, struct.error) as error:
+                self.logging.warning(f"could not compile the glyph atlas of {name}: {error}")
+                self._atlases[name] = None
+        return self._atlases[name]
+
+    def atlas(self, name: Optional[str]) -> Optional[GlyphAtlas]:
+        """Returns the memory-mapped glyph atlas of a bitmap font, compiling it first if needed. Blocking.
+
+        Args:
+            name (Optional[str]): font file name, unknown names use the default font
+
+        Returns:
+            Optional[GlyphAtlas]: the atlas, None for scalable fonts or if the font is not indexed or could not be compiled
+        """
+        resolved = self.resolve(name)
+        if resolved is None or (name and os.path.isabs(name)) or not self._fonts[resolved]["pixel_size"]:
+            return None
+        with self._lock:
+            return self._openAtlas(resolved)
+
+    def names(self) -> List[str]:
+        """Returns the sorted file names of the indexed fonts."""
+        return sorted(self._fonts)
+
+    def get(self, name: Optional[str]) -> Optional[dict]:
+        """Returns the index entry of a font file name, None if it is not indexed."""
+        return self._fonts.get(name) if name else None
+
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        """Returns the indexed font used for a name, the default font for unknown names."""
+        for candidate in (name, DEFAULT_FONT):
+            if candidate in self._fonts:
+                return candidate
+        return None
+
+    def path(self, name: Optional[str]) -> Optional[str]:
+        """Resolves a font name to an absolute path without touching the disk.
+
+        Args:
+            name (Optional[str]): font file name, absolute paths are returned as they are
+
+        Returns:
+            Optional[str]: path of the font, the default font for unknown names, None if that is missing as well
+        """
+        if name and os.path.isabs(name):
+            return name
+        resolved = self.resolve(name)
+        return os.path.join(self.fonts_dir, resolved) if resolved else None
+
+    def covers(self, name: Optional[str], text: str) -> bool:
+        """Checks whether a font has a glyph for every non-space character of a text."""
+        entry = self.get(name)
+        if entry is None:
+            return False
+        starts = self._starts[name]
+        coverage = entry["coverage"]
+        for char in set(text):
+            if char.isspace():
+                continue
+            position = bisect_right(starts, ord(char)) - 1
+            if position < 0 or ord(char) > coverage[position][1]:
+                return False
+        return True
+
+    def fallback(self, name: Optional[str], text: str) -> Optional[str]:
+        """Returns the font to render a text with, one that has all of its glyphs if possible.
+
+        Args:
+            name (Optional[str]): indexed font file name
+            text (str): text to render
+
+        Returns:
+            Optional[str]: name when it covers the text, else the default font or the first
+            covering font of the same kind (bitmap or scalable), name again if none does
+        """
+        if self.covers(name, text):
+            return name
+        entry = self.get(name)
+        bitmap = bool(entry and entry["pixel_size"])
+        others = sorted(self.names(), key=lambda other: bool(self._fonts[other]["pixel_size"]) != bitmap)
+        for candidate in [DEFAULT_FONT] + others:
+            if candidate != name and self.covers(candidate, text):
+                self.logging.debug(f"{name} lacks glyphs of {text!r}, using {candidate}")
+                return candidate
+        return name
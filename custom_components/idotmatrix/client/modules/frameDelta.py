@@ -0,0 +1,141 @@
+from typing import List, Optional, Tuple
+import io
+import logging
+from PIL import Image as PilImage, ImageChops
+
+from .graffiti import Graffiti
+from .image import Image
+
+
+# bytes of one Graffiti.setPixel command
+PIXEL_COMMAND_SIZE = 10
+# DIY mode that enters drawing and keeps the shown image
+DRAW_MODE = 3
+
+
+class FrameDelta:
+    """Encodes a stream of RGB frames as either pixel deltas or full PNG frames.
+
+    Per frame the byte cost of both strategies is estimated: a burst of Graffiti
+    setPixel commands costs 10 bytes per changed pixel, a full frame costs about
+    as much as the last PNG payload. The cheaper one is used. Every
+    keyframe_interval frames a full PNG frame is forced to recover from drift
+    (e.g. a lost pixel command).
+
+    The first delta after every keyframe starts with the DIY mode command that
+    enters drawing without clearing the display (mode 3), so the pixel commands
+    draw over the keyframe.
+    """
+
+    logging = logging.getLogger(__name__)
+
+    def __init__(self, width: int, height: int, keyframe_interval: int = 60) -> None:
+        self.width = width
+        self.height = height
+        self.keyframe_interval = keyframe_interval
+        self._reference: Optional[bytes] = None
+        self._frames_since_keyframe = 0
+        # pixel commands are only sent after the draw mode command
+        self._draw_mode = False
+        # running estimate of the PNG payload size, seeded with the raw frame size
+        self._png_estimate = float(width * height * 3)
+
+    def reset(self) -> None:
+        """Forgets the device state, the next frame will be a keyframe."""
+        self._reference = None
+        self._draw_mode = False
+
+    def _countChanged(self, frame: bytes, reference: bytes) -> Tuple[int, Optional[tuple]]:
+        """Counts changed pixels and returns the bounding box of the changes.
+
+        Args:
+            frame (bytes): new RGB frame
+            reference (bytes): RGB frame currently shown by the device
+
+        Returns:
+            Tuple[int, Optional[tuple]]: number of changed pixels and their bounding box
+        """
+        size = (self.width, self.height)
+        diff = ImageChops.difference(
+            PilImage.frombytes("RGB", size, frame),
+            PilImage.frombytes("RGB", size, reference),
+        )
+        r, g, b = diff.split()
+        changed = ImageChops.lighter(ImageChops.lighter(r, g), b)
+        return self.width * self.height - changed.histogram()[0], changed.getbbox()
+
+    def _changedPixels(
+        self, frame: bytes, reference: bytes, bbox: tuple
+    ) -> List[Tuple[int, int, int, int, int]]:
+        """Lists the changed pixels inside a bounding box.
+
+        Args:
+            frame (bytes): new RGB frame
+            reference (bytes): RGB frame currently shown by the device
+            bbox (tuple): (left, upper, right, lower) of the changes
+
+        Returns:
+            List[Tuple[int, int, int, int, int]]: (r, g, b, x, y) of every changed pixel
+        """
+        left, upper, right, lower = bbox
+        row_bytes = self.width * 3
+        pixels = []
+        for y in range(upper, lower):
+            start = y * row_bytes + left * 3
+            end = y * row_bytes + right * 3
+            # rows without changes are skipped with one slice compare
+            if frame[start:end] == reference[start:end]:
+                continue
+            for offset in range(start, end, 3):
+                if frame[offset:offset + 3] != reference[offset:offset + 3]:
+                    pixels.append(
+                        (
+                            frame[offset],
+                            frame[offset + 1],
+                            frame[offset + 2],
+                            (offset - y * row_bytes) // 3,
+                            y,
+                        )
+                    )
+        return pixels
+
+    def _encodeKeyframe(self, frame: bytes) -> bytearray:
+        """Encodes a full frame as DIY image payload.
+
+        Args:
+            frame (bytes): RGB frame
+
+        Returns:
+            bytearray: payload for Image upload
+        """
+        image = PilImage.frombytes("RGB", (self.width, self.height), frame)
+        png_buffer = io.BytesIO()
+        image.save(png_buffer, format="PNG", optimize=True, compress_level=1)
+        payload = Image()._createPayloads(png_buffer.getvalue())
+        self._png_estimate = 0.7 * self._png_estimate + 0.3 * len(payload)
+        return payload
+
+    def encode(self, frame: bytes) -> Tuple[str, bytearray]:
+        """Encodes the next frame with the cheaper strategy.
+
+        The frame becomes the new reference, so the returned payload must be sent.
+
+        Args:
+            frame (bytes): RGB frame of width * height * 3 bytes
+
+        Returns:
+            Tuple[str, bytearray]: "keyframe" or "delta" and the payload to send
+        """
+        reference = self._reference
+        self._reference = frame
+        self._frames_since_keyframe += 1
+        if reference is not None and self._frames_since_keyframe < self.keyframe_interval:
+            mode = bytearray() if self._draw_mode else Image().buildMode(DRAW_MODE)
+            changed, bbox = self._countChanged(frame, reference)
+            if changed * PIXEL_COMMAND_SIZE + len(mode) < self._png_estimate:
+                pixels = self._changedPixels(frame, reference, bbox) if bbox else []
+                self._draw_mode = True
+                return "delta", mode + Graffiti()._createPixelsPayload(pixels)
+        self._frames_since_keyframe = 0
+        self._draw_mode = False
+        return "keyframe", self._encodeKeyframe(frame)
@@ -1,11 +1,15 @@
-from typing import Union, List
+from typing import Union, List, Optional, Tuple
 from ..connectionManager import ConnectionManager
 import io
 import logging
-from PIL import Image as PilImage
+from PIL import Image as PilImage, ImageChops
 import zlib
 
 
+# palette sizes tried (largest first) when fitting a gif into a byte budget
+PALETTE_STEPS = (256, 128, 64, 32, 16, 8)
+
+
 class Gif:
     logging = logging.getLogger(__name__)
 
@@ -112,49 +116,281 @@ class Gif:
             self.logging.error(f"could not upload gif unprocessed: {error}")
             return False
 
+    def _readFrames(
+        self, img: PilImage.Image, pixel_size: int
+    ) -> Tuple[List[PilImage.Image], List[int]]:
+        """Reads all frames of an animation, scaled to the panel size.
+
+        Args:
+            img (PilImage.Image): opened animation
+            pixel_size (int): amount of pixels of the panel
+
+        Returns:
+            Tuple[List[PilImage.Image], List[int]]: RGB frames and their durations in ms
+        """
+        frames = []
+        durations = []
+        default_duration = img.info.get("duration", 100)
+        try:
+            while True:
+                frame = img.convert("RGBA")
+                if frame.size != (pixel_size, pixel_size):
+                    frame = frame.resize((pixel_size, pixel_size), PilImage.NEAREST)
+                # flatten transparent areas onto black, which is what the panel shows
+                background = PilImage.new("RGB", frame.size, (0, 0, 0))
+                background.paste(frame, mask=frame.getchannel("A"))
+                frames.append(background)
+                durations.append(img.info.get("duration", default_duration) or default_duration)
+                img.seek(img.tell() + 1)
+        except EOFError:
+            pass
+        return frames, durations
+
+    def _mergeIdenticalFrames(
+        self, frames: List[PilImage.Image], durations: List[int]
+    ) -> Tuple[List[PilImage.Image], List[int]]:
+        """Drops consecutive identical frames, adding their duration to the frame they repeat.
+
+        Args:
+            frames (List[PilImage.Image]): RGB frames
+            durations (List[int]): duration of every frame in ms
+
+        Returns:
+            Tuple[List[PilImage.Image], List[int]]: remaining frames and their merged durations
+        """
+        merged_frames = [frames[0]]
+        merged_durations = [durations[0]]
+        previous = frames[0].tobytes()
+        for frame, duration in zip(frames[1:], durations[1:]):
+            current = frame.tobytes()
+            if current == previous:
+                merged_durations[-1] += duration
+                continue
+            merged_frames.append(frame)
+            merged_durations.append(duration)
+            previous = current
+        return merged_frames, merged_durations
+
+    def _decimateFrames(
+        self, frames: List[PilImage.Image], durations: List[int]
+    ) -> Tuple[List[PilImage.Image], List[int]]:
+        """Drops every second frame while keeping the total animation time.
+
+        Args:
+            frames (List[PilImage.Image]): RGB frames
+            durations (List[int]): duration of every frame in ms
+
+        Returns:
+            Tuple[List[PilImage.Image], List[int]]: remaining frames and their durations
+        """
+        kept_frames = frames[::2]
+        kept_durations = [
+            sum(durations[i : i + 2]) for i in range(0, len(durations), 2)
+        ]
+        return kept_frames, kept_durations
+
+    def _encodeOptimized(
+        self, frames: List[PilImage.Image], durations: List[int], colors: int = 256
+    ) -> bytes:
+        """Encodes frames as gif with a shared global palette and transparent deltas.
+
+        Every frame after the first only keeps the pixels that changed compared to
+        its predecessor, all others are set to the transparent palette index. With
+        disposal 1 the device keeps the previous frame underneath, and the encoder
+        crops every frame to the bounding box of its changes.
+
+        Args:
+            frames (List[PilImage.Image]): RGB frames (already deduplicated)
+            durations (List[int]): duration of every frame in ms
+            colors (int): size of the global palette (including the transparent index)
+
+        Returns:
+            bytes: the encoded gif
+        """
+        width, height = frames[0].size
+        # one palette for the whole animation: quantize all frames stacked together
+        strip = PilImage.new("RGB", (width, height * len(frames)))
+        for i, frame in enumerate(frames):
+            strip.paste(frame, (0, i * height))
+        palette_image = strip.quantize(colors=max(2, colors - 1))
+        indexed = [frame.quantize(palette=palette_image, dither=0) for frame in frames]
+
+        # first palette index that no frame uses becomes the transparent one
+        transparency = max(frame.getextrema()[1] for frame in indexed) + 1
+        if transparency < 256:
+            palette = palette_image.getpalette()[: 3 * transparency] + [0, 0, 0]
+            for frame in indexed:
+                frame.putpalette(palette)
+            output = [indexed[0]]
+            for previous, frame in zip(indexed, indexed[1:]):
+                delta = ImageChops.difference(
+                    PilImage.frombytes("L", frame.size, previous.tobytes()),
+                    PilImage.frombytes("L", frame.size, frame.tobytes()),
+                )
+                unchanged = delta.point(lambda value: 255 if value == 0 else 0)
+                frame = frame.copy()
+                frame.paste(transparency, mask=unchanged)
+                output.append(frame)
+            extra = {"transparency": transparency}
+        else:
+            output = indexed
+            extra = {}
+
+        gif_buffer = io.BytesIO()
+        output[0].save(
+            gif_buffer,
+            format="GIF",
+            save_all=True,
+            append_images=output[1:],
+            loop=1,
+            duration=durations if len(durations) > 1 else durations[0],
+            disposal=1,
+            optimize=False,
+            **extra,
+        )
+        return gif_buffer.getvalue()
+
+    def _optimize(
+        self,
+        frames: List[PilImage.Image],
+        durations: List[int],
+        max_bytes: Optional[int] = None,
+    ) -> bytes:
+        """Runs the size optimizer over an animation.
+
+        Identical frames are merged first. Without a budget the full palette is used,
+        otherwise the palette shrinks step by step and, if that is not enough, every
+        second frame is dropped until the gif fits into max_bytes.
+
+        Args:
+            frames (List[PilImage.Image]): RGB frames
+            durations (List[int]): duration of every frame in ms
+            max_bytes (Optional[int]): byte budget of the encoded gif. Defaults to None.
+
+        Returns:
+            bytes: the smallest encoding found that fits the budget (or the smallest at all)
+        """
+        frames, durations = self._mergeIdenticalFrames(frames, durations)
+        if not max_bytes:
+            return self._encodeOptimized(frames, durations)
+        best = None
+        while True:
+            for colors in PALETTE_STEPS:
+                gif_data = self._encodeOptimized(frames, durations, colors)
+                if best is None or len(gif_data) < len(best):
+                    best = gif_data
+                if len(gif_data) <= max_bytes:
+                    return gif_data
+            if len(frames) <= 2:
+                self.logging.warning(
+                    f"gif does not fit into {max_bytes} bytes, using {len(best)} bytes"
+                )
+                return best
+            frames, durations = self._decimateFrames(frames, durations)
+
+    def processFile(
+        self,
+        file_path: str,
+        pixel_size: int = 32,
+        optimize: bool = True,
+        max_bytes: Optional[int] = None,
+    ) -> bytes:
+        """Resizes and re-encodes a gif for the device without uploading it.
+
+        Args:
+            file_path (str): path to the image file
+            pixel_size (int, optional): amount of pixels (either 16 or 32 makes sense). Defaults to 32.
+            optimize (bool, optional): merge identical frames, crop deltas and use a global palette. Defaults to True.
+            max_bytes (Optional[int], optional): byte budget of the encoded gif, only used when optimizing. Defaults to None.
+
+        Returns:
+            bytes: the encoded gif
+        """
+        with PilImage.open(file_path) as img:
+            if optimize:
+                frames, durations = self._readFrames(img, pixel_size)
+                return self._optimize(frames, durations, max_bytes)
+            frames = []
+            try:
+                while True:
+                    frame = img.copy()
+                    if frame.size != (pixel_size, pixel_size):
+                        frame = frame.resize(
+                            (pixel_size, pixel_size), PilImage.NEAREST
+                        )
+                    frames.append(frame.copy())
+                    img.seek(img.tell() + 1)
+            except EOFError:
+                pass
+            gif_buffer = io.BytesIO()
+            frames[0].save(
+                gif_buffer,
+                format="GIF",
+                save_all=True,
+                append_images=frames[1:],
+                loop=1,
+                duration=img.info["duration"],
+                disposal=2,
+            )
+            return gif_buffer.getvalue()
+
+    def buildPayloads(self, gif_data: bytes) -> List[bytearray]:
+        """Builds the upload chunks of an already processed gif without sending them.
+
+        Args:
+            gif_data (bytes): data of the gif file
+
+        Returns:
+            List[bytearray]: the chunks, each one sent with response=True
+        """
+        return self._createPayloads(gif_data)
+
+    async def uploadEncoded(self, gif_data: bytes) -> Union[bool, bytearray]:
+        """uploads an already processed gif, e.g. from the media library cache.
+
+        Args:
+            gif_data (bytes): data of the gif file
+
+        Returns:
+            Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
+        """
+        try:
+            data = self._createPayloads(gif_data)
+            if self.conn:
+                await self.conn.connect()
+                for chunk in data:
+                    await self.conn.send(data=chunk, response=True)
+            return data
+        except BaseException as error:
+            self.logging.error(f"could not upload encoded gif: {error}")
+            return False
+
     async def uploadProcessed(
-        self, file_path: str, pixel_size: int = 32
+        self,
+        file_path: str,
+        pixel_size: int = 32,
+        optimize: bool = True,
+        max_bytes: Optional[int] = None,
     ) -> Union[bool, bytearray]:
         """uploads a file processed to make sure everything is correct before uploading to the device.
 
         Args:
             file_path (str): path to the image file
             pixel_size (int, optional): amount of pixels (either 16 or 32 makes sense). Defaults to 32.
+            optimize (bool, optional): merge identical frames, crop deltas and use a global palette. Defaults to True.
+            max_bytes (Optional[int], optional): byte budget of the encoded gif, only used when optimizing. Defaults to None.
 
         Returns:
             Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
         """
         try:
-            with PilImage.open(file_path) as img:
-                frames = []
-                try:
-                    while True:
-                        frame = img.copy()
-                        if frame.size != (pixel_size, pixel_size):
-                            frame = frame.resize(
-                                (pixel_size, pixel_size), PilImage.NEAREST
-                            )
-                        frames.append(frame.copy())
-                        img.seek(img.tell() + 1)
-                except EOFError:
-                    pass
-                gif_buffer = io.BytesIO()
-                frames[0].save(
-                    gif_buffer,
-                    format="GIF",
-                    save_all=True,
-                    append_images=frames[1:],
-                    loop=1,
-                    duration=img.info["duration"],
-                    disposal=2,
-                )
-                gif_buffer.seek(0)
-                data = self._createPayloads(gif_buffer.getvalue())
-                if self.conn:
-                    await self.conn.connect()
-                    for chunk in data:
-                        await self.conn.send(data=chunk, response=True)
-                return data
+            gif_data = self.processFile(file_path, pixel_size, optimize, max_bytes)
+            data = self._createPayloads(gif_data)
+            if self.conn:
+                await self.conn.connect()
+                for chunk in data:
+                    await self.conn.send(data=chunk, response=True)
+            return data
         except BaseException as error:
             self.logging.error(f"could not upload gif processed: {error}")
             return False
@@ -0,0 +1,239 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import mmap
+import os
+import struct
+
+
+ATLAS_MAGIC = b"IDMA"
+ATLAS_VERSION = 1
+# magic, version, glyph count, ascent, descent, pixel size, source mtime_ns and size
+HEADER = struct.Struct("<4sHIhhHqQ")
+# code point, bitmap offset, width, height, x offset, y offset (of the bottom row), advance
+ENTRY = struct.Struct("<IIBBbbBx")
+
+
+class Glyph(NamedTuple):
+    """A 1-bit glyph bitmap, rows packed MSB first like BDF."""
+
+    width: int
+    height: int
+    x_offset: int
+    y_offset: int
+    advance: int
+    bitmap: bytes
+
+
+def _writeAtlas(
+    out_path: str,
+    glyphs: Dict[int, Glyph],
+    ascent: int,
+    descent: int,
+    pixel_size: int,
+    source: os.stat_result,
+) -> None:
+    table = bytearray()
+    data = bytearray()
+    for codepoint in sorted(glyphs):
+        glyph = glyphs[codepoint]
+        table += ENTRY.pack(
+            codepoint,
+            len(data),
+            min(glyph.width, 255),
+            min(glyph.height, 255),
+            max(-128, min(glyph.x_offset, 127)),
+            max(-128, min(glyph.y_offset, 127)),
+            max(0, min(glyph.advance, 255)),
+        )
+        data += glyph.bitmap
+    header = HEADER.pack(
+        ATLAS_MAGIC, ATLAS_VERSION, len(glyphs), ascent, descent, pixel_size,
+        source.st_mtime_ns, source.st_size,
+    )
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(f"{out_path}.tmp", "wb") as file:
+        file.write(header + table + data)
+    os.replace(f"{out_path}.tmp", out_path)
+
+
+def _readBdf(file_path: str) -> Tuple[Dict[int, Glyph], int, int, int]:
+    """Reads every encoded glyph of a BDF font, the bitmap rows are kept as they are."""
+    glyphs: Dict[int, Glyph] = {}
+    properties: Dict[str, int] = {}
+    codepoint = -1
+    advance = 0
+    box = (0, 0, 0, 0)
+    rows: Optional[List[bytes]] = None
+    with open(file_path, "r", encoding="latin-1") as file:
+        for line in file:
+            key, _, value = line.strip().partition(" ")
+            if rows is not None:
+                if key == "ENDCHAR":
+                    if codepoint >= 0:
+                        width, height, x_offset, y_offset = box
+                        glyphs[codepoint] = Glyph(
+                            width, height, x_offset, y_offset, advance, b"".join(rows)
+                        )
+                    rows = None
+                else:
+                    rows.append(bytes.fromhex(key)[: (box[0] + 7) // 8])
+            elif key == "ENCODING":
+                codepoint = int(value.split()[0])
+            elif key == "DWIDTH":
+                advance = int(value.split()[0])
+            elif key == "BBX":
+                box = tuple(int(field) for field in value.split())
+            elif key == "BITMAP":
+                rows = []
+            elif key in ("PIXEL_SIZE", "FONT_ASCENT", "FONT_DESCENT"):
+                properties[key] = int(value)
+    ascent = properties.get("FONT_ASCENT", 0)
+    descent = properties.get("FONT_DESCENT", 0)
+    return glyphs, ascent, descent, properties.get("PIXEL_SIZE", ascent + descent)
+
+
+def _readPcf(file_path: str) -> Tuple[Dict[int, Glyph], int, int, int]:
+    """Reads the Latin-1 glyphs of a PCF font through Pillow."""
+    from PIL import PcfFontFile
+
+    with open(file_path, "rb") as file:
+        font = PcfFontFile.PcfFontFile(file)
+    glyphs: Dict[int, Glyph] = {}
+    ascent = descent = 0
+    for codepoint, glyph in enumerate(font.glyph):
+        if not glyph:
+            continue
+        (advance, _), (left, top, right, bottom), _, image = glyph
+        glyphs[codepoint] = Glyph(
+            right - left, bottom - top, left, -bottom, advance, image.tobytes()
+        )
+        ascent, descent = max(ascent, -top), max(descent, bottom)
+    return glyphs, ascent, descent, ascent + descent
+
+
+def compileFont(file_path: str, out_path: str) -> None:
+    """Compiles a bitmap font into a glyph atlas file. Blocking.
+
+    BDF fonts are read directly, PCF fonts need Pillow. Compiling is a one time
+    cost, reading an atlas does not need Pillow. Scalable fonts are rendered
+    by Pillow at their size instead.
+
+    Args:
+        file_path (str): path to the BDF or PCF font file
+        out_path (str): path of the atlas file
+    """
+    source = os.stat(file_path)
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".bdf":
+        glyphs, ascent, descent, pixel_size = _readBdf(file_path)
+    elif extension == ".pcf":
+        glyphs, ascent, descent, pixel_size = _readPcf(file_path)
+    else:
+        raise ValueError(f"{extension} is not a bitmap font")
+    _writeAtlas(out_path, glyphs, ascent, descent, pixel_size, source)
+
+
+def atlasSource(atlas_path: str) -> Optional[Tuple[int, int]]:
+    """Returns the source mtime_ns and size an atlas was compiled from, None if it is unusable."""
+    try:
+        with open(atlas_path, "rb") as file:
+            magic, version, _, _, _, _, mtime_ns, size = HEADER.unpack(file.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+        return None
+    return mtime_ns, size
+
+
+class GlyphAtlas:
+    """Memory-mapped glyph atlas, composes 1-bit text without Pillow.
+
+    Glyphs are looked up by binary search in the sorted code point table and
+    only the touched pages of the file are read. Canvases are bytearrays with
+    one byte per pixel, 0 or 1.
+    """
+
+    def __init__(self, atlas_path: str) -> None:
+        with open(atlas_path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, self.ascent, self.descent, self.pixel_size, _, _ = (
+            HEADER.unpack_from(self._map, 0)
+        )
+        if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+            raise ValueError(f"{atlas_path} is not a glyph atlas")
+        self._data = HEADER.size + self._count * ENTRY.size
+        self._glyphs: Dict[str, Optional[Glyph]] = {}
+
+    @property
+    def line_height(self) -> int:
+        return self.ascent + self.descent
+
+    def _find(self, codepoint: int) -> Optional[Glyph]:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = HEADER.size + middle * ENTRY.size
+            found = struct.unpack_from("<I", self._map, position)[0]
+            if found < codepoint:
+                low = middle + 1
+            elif found > codepoint:
+                high = middle
+            else:
+                _, offset, width, height, x_offset, y_offset, advance = ENTRY.unpack_from(
+                    self._map, position
+                )
+                start = self._data + offset
+                return Glyph(
+                    width, height, x_offset, y_offset, advance,
+                    self._map[start:start + height * ((width + 7) // 8)],
+                )
+        return None
+
+    def glyph(self, char: str) -> Optional[Glyph]:
+        """Returns the glyph of a character, "?" for missing ones and None if that is missing too."""
+        if char not in self._glyphs:
+            self._glyphs[char] = self._find(ord(char)) or self._find(ord("?"))
+        return self._glyphs[char]
+
+    def charWidth(self, char: str) -> int:
+        """Returns the inked width of a character, the advance for blank ones like space."""
+        glyph = self.glyph(char)
+        if glyph is None:
+            return self.pixel_size // 2
+        return glyph.width if glyph.bitmap.strip(b"\x00") else glyph.advance
+
+    def textWidth(self, text: str, spacing: int = 0) -> int:
+        """Returns the width of text drawn with drawChar() and extra spacing between characters."""
+        if not text:
+            return 0
+        return sum(self.charWidth(char) + spacing for char in text) - spacing
+
+    def drawChar(
+        self, canvas: bytearray, canvas_width: int, canvas_height: int, x: int, top: int, char: str
+    ) -> int:
+        """Draws a character with its ink starting at x and the line starting at top.
+
+        Args:
+            canvas (bytearray): canvas_width * canvas_height pixels, one byte each
+            canvas_width (int): width of the canvas
+            canvas_height (int): height of the canvas
+            x (int): left edge of the ink
+            top (int): top of the line, the baseline is at top + ascent
+            char (str): character to draw
+
+        Returns:
+            int: width used by the character, see charWidth()
+        """
+        glyph = self.glyph(char)
+        if glyph is None:
+            return self.pixel_size // 2
+        row_bytes = (glyph.width + 7) // 8
+        y = top + self.ascent - glyph.y_offset - glyph.height
+        for row in range(glyph.height):
+            if not 0 <= y + row < canvas_height:
+                continue
+            line = (y + row) * canvas_width
+            bits = glyph.bitmap[row * row_bytes:(row + 1) * row_bytes]
+            for column in range(glyph.width):
+                if bits[column >> 3] & (0x80 >> (column & 7)) and 0 <= x + column < canvas_width:
+                    canvas[line + x + column] = 1
+        return self.charWidth(char)
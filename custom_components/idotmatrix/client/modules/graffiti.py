@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Iterable, Tuple, Union
 from ..connectionManager import ConnectionManager
 import logging
 
@@ -73,3 +73,19 @@ class Graffiti:
         except BaseException as error:
             self.logging.error(f"could not update the Graffiti Board: {error}")
             return False
+
+    def _createPixelsPayload(
+        self, pixels: Iterable[Tuple[int, int, int, int, int]]
+    ) -> bytearray:
+        """Creates one burst of setPixel commands without sending it.
+
+        Args:
+            pixels (Iterable[Tuple[int, int, int, int, int]]): (r, g, b, x, y) of every pixel
+
+        Returns:
+            bytearray: concatenated setPixel commands, 10 bytes per pixel
+        """
+        data = bytearray()
+        for r, g, b, x, y in pixels:
+            data += bytes([10, 0, 5, 1, 0, r % 256, g % 256, b % 256, x % 256, y % 256])
+        return data
@@ -2,8 +2,8 @@ from typing import Union, List
 from ..connectionManager import ConnectionManager
 import io
 import logging
-from PIL import Image as PilImage
 import struct
+import zlib
 
 
 class Image:
@@ -16,13 +16,13 @@ class Image:
         """Enter the DIY draw mode of the iDotMatrix device.
 
         Args:
-            mode (int): 0 = disable DIY, 1 = enable DIY, 2 = ?, 3 = ?. Defaults to 1.
+            mode (int): 0 = leave DIY showing the previous content, 1 = enter DIY and clear the display, 2 = leave DIY keeping the drawing, 3 = enter DIY keeping the shown image. Defaults to 1.
 
         Returns:
             Union[bool, bytearray]: False if there's an error, otherwise byte array of the command which needs to be sent to the device.
         """
         try:
-            data = bytearray([5, 0, 4, 1, mode % 256])
+            data = self.buildMode(mode)
             if self.conn:
                 await self.conn.connect()
                 await self.conn.send(data=data)
@@ -31,6 +31,17 @@ class Image:
             self.logging.error(f"could not enter image mode due to {error}")
             return False
 
+    def buildMode(self, mode: int = 1) -> bytearray:
+        """Builds the DIY draw mode command without sending it, e.g. to pre-render a sequence.
+
+        Args:
+            mode (int): 0 = leave DIY showing the previous content, 1 = enter DIY and clear the display, 2 = leave DIY keeping the drawing, 3 = enter DIY keeping the shown image. Defaults to 1.
+
+        Returns:
+            bytearray: the command
+        """
+        return bytearray([5, 0, 4, 1, mode % 256])
+
     def _loadPNG(self, file_path: str) -> bytes:
         """Load a PNG file into a byte buffer.
 
@@ -96,6 +107,95 @@ class Image:
             self.logging.error(f"could not upload the unprocessed image: {error}")
             return False
 
+    def processFile(self, file_path: str, pixel_size: int = 32) -> bytes:
+        """Resizes and re-encodes an image as PNG for the device without uploading it.
+
+        Args:
+            file_path (str): path to the image file
+            pixel_size (int, optional): amount of pixels (either 16 or 32 makes sense). Defaults to 32.
+
+        Returns:
+            bytes: the encoded PNG
+        """
+        from PIL import Image as PilImage
+
+        with PilImage.open(file_path) as img:
+            # Convert to RGB to ensure compatibility and drop some metadata
+            img = img.convert("RGB")
+
+            if img.size != (pixel_size, pixel_size):
+                img = img.resize(
+                    (pixel_size, pixel_size), PilImage.LANCZOS
+                )
+
+            # Strip metadata by clearing info
+            img.info = {}
+
+            png_buffer = io.BytesIO()
+            # Save with optimize=True to further reduce size
+            img.save(png_buffer, format="PNG", optimize=True)
+            return png_buffer.getvalue()
+
+    def encodeRgb(self, width: int, height: int, pixels: bytes) -> bytes:
+        """Encodes raw RGB pixels as PNG without Pillow, e.g. for text composed from a glyph atlas.
+
+        Args:
+            width (int): width of the image
+            height (int): height of the image
+            pixels (bytes): width * height * 3 bytes, row by row
+
+        Returns:
+            bytes: the encoded PNG
+        """
+
+        def chunk(kind: bytes, data: bytes) -> bytes:
+            return (
+                struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+            )
+
+        stride = width * 3
+        # filter type 0 (none) in front of every row
+        raw = b"".join(
+            b"\x00" + pixels[row * stride:(row + 1) * stride] for row in range(height)
+        )
+        return (
+            b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 9))
+            + chunk(b"IEND", b"")
+        )
+
+    def buildPayloads(self, png_data: bytes) -> bytearray:
+        """Builds the upload packets of an already processed PNG without sending them.
+
+        Args:
+            png_data (bytes): data of the png file
+
+        Returns:
+            bytearray: the packets, ready for the connection's send()
+        """
+        return self._createPayloads(png_data)
+
+    async def uploadEncoded(self, png_data: bytes) -> Union[bool, bytearray]:
+        """Uploads an already processed PNG, e.g. from the media library cache.
+
+        Args:
+            png_data (bytes): data of the png file
+
+        Returns:
+            Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
+        """
+        try:
+            data = self._createPayloads(png_data)
+            if self.conn:
+                await self.conn.connect()
+                await self.conn.send(data=data)
+            return data
+        except BaseException as error:
+            self.logging.error(f"could not upload the encoded image: {error}")
+            return False
+
     async def uploadProcessed(
         self, file_path: str, pixel_size: int = 32
     ) -> Union[bool, bytearray]:
@@ -109,27 +209,11 @@ class Image:
             Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
         """
         try:
-            with PilImage.open(file_path) as img:
-                # Convert to RGB to ensure compatibility and drop some metadata
-                img = img.convert("RGB")
-                
-                if img.size != (pixel_size, pixel_size):
-                    img = img.resize(
-                        (pixel_size, pixel_size), PilImage.LANCZOS
-                    )
-                
-                # Strip metadata by clearing info
-                img.info = {}
-                
-                png_buffer = io.BytesIO()
-                # Save with optimize=True to further reduce size
-                img.save(png_buffer, format="PNG", optimize=True)
-                png_buffer.seek(0)
-                data = self._createPayloads(png_buffer.getvalue())
-                if self.conn:
-                    await self.conn.connect()
-                    await self.conn.send(data=data)
-                return data
+            data = self._createPayloads(self.processFile(file_path, pixel_size))
+            if self.conn:
+                await self.conn.connect()
+                await self.conn.send(data=data)
+            return data
         except BaseException as error:
             self.logging.error(f"could not upload processed image: {error}")
             return False
@@ -0,0 +1,267 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from .gif import Gif
+from .image import Image
+
+
+MEDIA_EXTENSIONS = (".gif", ".png", ".jpg", ".jpeg", ".bmp", ".webp")
+INDEX_FILE = "index.json"
+
+
+def _processItem(
+    file_path: str, pixel_size: int, cache_path: str, max_bytes: Optional[int] = None
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """Converts one media file inside a worker process and writes it to the cache.
+
+    Args:
+        file_path (str): path to the source file
+        pixel_size (int): amount of pixels of the panel
+        cache_path (str): path of the cache file without extension
+        max_bytes (Optional[int], optional): byte budget of animations. Defaults to None.
+
+    Returns:
+        Tuple[str, Optional[str], Optional[str]]: source path, kind ("gif" or "png") and error message
+    """
+    from PIL import Image as PilImage
+
+    try:
+        with PilImage.open(file_path) as img:
+            animated = getattr(img, "is_animated", False)
+        if animated:
+            kind = "gif"
+            data = Gif().processFile(file_path, pixel_size, max_bytes=max_bytes)
+        else:
+            kind = "png"
+            data = Image().processFile(file_path, pixel_size)
+        tmp_path = f"{cache_path}.{kind}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, f"{cache_path}.{kind}")
+        return file_path, kind, None
+    except BaseException as error:
+        return file_path, None, str(error)
+
+
+class MediaLibrary:
+    """Pre-processes a folder of images and animations for a panel size.
+
+    Converted files are kept in an on-disk payload cache, keyed by source path and
+    panel size. A file is only converted again when its size or mtime or the
+    byte budget of animations changed.
+    """
+
+    logging = logging.getLogger(__name__)
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, dict]] = None
+
+    def _key(self, file_path: str, pixel_size: int) -> str:
+        return f"{os.path.abspath(file_path)}|{pixel_size}"
+
+    def _cachePath(self, file_path: str, pixel_size: int) -> str:
+        digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}_{pixel_size}")
+
+    def _loadIndex(self) -> Dict[str, dict]:
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, INDEX_FILE), "r") as file:
+                    self._index = json.load(file)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _saveIndex(self) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, INDEX_FILE)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(self._index, file)
+        os.replace(f"{path}.tmp", path)
+
+    def _isCurrent(
+        self, entry: Optional[dict], stat: os.stat_result, max_bytes: Optional[int] = None
+    ) -> bool:
+        return (
+            entry is not None
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+            and (entry.get("kind") != "gif" or entry.get("max_bytes") == max_bytes)
+            and os.path.exists(entry.get("file", ""))
+        )
+
+    def scan(self, folder: str) -> List[str]:
+        """Lists all supported media files below a folder.
+
+        Args:
+            folder (str): media folder
+
+        Returns:
+            List[str]: sorted absolute paths of the media files
+        """
+        files = []
+        for root, _, names in os.walk(folder):
+            for name in names:
+                if name.lower().endswith(MEDIA_EXTENSIONS):
+                    files.append(os.path.abspath(os.path.join(root, name)))
+        return sorted(files)
+
+    def process(
+        self,
+        folder: str,
+        pixel_size: int = 32,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, Union[int, List[str]]]:
+        """Converts every changed media file of a folder in parallel. Blocking.
+
+        Args:
+            folder (str): media folder
+            pixel_size (int, optional): amount of pixels of the panel. Defaults to 32.
+            workers (Optional[int], optional): size of the process pool. Defaults to the number of CPUs.
+            progress (Optional[Callable[[int, int, str], None]], optional): called with (done, total, path) after every converted file. Defaults to None.
+            max_bytes (Optional[int], optional): byte budget of animations, see Gif.processFile(). Defaults to None.
+
+        Returns:
+            Dict[str, Union[int, List[str]]]: amount of converted, unchanged and failed files
+        """
+        with self._lock:
+            index = self._loadIndex()
+            files = self.scan(folder)
+            pending = []
+            for file_path in files:
+                stat = os.stat(file_path)
+                if not self._isCurrent(index.get(self._key(file_path, pixel_size)), stat, max_bytes):
+                    pending.append((file_path, stat))
+
+            # forget files that were removed from the folder
+            prefix = os.path.join(os.path.abspath(folder), "")
+            known = set(files)
+            for key in list(index):
+                path, size = key.rsplit("|", 1)
+                if path.startswith(prefix) and path not in known and size == str(pixel_size):
+                    entry = index.pop(key)
+                    if os.path.exists(entry.get("file", "")):
+                        os.remove(entry["file"])
+
+            failed = []
+            if pending:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                stats = dict(pending)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(
+                            _processItem,
+                            file_path,
+                            pixel_size,
+                            self._cachePath(file_path, pixel_size),
+                            max_bytes,
+                        )
+                        for file_path, _ in pending
+                    ]
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        file_path, kind, error = future.result()
+                        if error:
+                            self.logging.warning(f"could not process {file_path}: {error}")
+                            failed.append(file_path)
+                        else:
+                            stat = stats[file_path]
+                            index[self._key(file_path, pixel_size)] = {
+                                "mtime_ns": stat.st_mtime_ns,
+                                "size": stat.st_size,
+                                "kind": kind,
+                                "max_bytes": max_bytes,
+                                "file": f"{self._cachePath(file_path, pixel_size)}.{kind}",
+                            }
+                        if progress:
+                            progress(done, len(pending), file_path)
+            self._saveIndex()
+            self.logging.info(
+                f"converted {len(pending) - len(failed)} of {len(files)} media files for {pixel_size}x{pixel_size} ({len(failed)} failed)"
+            )
+            return {
+                "total": len(files),
+                "converted": len(pending) - len(failed),
+                "unchanged": len(files) - len(pending),
+                "failed": failed,
+            }
+
+    def get(
+        self, file_path: str, pixel_size: int = 32, max_bytes: Optional[int] = None
+    ) -> Optional[Tuple[str, bytes]]:
+        """Returns the cached payload of a media file if it is still up to date. Blocking.
+
+        Args:
+            file_path (str): path to the source file
+            pixel_size (int, optional): amount of pixels of the panel. Defaults to 32.
+            max_bytes (Optional[int], optional): byte budget of animations. Defaults to None.
+
+        Returns:
+            Optional[Tuple[str, bytes]]: kind ("gif" or "png") and encoded data, None on a cache miss
+        """
+        with self._lock:
+            entry = self._loadIndex().get(self._key(file_path, pixel_size))
+            try:
+                if not self._isCurrent(entry, os.stat(file_path), max_bytes):
+                    return None
+                with open(entry["file"], "rb") as file:
+                    return entry["kind"], file.read()
+            except OSError:
+                return None
+
+    def load(
+        self, file_path: str, pixel_size: int = 32, max_bytes: Optional[int] = None
+    ) -> Tuple[str, bytes]:
+        """Returns the payload of a media file, converting and caching it on a miss. Blocking.
+
+        Args:
+            file_path (str): path to the source file
+            pixel_size (int, optional): amount of pixels of the panel. Defaults to 32.
+            max_bytes (Optional[int], optional): byte budget of animations. Defaults to None.
+
+        Returns:
+            Tuple[str, bytes]: kind ("gif" or "png") and encoded data
+        """
+        cached = self.get(file_path, pixel_size, max_bytes)
+        if cached:
+            return cached
+        os.makedirs(self.cache_dir, exist_ok=True)
+        stat = os.stat(file_path)
+        cache_path = self._cachePath(file_path, pixel_size)
+        _, kind, error = _processItem(file_path, pixel_size, cache_path, max_bytes)
+        if error:
+            raise ValueError(error)
+        with self._lock:
+            self._loadIndex()[self._key(file_path, pixel_size)] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "kind": kind,
+                "max_bytes": max_bytes,
+                "file": f"{cache_path}.{kind}",
+            }
+            self._saveIndex()
+        with open(f"{cache_path}.{kind}", "rb") as file:
+            return kind, file.read()
+
+    async def upload(self, kind: str, data: bytes) -> Union[bool, bytearray]:
+        """Uploads a payload returned by get() or load() to the device.
+
+        Args:
+            kind (str): "gif" or "png"
+            data (bytes): encoded data
+
+        Returns:
+            Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
+        """
+        if kind == "gif":
+            return await Gif().uploadEncoded(data)
+        await Image().setMode(1)
+        return await Image().uploadEncoded(data)
@@ -1,5 +1,4 @@
 from ..connectionManager import ConnectionManager
-from cryptography.fernet import Fernet
 import logging
 from typing import Union
 
@@ -54,6 +53,8 @@ class System:
         Returns:
             bytes: Encrypted data.
         """
+        from cryptography.fernet import Fernet
+
         f = Fernet(key)
         encrypted_data = f.encrypt(data)
         return encrypted_data
@@ -65,6 +66,8 @@ class System:
             Union[bool, bytearray]: False if there's an error, otherwise byte array of the command which needs to be sent to the device.
         """
         # TODO: implement Aes encryption according to iDotMatrix Android App
+        from cryptography.fernet import Fernet
+
         try:
             command = bytearray(
                 [
@@ -1,9 +1,11 @@
 from ..connectionManager import ConnectionManager
 import logging
-from PIL import Image, ImageDraw, ImageFont
-from typing import Tuple, Optional, Union
+from typing import Tuple, Optional, Union, TYPE_CHECKING
 import zlib
 
+if TYPE_CHECKING:
+    from .glyphAtlas import GlyphAtlas
+
 
 class Text:
     """Manages text processing and packet creation for iDotMatrix devices. With help from https://github.com/8none1/idotmatrix/ :)"""
@@ -32,37 +34,23 @@ class Text:
         compact_mode: bool = False,
         spacing: int = 0,
         proportional: bool = True,
+        atlas: Optional["GlyphAtlas"] = None,
     ) -> Union[bool, bytearray]:
-        
-        # Determine layout based on mode
-        if compact_mode:
-            image_width = 8
-            image_height = 16
-            separator = b"\x02\xff\xff\xff"
-        else:
-            image_width = 16
-            image_height = 32
-            separator = b"\x05\xff\xff\xff"
-
         try:
-            data = self._buildStringPacket(
+            data = self.buildPacket(
+                text=text,
+                font_size=font_size,
+                font_path=font_path,
                 text_mode=text_mode,
                 speed=speed,
                 text_color_mode=text_color_mode,
                 text_color=text_color,
                 text_bg_mode=text_bg_mode,
                 text_bg_color=text_bg_color,
-                text_bitmaps=self._StringToBitmaps(
-                    text=text,
-                    font_size=font_size,
-                    font_path=font_path,
-                    image_width=image_width,
-                    image_height=image_height,
-                    separator=separator,
-                    spacing=spacing,
-                    proportional=proportional
-                ),
-                separator=separator
+                compact_mode=compact_mode,
+                spacing=spacing,
+                proportional=proportional,
+                atlas=atlas,
             )
             if self.conn:
                 await self.conn.connect()
@@ -72,6 +60,73 @@ class Text:
             self.logging.error(f"could send the text to the device: {error}")
             return False
 
+    def buildPacket(
+        self,
+        text: str,
+        font_size: int = 16,
+        font_path: Optional[str] = None,
+        text_mode: int = 1,
+        speed: int = 95,
+        text_color_mode: int = 1,
+        text_color: Tuple[int, int, int] = (255, 0, 0),
+        text_bg_mode: int = 0,
+        text_bg_color: Tuple[int, int, int] = (0, 255, 0),
+        compact_mode: bool = False,
+        spacing: int = 0,
+        proportional: bool = True,
+        atlas: Optional["GlyphAtlas"] = None,
+    ) -> bytearray:
+        """Renders the text and builds the packet without sending it, e.g. to pre-render a sequence.
+
+        Args:
+            text (str): text to display
+            font_size (int, optional): font size in pixels. Defaults to 16.
+            font_path (Optional[str], optional): path to the font file. Defaults to None.
+            text_mode (int, optional): animation mode. Defaults to 1.
+            speed (int, optional): animation speed. Defaults to 95.
+            text_color_mode (int, optional): color mode. Defaults to 1.
+            text_color (Tuple[int, int, int], optional): text color. Defaults to (255, 0, 0).
+            text_bg_mode (int, optional): background mode. Defaults to 0.
+            text_bg_color (Tuple[int, int, int], optional): background color. Defaults to (0, 255, 0).
+            compact_mode (bool, optional): use 8x16 instead of 16x32 glyphs. Defaults to False.
+            spacing (int, optional): horizontal spacing between characters. Defaults to 0.
+            proportional (bool, optional): proportional font rendering. Defaults to True.
+            atlas (Optional[GlyphAtlas], optional): compose the text from this glyph atlas instead of the font file, without Pillow. Defaults to None.
+
+        Returns:
+            bytearray: the packet
+        """
+        # Determine layout based on mode
+        if compact_mode:
+            image_width = 8
+            image_height = 16
+            separator = b"\x02\xff\xff\xff"
+        else:
+            image_width = 16
+            image_height = 32
+            separator = b"\x05\xff\xff\xff"
+
+        return self._buildStringPacket(
+            text_mode=text_mode,
+            speed=speed,
+            text_color_mode=text_color_mode,
+            text_color=text_color,
+            text_bg_mode=text_bg_mode,
+            text_bg_color=text_bg_color,
+            text_bitmaps=self._StringToBitmaps(
+                text=text,
+                font_size=font_size,
+                font_path=font_path,
+                image_width=image_width,
+                image_height=image_height,
+                separator=separator,
+                spacing=spacing,
+                proportional=proportional,
+                atlas=atlas,
+            ),
+            separator=separator
+        )
+
     def _buildStringPacket(
         self,
         text_bitmaps: bytearray,
@@ -134,10 +189,17 @@ class Text:
     def _StringToBitmaps(
         self, text: str, font_path: Optional[str] = None, font_size: Optional[int] = 20,
         image_width: int = 16, image_height: int = 32, separator: bytes = b"\x05\xff\xff\xff",
-        spacing: int = 0, proportional: bool = True
+        spacing: int = 0, proportional: bool = True, atlas: Optional["GlyphAtlas"] = None
     ) -> bytearray:
         """Converts text to bitmap images suitable for iDotMatrix devices."""
+        if atlas is not None:
+            return self._AtlasToBitmaps(
+                text, atlas, image_width, image_height, separator, spacing, proportional
+            )
+
         import os
+        from PIL import Image, ImageDraw, ImageFont
+
         base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         fonts_dir = os.path.join(base_path, "fonts")
         
@@ -254,3 +316,39 @@ class Text:
                 byte_stream.extend(separator + bitmap)
                 
             return byte_stream
+
+    def _AtlasToBitmaps(
+        self, text: str, atlas: "GlyphAtlas", image_width: int, image_height: int,
+        separator: bytes, spacing: int, proportional: bool
+    ) -> bytearray:
+        """Composes the bitmaps from a glyph atlas, all characters share one baseline."""
+        top = (image_height - atlas.line_height) // 2
+        if proportional:
+            # One canvas with the characters and extra spacing, sliced into images
+            canvas_width = max(atlas.textWidth(text, spacing) + spacing, image_width)
+            canvas = bytearray(canvas_width * image_height)
+            x = 0
+            for char in text:
+                x += atlas.drawChar(canvas, canvas_width, image_height, x, top, char) + spacing
+            offsets = range(0, canvas_width, image_width)
+        else:
+            # One centered character per image
+            canvas_width = max(len(text), 1) * image_width
+            canvas = bytearray(canvas_width * image_height)
+            for index, char in enumerate(text):
+                x = index * image_width + (image_width - atlas.charWidth(char)) // 2
+                atlas.drawChar(canvas, canvas_width, image_height, x, top, char)
+            offsets = range(0, len(text) * image_width, image_width)
+
+        byte_stream = bytearray()
+        for offset in offsets:
+            bitmap = bytearray()
+            for y in range(image_height):
+                row = y * canvas_width + offset
+                for x in range(0, image_width, 8):
+                    byte = 0
+                    for bit in range(min(8, image_width - x, canvas_width - offset - x)):
+                        byte |= canvas[row + x + bit] << bit
+                    bitmap.append(byte)
+            byte_stream.extend(separator + bitmap)
+        return byte_stream
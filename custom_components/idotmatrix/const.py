@@ -27,3 +27,26 @@ COLOR_MODES = {
     "Rainbow 3": 4,
     "Rainbow 4": 5,
 }
+
+# Services
+SERVICE_PREPROCESS_MEDIA = "preprocess_media"
+SERVICE_UPLOAD_MEDIA = "upload_media"
+SERVICE_LEDFX_CAPTURE_START = "ledfx_capture_start"
+SERVICE_LEDFX_CAPTURE_STOP = "ledfx_capture_stop"
+SERVICE_LEDFX_SET_WALL = "ledfx_set_wall"
+SERVICE_SCENE_SAVE = "scene_save"
+SERVICE_SCENE_RECALL = "scene_recall"
+SERVICE_SCENE_DELETE = "scene_delete"
+SERVICE_PLAYLIST_START = "playlist_start"
+SERVICE_PLAYLIST_STOP = "playlist_stop"
+
+# Events
+EVENT_MEDIA_PROGRESS = f"{DOMAIN}_media_progress"
+
+# Shared media library (hass.data key)
+DATA_MEDIA_LIBRARY = f"{DOMAIN}_media_library"
+MEDIA_CACHE_DIR = "idotmatrix_media"
+
+# Shared font catalog (hass.data key) and its index file
+DATA_FONT_CATALOG = f"{DOMAIN}_font_catalog"
+FONT_CATALOG_FILE = "idotmatrix_fonts.json"
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import asyncio
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,23 +13,86 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_MAC,
+    DATA_FONT_CATALOG,
+    DATA_MEDIA_LIBRARY,
+    EVENT_MEDIA_PROGRESS,
+    FONT_CATALOG_FILE,
+    MEDIA_CACHE_DIR,
+)
 from .client.connectionManager import ConnectionManager
 from .client.modules.text import Text
 from .client.modules.image import Image as IDMImage
 from .client.modules.clock import Clock
+from .client.modules.common import Common
 
 
+import io
 import os
-import tempfile
-from PIL import Image, ImageDraw, ImageFont
+import random
+
+from homeassistant.helpers.storage import Store, STORAGE_DIR
 
-from homeassistant.helpers.storage import Store
+if TYPE_CHECKING:
+    from .client.modules.fontCatalog import FontCatalog
+    from .client.modules.glyphAtlas import GlyphAtlas
+    from .client.modules.mediaLibrary import MediaLibrary
 
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
 STORAGE_KEY_PREFIX = "idotmatrix_settings_"
+SCENES_KEY_PREFIX = "idotmatrix_scenes_"
+
+# Settings a scene captures, everything that decides what the panel shows
+SCENE_SETTINGS = (
+    "current_text",
+    "font",
+    "animation_mode",
+    "speed",
+    "color_mode",
+    "color",
+    "spacing",
+    "spacing_y",
+    "proportional",
+    "blur",
+    "font_size",
+    "multiline",
+    "screen_size",
+    "brightness",
+    "clock_style",
+    "clock_date",
+    "clock_format",
+    "autosize",
+)
+
+# Settings are written to storage at most once per this many seconds
+SETTINGS_SAVE_DELAY = 5
+
+# Setting changes within this many seconds are rendered and uploaded once
+DEFAULT_UPDATE_DEBOUNCE = 0.15
+
+# Seconds an item of a playlist is shown unless it sets its own duration
+DEFAULT_PLAYLIST_INTERVAL = 10.0
+
+# First guess of the Bluetooth transfer time of a playlist item: a fixed cost
+# per packet plus a cost per byte, both refined by every send
+PLAYLIST_PACKET_TIME = 0.06
+PLAYLIST_BYTE_TIME = 0.0003
+
+# Random word colors of Fun Text
+FUN_TEXT_PALETTE = [
+    [255, 0, 0],
+    [0, 255, 0],
+    [0, 120, 255],
+    [160, 0, 255],
+    [255, 255, 255],
+    [255, 120, 0],
+    [255, 0, 170],
+    [0, 255, 220],
+]
 
 class IDotMatrixCoordinator(DataUpdateCoordinator):
     """Class to manage fetching iDotMatrix data."""
@@ -44,9 +107,33 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         )
         self.entry = entry
         self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}{entry.entry_id}")
+
+        # Scenes: captured settings are stored, their compiled command bundles
+        # only live in memory and are rebuilt after a restart
+        self._scenes_store = Store(hass, STORAGE_VERSION, f"{SCENES_KEY_PREFIX}{entry.entry_id}")
+        self.scenes: dict[str, dict] = {}
+        self._scene_bundles: dict[str, bytes] = {}
         
         # LedFx Gateway instance
         self._ledfx_gateway: Optional["LedFxGateway"] = None
+
+        # Progress of the last media library run
+        self.media_progress: dict = {}
+
+        # Coalescing device updates: one render in flight, requests arriving
+        # meanwhile fold into a single follow-up render
+        self._update_task: Optional[asyncio.Task] = None
+        self._update_requested = False
+        self._render_lock = asyncio.Lock()
+
+        # Running Fun Text sequence
+        self._fun_text_task: Optional[asyncio.Task] = None
+
+        # Running playlist and how well it keeps its schedule
+        self._playlist_task: Optional[asyncio.Task] = None
+        self._packet_time = PLAYLIST_PACKET_TIME
+        self._byte_time = PLAYLIST_BYTE_TIME
+        self.playlist_stats: dict = {"running": False}
         
         # Shared settings for Text entity
         self.text_settings = {
@@ -69,10 +156,32 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             "clock_format": "24h",# 12h or 24h
             "fun_text_delay": 0.4,# Fun Text delay in seconds
             "autosize": False,    # Auto-scale font to fit screen
+            "update_debounce": DEFAULT_UPDATE_DEBOUNCE,  # Seconds to collect changes before an upload
+            "gif_max_kb": 0,      # Byte budget of converted GIFs in KB (0 = no budget)
             # LedFx Gateway settings
             "ledfx_enabled": False,     # Enable LedFx gateway
             "ledfx_port": 21324,        # UDP port for LedFx
+            "ledfx_ddp_port": 4048,     # UDP port for LedFx DDP output
+            "ledfx_e131_enabled": False,    # Listen for E1.31 (sACN) on port 5568
+            "ledfx_artnet_enabled": False,  # Listen for Art-Net on port 6454
+            "ledfx_start_universe": 1,      # DMX universe holding the first pixel
+            "ledfx_channels_per_universe": 510,  # 170 RGB pixels per universe
+            "ledfx_source_width": 0,    # LedFx matrix width (0 = screen size)
+            "ledfx_source_height": 0,   # LedFx matrix height (0 = screen size)
+            "ledfx_serpentine": False,  # Odd source rows run right to left
+            "ledfx_rotation": 0,        # Clockwise rotation of the source
+            "ledfx_mirror_x": False,    # Mirror the source horizontally
+            "ledfx_mirror_y": False,    # Mirror the source vertically
+            "ledfx_gamma": 1.0,         # Gamma correction (1.0 = off)
+            "ledfx_white_balance": [255, 255, 255],  # Red, green, blue maximum
+            "ledfx_black_level": 0,     # Channel values at or below become black
+            "ledfx_tiles": [],          # Tiled wall: [{"address", "column", "row"}], empty = this panel only
+            "ledfx_idle_timeout": 2.5,  # Seconds without data before the panels are released (0 = never)
+            "ledfx_idle_restore": True, # Show text / clock again when LedFx stops sending
             "ledfx_max_fps": 30,        # Maximum FPS for rate limiting
+            "ledfx_min_changed_pixels": 1,  # Skip frames with fewer changed pixels
+            "ledfx_min_channel_delta": 0,   # Per-channel change needed to count a pixel
+            "ledfx_keyframe_interval": 60,  # Frames between forced full frames
         }
 
     async def async_load_settings(self) -> None:
@@ -82,8 +191,21 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             self.text_settings.update(data)
 
     async def async_save_settings(self) -> None:
-        """Save settings to storage."""
-        await self._store.async_save(self.text_settings)
+        """Schedule saving the settings to storage.
+
+        Saves within SETTINGS_SAVE_DELAY are coalesced into one write. Home
+        Assistant writes a pending save on shutdown, unloading calls
+        async_flush_settings().
+        """
+        self._store.async_delay_save(self._settings_to_save, SETTINGS_SAVE_DELAY)
+
+    async def async_flush_settings(self) -> None:
+        """Write the settings to storage now, replacing a pending save."""
+        await self._store.async_save(self._settings_to_save())
+
+    def _settings_to_save(self) -> dict:
+        """Return a snapshot of the persisted settings."""
+        return dict(self.text_settings)
 
     # --- LedFx Gateway Methods ---
     
@@ -100,12 +222,70 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         return {
             "running": False,
             "fps": 0.0,
+            "target_fps": 0.0,
+            "send_time_ms": 0.0,
             "frames_received": 0,
             "frames_sent": 0,
             "frames_skipped": 0,
+            "frames_superseded": 0,
+            "frames_incomplete": 0,
+            "frames_torn": 0,
+            "skip_reasons": {},
+            "keyframes_sent": 0,
+            "tiles": max(1, len(self.text_settings.get("ledfx_tiles", []))),
+            "tiles_skipped": 0,
+            "delta_frames_sent": 0,
+            "bytes_sent": 0,
+            "png_bytes_uncorrected": 0,
+            "png_bytes_corrected": 0,
+            "color_size_saving_pct": 0.0,
+            "ddp_frames": 0,
+            "dmx_frames": 0,
+            "dmx_frames_incomplete": 0,
             "port": self.text_settings.get("ledfx_port", 21324),
+            "ddp_port": self.text_settings.get("ledfx_ddp_port", 4048),
+            "latency_ms": {},
+            "capturing": False,
+            "realtime": False,
+            "idle_timeout": self.text_settings.get("ledfx_idle_timeout", 2.5),
+            "idle_count": 0,
+            "e131_enabled": self.text_settings.get("ledfx_e131_enabled", False),
+            "artnet_enabled": self.text_settings.get("ledfx_artnet_enabled", False),
+            "start_universe": self.text_settings.get("ledfx_start_universe", 1),
+            "source_size": "",
         }
     
+    def apply_ledfx_color_correction(self) -> None:
+        """Push the color correction settings to the running gateway."""
+        if self._ledfx_gateway:
+            self._ledfx_gateway.set_color_correction(
+                gamma=self.text_settings.get("ledfx_gamma", 1.0),
+                white_balance=self.text_settings.get("ledfx_white_balance", [255, 255, 255]),
+                black_level=self.text_settings.get("ledfx_black_level", 0),
+            )
+
+    def _ledfx_tiles(self) -> Optional[list[tuple[Optional[str], int, int]]]:
+        """Return the tiled wall layout for the gateway, None for a single panel."""
+        tiles = self.text_settings.get("ledfx_tiles", [])
+        if not tiles:
+            return None
+        own_address = self.entry.data[CONF_MAC].upper()
+        return [
+            (
+                None if tile.get("address", own_address).upper() == own_address else tile["address"],
+                int(tile["column"]),
+                int(tile["row"]),
+            )
+            for tile in tiles
+        ]
+
+    async def async_set_ledfx_wall(self, tiles: list[dict]) -> None:
+        """Store the tiled wall layout and restart a running gateway."""
+        self.text_settings["ledfx_tiles"] = tiles
+        await self.async_save_settings()
+        if self.text_settings.get("ledfx_enabled", False):
+            await self.async_restart_ledfx_gateway()
+
     async def async_start_ledfx_gateway(self) -> bool:
         """Start the LedFx gateway."""
         from .ledfx_gateway import LedFxGateway
@@ -125,8 +305,27 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             host="0.0.0.0",
             port=port,
             screen_size=screen_size,
+            keyframe_interval=self.text_settings.get("ledfx_keyframe_interval", 60),
+            ddp_port=self.text_settings.get("ledfx_ddp_port", 4048),
+            e131_enabled=self.text_settings.get("ledfx_e131_enabled", False),
+            artnet_enabled=self.text_settings.get("ledfx_artnet_enabled", False),
+            start_universe=self.text_settings.get("ledfx_start_universe", 1),
+            channels_per_universe=self.text_settings.get("ledfx_channels_per_universe", 510),
+            source_width=self.text_settings.get("ledfx_source_width", 0) or None,
+            source_height=self.text_settings.get("ledfx_source_height", 0) or None,
+            serpentine=self.text_settings.get("ledfx_serpentine", False),
+            rotation=self.text_settings.get("ledfx_rotation", 0),
+            mirror_x=self.text_settings.get("ledfx_mirror_x", False),
+            mirror_y=self.text_settings.get("ledfx_mirror_y", False),
+            tiles=self._ledfx_tiles(),
+            idle_timeout=self.text_settings.get("ledfx_idle_timeout", 2.5),
         )
         self._ledfx_gateway.set_max_fps(max_fps)
+        self._ledfx_gateway.set_change_threshold(
+            self.text_settings.get("ledfx_min_changed_pixels", 1),
+            self.text_settings.get("ledfx_min_channel_delta", 0),
+        )
+        self.apply_ledfx_color_correction()
         
         # Enter DIY mode on the display
         try:
@@ -159,94 +358,604 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         await self.async_stop_ledfx_gateway()
         return await self.async_start_ledfx_gateway()
     
+    async def async_ledfx_idle(self) -> None:
+        """Called by the gateway when LedFx stopped sending."""
+        if self.text_settings.get("ledfx_idle_restore", True):
+            # Text or clock from before realtime mode, the gateway re-enters
+            # DIY mode when data returns
+            await self.async_update_device()
+
     async def async_restore_ledfx_state(self) -> None:
         """Restore LedFx gateway state on startup (if it was enabled)."""
         if self.text_settings.get("ledfx_enabled", False):
             _LOGGER.info("Restoring LedFx gateway state...")
             await self.async_start_ledfx_gateway()
 
+    async def async_start_ledfx_capture(self, path: str) -> bool:
+        """Record the datagrams received by the running LedFx gateway to a file."""
+        if not (self._ledfx_gateway and self._ledfx_gateway.is_running):
+            return False
+        await self._ledfx_gateway.start_capture(path)
+        return True
+
+    async def async_stop_ledfx_capture(self) -> Optional[dict]:
+        """Finish the LedFx capture file, returns its path and size."""
+        if self._ledfx_gateway:
+            return await self._ledfx_gateway.stop_capture()
+        return None
+
+    # --- Scene Methods ---
+
+    async def async_load_scenes(self) -> None:
+        """Load the stored scenes and compile their bundles in the background."""
+        self.scenes = await self._scenes_store.async_load() or {}
+        if self.scenes:
+            self.hass.async_create_task(self._async_compile_scenes())
+
+    async def _async_compile_scenes(self) -> None:
+        """Compile the bundles of all scenes that have none yet."""
+        for name, settings in list(self.scenes.items()):
+            if name not in self._scene_bundles:
+                try:
+                    bundle = await self.hass.async_add_executor_job(self._build_scene_bundle, settings)
+                except Exception as e:
+                    _LOGGER.warning(f"Could not compile scene {name}: {e}")
+                    continue
+                # The scene may have been replaced or deleted meanwhile
+                if self.scenes.get(name) is settings:
+                    self._scene_bundles[name] = bundle
+
+    def _build_scene_bundle(self, settings: dict) -> bytes:
+        """Compile scene settings into one command burst: brightness, then the content. Blocking."""
+        brightness = max(5, min(100, int((settings.get("brightness", 128) / 255) * 100)))
+        packets = [Common().buildBrightness(brightness), *self._build_configuration(settings)]
+        return bytes(b"".join(packets))
+
+    async def async_save_scene(self, name: str) -> None:
+        """Capture the current display settings as a scene and compile it."""
+        settings = {key: self.text_settings[key] for key in SCENE_SETTINGS if key in self.text_settings}
+        bundle = await self.hass.async_add_executor_job(self._build_scene_bundle, settings)
+        self.scenes[name] = settings
+        self._scene_bundles[name] = bundle
+        self._scenes_store.async_delay_save(lambda: self.scenes, SETTINGS_SAVE_DELAY)
+        _LOGGER.debug(f"Saved scene {name} ({len(bundle)} bytes)")
+
+    async def async_recall_scene(self, name: str) -> bool:
+        """Show a scene with its pre-built bundle, returns False if it does not exist."""
+        settings = self.scenes.get(name)
+        if settings is None:
+            return False
+        bundle = self._scene_bundles.get(name)
+        if bundle is None:
+            bundle = await self.hass.async_add_executor_job(self._build_scene_bundle, settings)
+            self._scene_bundles[name] = bundle
+
+        # The scene replaces whatever was about to be shown
+        await self.async_stop_fun_text()
+        await self.async_cancel_device_update()
+        self.text_settings.update(settings)
+        async with self._render_lock:
+            conn = ConnectionManager()
+            await conn.connect()
+            await conn.send(data=bundle)
+        self.async_set_updated_data(self.data)
+        await self.async_save_settings()
+        return True
+
+    async def async_delete_scene(self, name: str) -> bool:
+        """Forget a scene, returns False if it does not exist."""
+        if self.scenes.pop(name, None) is None:
+            return False
+        self._scene_bundles.pop(name, None)
+        self._scenes_store.async_delay_save(lambda: self.scenes, SETTINGS_SAVE_DELAY)
+        return True
+
+    # --- Playlist Methods ---
+
+    async def async_start_playlist(
+        self, items: list[dict], interval: float = DEFAULT_PLAYLIST_INTERVAL, repeat: bool = True
+    ) -> None:
+        """Rotate through items, replacing a running playlist.
+
+        Items are dicts with one of "text", "clock", "image" (a file path) or
+        "scene" (a scene name), an optional "duration" in seconds and optional
+        "settings" overriding the current text settings for that item.
+        """
+        for item in items:
+            if "scene" in item and item["scene"] not in self.scenes:
+                raise ValueError(f"Unknown scene {item['scene']}")
+        await self.async_stop_playlist()
+        self._playlist_task = self.hass.async_create_task(
+            self._async_run_playlist([dict(item) for item in items], interval, repeat)
+        )
+
+    async def async_stop_playlist(self) -> None:
+        """Cancel a running playlist."""
+        if self._playlist_task and not self._playlist_task.done():
+            self._playlist_task.cancel()
+            try:
+                await self._playlist_task
+            except asyncio.CancelledError:
+                pass
+        self._playlist_task = None
+
+    async def _async_run_playlist(self, items: list[dict], interval: float, repeat: bool) -> None:
+        """Show every item on its deadline, rendering the next one while the current one shows.
+
+        Deadlines are taken from the start, so send times do not add up. A
+        transfer is started early by its estimated duration so that it
+        completes on the deadline, the difference is reported as slip.
+        """
+        loop = asyncio.get_running_loop()
+        stats = self.playlist_stats = {
+            "running": True,
+            "items": len(items),
+            "item": 0,
+            "shown": 0,
+            "failed": 0,
+            "reanchored": 0,
+            "last_slip_ms": 0.0,
+            "max_slip_ms": 0.0,
+            "mean_slip_ms": 0.0,
+        }
+        slips = 0.0
+
+        def prepare(index: int) -> asyncio.Future:
+            # Everything the loop may change is looked up here, the job only renders
+            item = items[index]
+            settings = dict(self.text_settings)
+            scene = bundle = None
+            if "scene" in item:
+                scene = dict(self.scenes.get(item["scene"]) or {})
+                bundle = self._scene_bundles.get(item["scene"])
+            return self.hass.async_add_executor_job(
+                self._build_playlist_item, item, settings, scene, bundle, self.media_library
+            )
+
+        index = 0
+        pending = prepare(index)
+        deadline = None
+        try:
+            while True:
+                item = items[index]
+                try:
+                    packets, response = await pending
+                except Exception as e:
+                    _LOGGER.warning(f"Playlist item {index} could not be rendered: {e}")
+                    packets, response = [], False
+                    stats["failed"] += 1
+                size = sum(len(packet) for packet in packets)
+                transfer = self._transfer_time(packets)
+                if deadline is None:
+                    # The first item is shown as soon as it is ready
+                    deadline = loop.time() + transfer
+                elif loop.time() + transfer > deadline + item.get("duration", interval):
+                    # More than one item behind, skip ahead instead of rushing the backlog
+                    deadline = loop.time() + transfer
+                    stats["reanchored"] += 1
+
+                # Look ahead: render the next item while this one waits and shows
+                next_index = index + 1
+                if next_index == len(items):
+                    next_index = 0 if repeat else None
+                if next_index is not None:
+                    pending = prepare(next_index)
+
+                if packets:
+                    wait = deadline - transfer - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    started = loop.time()
+                    async with self._render_lock:
+                        conn = ConnectionManager()
+                        await conn.connect()
+                        for packet in packets:
+                            await conn.send(data=packet, response=response)
+                    finished = loop.time()
+                    self._learn_transfer_time(packets, size, finished - started)
+
+                    slip = (finished - deadline) * 1000
+                    slips += abs(slip)
+                    stats["shown"] += 1
+                    stats["last_slip_ms"] = round(slip, 1)
+                    stats["max_slip_ms"] = round(max(stats["max_slip_ms"], abs(slip)), 1)
+                    stats["mean_slip_ms"] = round(slips / stats["shown"], 1)
+                stats["item"] = index
+                self.async_update_listeners()
+
+                if next_index is None:
+                    # Keep the schedule of the last item before reporting the end
+                    await asyncio.sleep(max(deadline + item.get("duration", interval) - loop.time(), 0))
+                    break
+                deadline += item.get("duration", interval)
+                index = next_index
+        finally:
+            # A look-ahead render that is never shown must not log an unretrieved error
+            pending.add_done_callback(lambda future: future.cancelled() or future.exception())
+            stats["running"] = False
+            self.async_update_listeners()
+        _LOGGER.debug(f"Playlist finished: {stats}")
+
+    def _transfer_time(self, packets: list[bytes]) -> float:
+        """Estimate how long sending packets takes."""
+        return len(packets) * self._packet_time + sum(len(packet) for packet in packets) * self._byte_time
+
+    def _learn_transfer_time(self, packets: list[bytes], size: int, elapsed: float) -> None:
+        """Refine the transfer time estimate with a measured send."""
+        if size < len(packets) * 256:
+            # Small packets fit a write or two, their time is the fixed cost
+            self._packet_time = 0.7 * self._packet_time + 0.3 * elapsed / len(packets)
+        else:
+            per_byte = max(elapsed - len(packets) * self._packet_time, 0) / size
+            self._byte_time = 0.7 * self._byte_time + 0.3 * per_byte
+
+    def _build_playlist_item(
+        self,
+        item: dict,
+        settings: dict,
+        scene: Optional[dict],
+        bundle: Optional[bytes],
+        library: "MediaLibrary",
+    ) -> tuple[list[bytes], bool]:
+        """Render a playlist item into its packets and whether they need a response. Blocking.
+
+        The scene and its compiled bundle (for scene items) and the media
+        library are resolved on the event loop by the caller.
+        """
+        settings = {**settings, **item.get("settings", {})}
+        if "scene" in item:
+            if bundle is None:
+                if not scene:
+                    raise ValueError(f"Scene {item['scene']} was deleted")
+                bundle = self._build_scene_bundle(scene)
+            return [bundle], False
+        if "image" in item:
+            kind, data = library.load(
+                item["image"], int(settings.get("screen_size", 32)), self._gif_max_bytes(settings)
+            )
+            if kind == "gif":
+                from .client.modules.gif import Gif
+
+                return Gif().buildPayloads(data), True
+            return [IDMImage().buildMode(1), IDMImage().buildPayloads(data)], False
+        # Text, or the clock without text
+        settings["current_text"] = item.get("text", "")
+        return self._build_configuration(settings), False
+
+    # --- Font Catalog Methods ---
+
+    @property
+    def font_catalog(self) -> "FontCatalog":
+        """Return the font catalog shared by all iDotMatrix devices."""
+        catalog = self.hass.data.get(DATA_FONT_CATALOG)
+        if catalog is None:
+            from .client.modules.fontCatalog import FontCatalog
+
+            catalog = FontCatalog(
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts"),
+                self.hass.config.path(STORAGE_DIR, FONT_CATALOG_FILE),
+            )
+            self.hass.data[DATA_FONT_CATALOG] = catalog
+        return catalog
+
+    async def async_load_font_catalog(self) -> None:
+        """Index the bundled fonts once, unchanged fonts come from the stored index."""
+        if not self.font_catalog.loaded:
+            await self.hass.async_add_executor_job(self.font_catalog.build)
+
+    # --- Media Library Methods ---
+
+    @property
+    def media_library(self) -> "MediaLibrary":
+        """Return the media library shared by all iDotMatrix devices."""
+        library = self.hass.data.get(DATA_MEDIA_LIBRARY)
+        if library is None:
+            from .client.modules.mediaLibrary import MediaLibrary
+
+            library = MediaLibrary(self.hass.config.path(STORAGE_DIR, MEDIA_CACHE_DIR))
+            self.hass.data[DATA_MEDIA_LIBRARY] = library
+        return library
+
+    def _media_progress(self, done: int, total: int, path: str) -> None:
+        """Record and announce media library progress (runs in the event loop)."""
+        self.media_progress = {"done": done, "total": total, "file": path}
+        self.hass.bus.async_fire(EVENT_MEDIA_PROGRESS, {**self.media_progress, "entry_id": self.entry.entry_id})
+
+    def _gif_max_bytes(self, settings: Optional[dict] = None) -> Optional[int]:
+        """Return the byte budget of converted GIFs, None when there is none."""
+        max_kb = (settings or self.text_settings).get("gif_max_kb", 0)
+        return int(max_kb * 1024) if max_kb else None
+
+    async def async_preprocess_media(
+        self,
+        folder: str,
+        screen_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        max_kb: Optional[float] = None,
+    ) -> dict:
+        """Convert every changed file of a media folder for this panel size."""
+        size = int(screen_size or self.text_settings.get("screen_size", 32))
+        max_bytes = (
+            self._gif_max_bytes({"gif_max_kb": max_kb}) if max_kb is not None else self._gif_max_bytes()
+        )
+
+        def progress(done: int, total: int, path: str) -> None:
+            self.hass.loop.call_soon_threadsafe(self._media_progress, done, total, path)
+
+        result = await self.hass.async_add_executor_job(
+            self.media_library.process, folder, size, workers, progress, max_bytes
+        )
+        _LOGGER.info(f"Media library {folder} ({size}x{size}): {result}")
+        return result
+
+    async def async_upload_media(self, file_path: str) -> None:
+        """Show an image or animation, using the pre-processed payload when available."""
+        size = int(self.text_settings.get("screen_size", 32))
+        kind, data = await self.hass.async_add_executor_job(
+            self.media_library.load, file_path, size, self._gif_max_bytes()
+        )
+        await self.media_library.upload(kind, data)
+
     async def _async_update_data(self):
         """Fetch data from the device."""
         return {"connected": True}
 
+    def async_schedule_device_update(self) -> None:
+        """Request a device update, coalesced with other changes.
+
+        Changes within the update window, and changes arriving while a render
+        runs, end up in a single render with the latest settings.
+        """
+        self._update_requested = True
+        if self._update_task is None or self._update_task.done():
+            self._update_task = self.hass.async_create_task(self._async_run_device_updates())
+
+    async def _async_run_device_updates(self) -> None:
+        """Render until no change is left over."""
+        while self._update_requested:
+            await asyncio.sleep(self.text_settings.get("update_debounce", DEFAULT_UPDATE_DEBOUNCE))
+            self._update_requested = False
+            try:
+                await self.async_update_device()
+            except Exception as e:
+                _LOGGER.error(f"Failed to update device: {e}")
+
+    async def async_cancel_device_update(self) -> None:
+        """Drop a pending device update, e.g. on unload."""
+        self._update_requested = False
+        if self._update_task and not self._update_task.done():
+            self._update_task.cancel()
+            try:
+                await self._update_task
+            except asyncio.CancelledError:
+                pass
+        self._update_task = None
+
     async def async_update_device(self) -> None:
-        """Send current configuration to the device."""
-        text = self.text_settings.get("current_text", "")
-        settings = self.text_settings
+        """Send current configuration to the device right away."""
+        # One render at a time, scheduled or direct
+        async with self._render_lock:
+            await self._async_send_configuration()
+
+    async def _async_send_configuration(self) -> None:
+        """Render the current text or clock and upload it."""
+        settings = dict(self.text_settings)
+        packets = await self.hass.async_add_executor_job(self._build_configuration, settings)
+        conn = ConnectionManager()
+        await conn.connect()
+        for packet in packets:
+            await conn.send(data=packet)
+
+        # Notify listeners to update UI states
+        self.async_set_updated_data(self.data)
         
+        # Save persistence
+        await self.async_save_settings()
+
+    def _build_configuration(self, settings: dict) -> list[bytearray]:
+        """Render the text, or the clock without text, into the packets to send. Blocking."""
+        text = settings.get("current_text", "")
         if text:
-            # Render Text
             if settings.get("multiline", False):
-                await self._set_multiline_text(text, settings)
-            else:
-                # Standard Scroller
-                await Text().setMode(
-                    text=text,
-                    font_size=int(settings.get("font_size", 10)), 
-                    font_path=settings.get("font"),
-                    text_mode=settings.get("animation_mode", 1),
-                    speed=settings.get("speed", 80),
-                    text_color_mode=settings.get("color_mode", 1),
-                    text_color=tuple(settings.get("color", (255, 0, 0))),
-                    text_bg_mode=0,
-                    text_bg_color=(0, 0, 0),
-                    spacing=settings.get("spacing", 1),
-                    proportional=settings.get("proportional", True)
-                )
-        else:
-            # Render Clock (Default fallback)
-            # Use self.text_settings for clock config
-            # Retrieve color and format
-            c = settings.get("color", [255, 0, 0])
-            h24 = settings.get("clock_format", "24h") == "24h"
-            
-            style = settings.get("clock_style", 0)
-            show_date = settings.get("clock_date", True)
-            
-                
-            await Clock().setMode(
-                style=style,
-                visibleDate=show_date,
-                hour24=h24,
+                # Text wrapped as an image
+                png = self._render_multiline_png(text, settings)
+                return [IDMImage().buildMode(1), IDMImage().buildPayloads(png)]
+            # Standard Scroller
+            return [self._build_text_packet(text, settings)]
+
+        # Render Clock (Default fallback)
+        c = settings.get("color", [255, 0, 0])
+        style = settings.get("clock_style", 0)
+        return [
+            Clock().buildMode(
+                style=style if style in range(0, 8) else 0,
+                visibleDate=settings.get("clock_date", True),
+                hour24=settings.get("clock_format", "24h") == "24h",
                 r=c[0],
                 g=c[1],
-                b=c[2]
+                b=c[2],
             )
-            
-        # Notify listeners to update UI states
-        self.async_set_updated_data(self.data)
-        
-        # Save persistence
-        await self.async_save_settings()
+        ]
 
-    async def _set_multiline_text(self, text: str, settings: dict) -> None:
-        """Generate an image from text and upload it."""
-        screen_size = int(settings.get("screen_size", 32))
+    def _render_font(self, text: str, settings: dict) -> Optional[str]:
+        """Return the font to render a text with, falling back to one that has its glyphs."""
         font_name = settings.get("font")
+        if font_name and os.path.isabs(font_name):
+            return font_name
+        return self.font_catalog.fallback(self.font_catalog.resolve(font_name), text)
+
+    def _text_options(self, text: str, settings: dict) -> dict:
+        """Return the Text module arguments for a text and settings. Blocking, may compile a glyph atlas."""
+        font_name = self._render_font(text, settings)
+        font_entry = self.font_catalog.get(font_name)
+        atlas = None
+        if font_entry and font_entry["pixel_size"]:
+            # Bitmap fonts are composed from their glyph atlas, scalable fonts keep
+            # Pillow's per character placement
+            atlas = self.font_catalog.atlas(font_name)
+        return {
+            "text": text,
+            "font_size": int(settings.get("font_size", 10)),
+            "font_path": self.font_catalog.path(font_name),
+            "text_mode": settings.get("animation_mode", 1),
+            "speed": settings.get("speed", 80),
+            "text_color_mode": settings.get("color_mode", 1),
+            "text_color": tuple(settings.get("color", (255, 0, 0))),
+            "text_bg_mode": 0,
+            "text_bg_color": (0, 0, 0),
+            "spacing": settings.get("spacing", 1),
+            "proportional": settings.get("proportional", True),
+            "atlas": atlas,
+        }
+
+    async def async_play_fun_text(self, text: str) -> None:
+        """Show text word by word in random colors, replacing a running sequence."""
+        await self.async_stop_fun_text()
+        self._fun_text_task = self.hass.async_create_task(self._async_fun_text_sequence(text))
+
+    async def async_stop_fun_text(self) -> None:
+        """Cancel a running Fun Text sequence."""
+        if self._fun_text_task and not self._fun_text_task.done():
+            self._fun_text_task.cancel()
+            try:
+                await self._fun_text_task
+            except asyncio.CancelledError:
+                pass
+        self._fun_text_task = None
+
+    async def _async_fun_text_sequence(self, text: str) -> None:
+        """Pre-render every word, then send one per fun_text_delay."""
+        settings = dict(self.text_settings)
+        words = text.split()
+        colors = [random.choice(FUN_TEXT_PALETTE) for _ in words]
+        packets = await self.hass.async_add_executor_job(
+            self._build_fun_text_packets, words, colors, settings
+        )
+
+        conn = ConnectionManager()
+        await conn.connect()
+        if settings.get("multiline", False):
+            async with self._render_lock:
+                await IDMImage().setMode(1)
+
+        # Deadlines are taken from the start, so send times do not add up
+        delay = float(settings.get("fun_text_delay", 0.4))
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        lateness = 0.0
+        for index, packet in enumerate(packets):
+            wait = start + index * delay - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            elif wait < -delay:
+                # A send took longer than a word lasts, skip ahead instead of rushing the backlog
+                start = loop.time() - index * delay
+            lateness = max(lateness, loop.time() - (start + index * delay))
+            async with self._render_lock:
+                await conn.send(data=packet)
+        _LOGGER.debug(f"Fun Text played {len(packets)} words, max lateness {lateness * 1000:.1f} ms")
+
+    def _build_fun_text_packets(
+        self, words: list[str], colors: list[list[int]], settings: dict
+    ) -> list[bytearray]:
+        """Render the packet of every word. Blocking."""
+        packets = []
+        for word, color in zip(words, colors):
+            word_settings = {**settings, "color": color}
+            if settings.get("multiline", False):
+                png = self._render_multiline_png(word, word_settings)
+                packets.append(IDMImage().buildPayloads(png))
+            else:
+                packets.append(self._build_text_packet(word, word_settings))
+        return packets
+
+    def _build_text_packet(self, text: str, settings: dict) -> bytearray:
+        """Render the scrolling text packet. Blocking."""
+        return Text().buildPacket(**self._text_options(text, settings))
+
+    @staticmethod
+    def _wrap_words(words: list[str], word_width, space_width: int, screen_size: int) -> list[list[str]]:
+        """Break words into lines that fit the screen width, a word too wide gets its own line."""
+        lines = []
+        current_line = []
+        current_line_width = 0
+        for word in words:
+            width = word_width(word)
+            if current_line_width + width <= screen_size:
+                current_line.append(word)
+                current_line_width += width + space_width
+            else:
+                if current_line:
+                    lines.append(current_line)
+                current_line = [word]
+                current_line_width = width + space_width
+        if current_line:
+            lines.append(current_line)
+        return lines
+
+    def _render_multiline_atlas(self, text: str, settings: dict, atlas: "GlyphAtlas") -> bytes:
+        """Render wrapped text with a bitmap font from its glyph atlas as a PNG. Blocking."""
+        screen_size = int(settings.get("screen_size", 32))
+        color = bytes(settings.get("color", (255, 0, 0)))
+        spacing = int(settings.get("spacing", 1))
+        spacing_y = int(settings.get("spacing_y", 1))
+        autosize = settings.get("autosize", False)
+
+        space_width = max(atlas.charWidth(" ") + spacing, 1)
+        lines = self._wrap_words(
+            text.split(" "), lambda word: atlas.textWidth(word, spacing), space_width, screen_size
+        )
+        line_height = atlas.line_height + spacing_y
+
+        # Same layout as the Pillow renderer, centered when autosizing
+        mask = bytearray(screen_size * screen_size)
+        y = max((screen_size - len(lines) * line_height) // 2, 0) if autosize else 0
+        for line_words in lines:
+            if y >= screen_size:
+                break
+            line_w = sum(atlas.textWidth(word, spacing) for word in line_words)
+            line_w += space_width * (len(line_words) - 1)
+            x = max((screen_size - line_w) // 2, 0) if autosize else 0
+            for i, word in enumerate(line_words):
+                for char in word:
+                    if x >= screen_size:
+                        break
+                    x += atlas.drawChar(mask, screen_size, screen_size, x, y, char) + spacing
+                if i < len(line_words) - 1:
+                    x += space_width
+            y += line_height
+
+        black = bytes(3)
+        pixels = b"".join(color if pixel else black for pixel in mask)
+        return IDMImage().encodeRgb(screen_size, screen_size, pixels)
+
+    def _render_multiline_png(self, text: str, settings: dict) -> bytes:
+        """Render text wrapped into lines as a PNG for the device. Blocking."""
+        screen_size = int(settings.get("screen_size", 32))
+        font_name = self._render_font(text, settings)
         color = tuple(settings.get("color", (255, 0, 0)))
         spacing = int(settings.get("spacing", 1))
         spacing_y = int(settings.get("spacing_y", 1))
         blur = int(settings.get("blur", 5))
         
-        # Resolve font path
-        # Note: __file__ here is coordinator.py, so we need to adjust path logic
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        fonts_dir = os.path.join(base_path, "fonts")
-        font_path = os.path.join(fonts_dir, "Rain-DRM3.otf")
-        
-        if font_name:
-            if not os.path.isabs(font_name):
-                 potential = os.path.join(fonts_dir, font_name)
-                 if os.path.exists(potential):
-                     font_path = potential
-            elif os.path.exists(font_name):
-                font_path = font_name
-                
+        font_path = self.font_catalog.path(font_name)
+        font_entry = self.font_catalog.get(font_name)
+        if font_entry and font_entry["pixel_size"]:
+            # Bitmap fonts are composed from their glyph atlas, without Pillow
+            atlas = self.font_catalog.atlas(font_name)
+            if atlas is not None:
+                return self._render_multiline_atlas(text, settings, atlas)
+
+        from PIL import Image, ImageDraw, ImageFont
+
         # Determine font size and max scanning range if autosize is on
         initial_font_size = int(settings.get("font_size", 10))
         target_font_size = initial_font_size
         
-        if settings.get("autosize", False):
+        if font_entry and font_entry["pixel_size"]:
+            # Bitmap fonts only come in their native size, a single pass is enough
+            start_size = end_size = font_entry["pixel_size"]
+        elif settings.get("autosize", False):
             # Start from user's size or 32, whichever is reasonable, and shrink until fit
             # Or always start large? Let's start from current size and shrink, 
             # OR start from 32 (max) to find biggest possible fit? "Perfectly" usually means "Maximize".
@@ -258,25 +967,19 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             start_size = initial_font_size
             end_size = initial_font_size
 
-        font_path_to_use = font_path
-
         # Iterative resizing loop
         for s in range(start_size, end_size - 1, -1):
             target_font_size = s
             try:
-                if font_path_to_use.lower().endswith(".bdf"):
-                     font = ImageFont.load(font_path_to_use)
-                     # BDF fonts are fixed size, autosize won't work well unless we pick different files.
-                     # For now, skip autosize on BDF or just use it as is.
+                if font_entry and font_entry["pixel_size"]:
+                     font = ImageFont.load(font_path)
                 else:
-                     font = ImageFont.truetype(font_path_to_use, s)
+                     font = ImageFont.truetype(font_path, s)
             except:
                 font = ImageFont.load_default()
 
             # Pixel-based Word Wrapping (Simulated for check)
             words = text.split(' ')
-            lines = []
-            current_line = []
             
             def get_word_width(word):
                 if not word: return 0
@@ -296,22 +999,7 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             space_width = space_w + spacing
             if space_width < 1: space_width = 1
             
-            current_line_width = 0
-            
-            for word in words:
-                word_width = get_word_width(word)
-                if current_line_width + word_width <= screen_size:
-                    current_line.append(word)
-                    current_line_width += word_width + space_width
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = []
-                        current_line_width = 0
-                    current_line.append(word)
-                    current_line_width = word_width + space_width
-            if current_line:
-                lines.append(current_line)
+            lines = self._wrap_words(words, get_word_width, space_width, screen_size)
             
             # Check Height
             ascent, descent = font.getmetrics()
@@ -372,13 +1060,6 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         colored_text = Image.new("RGB", (screen_size, screen_size), color)
         final_image.paste(colored_text, mask=a)
         
-        image = final_image
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            image.save(tmp.name)
-            tmp_path = tmp.name
-        try:
-            await IDMImage().setMode(1)
-            await IDMImage().uploadProcessed(tmp_path, pixel_size=screen_size)
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        buffer = io.BytesIO()
+        final_image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
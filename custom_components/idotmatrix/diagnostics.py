@@ -0,0 +1,28 @@
+"""Diagnostics support for iDotMatrix."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_MAC
+
+# The address of every wall panel is kept in the ledfx_tiles setting
+TO_REDACT = {CONF_MAC, "address"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "settings": async_redact_data(dict(coordinator.text_settings), TO_REDACT),
+        # Includes the rolling per-stage latency percentiles of the gateway
+        "ledfx": coordinator.ledfx_stats,
+        # Schedule keeping of the running or last playlist
+        "playlist": coordinator.playlist_stats,
+    }
@@ -0,0 +1,112 @@
+"""Recording of the datagrams received by the LedFx Gateway.
+
+A capture file starts with CAPTURE_MAGIC, followed by one record per
+datagram: a RECORD_HEADER (source, microseconds since the previous
+datagram, length) and the datagram itself.
+"""
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from typing import Iterator, Optional
+
+CAPTURE_MAGIC = b"IDMCAP1\n"
+RECORD_HEADER = struct.Struct("<BIH")
+
+# Source ids stored in the records
+CAPTURE_WLED = 0
+CAPTURE_DDP = 1
+CAPTURE_E131 = 2
+CAPTURE_ARTNET = 3
+CAPTURE_SOURCES = ("wled", "ddp", "e131", "artnet")
+
+
+class CaptureWriter:
+    """Buffers datagrams in memory, the file is written in chunks.
+
+    add() and take() are called from the event loop, open(), write() and
+    close() are blocking and belong in an executor.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the writer.
+
+        Args:
+            path: Capture file, created or truncated by open()
+        """
+        self.path = path
+        self.datagrams = 0
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._last: Optional[float] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes."""
+        return len(self._buffer)
+
+    def add(self, source: int, data: bytes, now: Optional[float] = None) -> None:
+        """Buffer one datagram."""
+        now = time.monotonic() if now is None else now
+        delta = 0 if self._last is None else int((now - self._last) * 1_000_000)
+        self._last = now
+        self._buffer += RECORD_HEADER.pack(source, min(delta, 0xFFFFFFFF), len(data))
+        self._buffer += data
+        self.datagrams += 1
+
+    def take(self) -> bytes:
+        """Return and clear the buffered records."""
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
+
+    def open(self) -> None:
+        """Create the capture file. Blocking."""
+        with self._lock:
+            self._file = open(self.path, "wb")
+            self._file.write(CAPTURE_MAGIC)
+            self.bytes_written = len(CAPTURE_MAGIC)
+
+    def write(self, chunk: bytes) -> None:
+        """Append records to the capture file. Blocking."""
+        with self._lock:
+            if self._file:
+                self._file.write(chunk)
+                self.bytes_written += len(chunk)
+
+    def close(self) -> None:
+        """Close the capture file. Blocking."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def write_capture(path: str, records: list[tuple[int, float, bytes]]) -> None:
+    """Write (source, offset seconds, datagram) records to a capture file. Blocking."""
+    writer = CaptureWriter(path)
+    for source, offset, data in records:
+        writer.add(source, data, offset)
+    writer.open()
+    writer.write(writer.take())
+    writer.close()
+
+
+def read_capture(path: str) -> Iterator[tuple[int, float, bytes]]:
+    """Yield (source, offset seconds, datagram) records of a capture file. Blocking."""
+    with open(path, "rb") as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not a LedFx gateway capture")
+        offset = 0.0
+        while header := file.read(RECORD_HEADER.size):
+            if len(header) < RECORD_HEADER.size:
+                break
+            source, delta, length = RECORD_HEADER.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                break
+            offset += delta / 1_000_000
+            yield source, offset, data
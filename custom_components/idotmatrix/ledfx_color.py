@@ -0,0 +1,58 @@
+"""Color correction for the LedFx Gateway - gamma, white balance and black level."""
+from __future__ import annotations
+
+
+def build_lut(gamma: float, gain: int, black_level: int) -> bytes:
+    """Return a 256 byte translation table for one channel.
+
+    Args:
+        gamma: Gamma exponent (1.0 = linear)
+        gain: Channel maximum for white balance (255 = unchanged)
+        black_level: Values at or below this become 0
+    """
+    lut = bytearray(256)
+    for value in range(black_level + 1 if black_level else 1, 256):
+        lut[value] = min(255, round(gain * (value / 255) ** gamma))
+    return bytes(lut)
+
+
+class ColorCorrection:
+    """Per-channel lookup tables applied to whole RGB frames.
+
+    Besides matching the panel's response, the black level cutoff zeroes the
+    low-intensity noise of audio effects, which compresses much better.
+    """
+
+    def __init__(
+        self,
+        gamma: float = 1.0,
+        white_balance: tuple[int, int, int] = (255, 255, 255),
+        black_level: int = 0,
+    ):
+        """Initialize the correction.
+
+        Args:
+            gamma: Gamma exponent (1.0 = linear)
+            white_balance: Maximum of the red, green and blue channel
+            black_level: Channel values at or below this become 0
+        """
+        self.gamma = gamma
+        self.white_balance = tuple(white_balance)
+        self.black_level = black_level
+
+        self._luts = tuple(build_lut(gamma, gain, black_level) for gain in self.white_balance)
+        self.is_identity = all(lut == bytes(range(256)) for lut in self._luts)
+        # One translate over the whole frame when all channels share a table
+        self._shared = self._luts[0] if len(set(self._luts)) == 1 else None
+
+    def apply(self, frame: bytes) -> bytes:
+        """Return the corrected RGB frame."""
+        if self.is_identity:
+            return frame
+        if self._shared is not None:
+            return frame.translate(self._shared)
+
+        corrected = bytearray(len(frame))
+        for channel, lut in enumerate(self._luts):
+            corrected[channel::3] = frame[channel::3].translate(lut)
+        return bytes(corrected)
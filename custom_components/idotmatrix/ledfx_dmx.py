@@ -0,0 +1,195 @@
+"""E1.31 (sACN) and Art-Net support for the LedFx Gateway."""
+from __future__ import annotations
+
+import math
+import time
+from typing import Optional
+
+# E1.31 (sACN) Protocol Constants
+E131_PORT = 5568
+E131_ACN_ID = b"ASC-E1.17\x00\x00\x00"
+E131_VECTOR_ROOT_DATA = 0x00000004
+E131_VECTOR_ROOT_EXTENDED = 0x00000008
+E131_VECTOR_FRAMING_DATA = 0x00000002
+E131_VECTOR_EXTENDED_SYNC = 0x00000001
+E131_OPTION_PREVIEW = 0x80
+E131_OPTION_TERMINATED = 0x40
+E131_DATA_OFFSET = 126  # First DMX slot after the start code
+E131_MIN_DATA_LEN = 126
+E131_SYNC_LEN = 49
+
+# Art-Net Protocol Constants
+ARTNET_PORT = 6454
+ARTNET_ID = b"Art-Net\x00"
+ARTNET_OP_DMX = 0x5000
+ARTNET_OP_SYNC = 0x5200
+ARTNET_HEADER_LEN = 18
+# Art-Net falls back to immediate output when no ArtSync came for this long
+ARTNET_SYNC_TIMEOUT = 4.0
+
+# Source kinds, used by the assembler for sync handling
+SOURCE_E131 = "e131"
+SOURCE_ARTNET = "artnet"
+
+
+def e131_multicast_group(universe: int) -> str:
+    """Return the multicast group an E1.31 universe is sent to."""
+    return f"239.255.{(universe >> 8) & 0xFF}.{universe & 0xFF}"
+
+
+def parse_e131(data: bytes) -> Optional[tuple]:
+    """Parse an E1.31 packet.
+
+    Returns ("data", universe, sync_address, dmx_slots) for data packets,
+    ("sync", sync_address) for synchronization packets, or None.
+    """
+    if len(data) < E131_SYNC_LEN - 1 or data[4:16] != E131_ACN_ID:
+        return None
+
+    root_vector = int.from_bytes(data[18:22], "big")
+    framing_vector = int.from_bytes(data[40:44], "big")
+
+    if root_vector == E131_VECTOR_ROOT_EXTENDED and framing_vector == E131_VECTOR_EXTENDED_SYNC:
+        return ("sync", int.from_bytes(data[45:47], "big"))
+
+    if root_vector != E131_VECTOR_ROOT_DATA or framing_vector != E131_VECTOR_FRAMING_DATA:
+        return None
+    if len(data) < E131_MIN_DATA_LEN or data[125] != 0:
+        # Only the default (dimmer) start code carries pixel data
+        return None
+    if data[112] & (E131_OPTION_PREVIEW | E131_OPTION_TERMINATED):
+        return None
+
+    sync_address = int.from_bytes(data[109:111], "big")
+    universe = int.from_bytes(data[113:115], "big")
+    slot_count = int.from_bytes(data[123:125], "big") - 1
+    slots = memoryview(data)[E131_DATA_OFFSET:E131_DATA_OFFSET + max(0, slot_count)]
+    return ("data", universe, sync_address, slots)
+
+
+def parse_artnet(data: bytes) -> Optional[tuple]:
+    """Parse an Art-Net packet.
+
+    Returns ("data", universe, 0, dmx_slots) for ArtDmx, ("sync", 0) for
+    ArtSync, or None. Art-Net has no sync addresses, an ArtSync releases
+    every universe, so both report address 0.
+    """
+    if len(data) < 10 or data[:8] != ARTNET_ID:
+        return None
+
+    opcode = int.from_bytes(data[8:10], "little")
+    if opcode == ARTNET_OP_SYNC:
+        return ("sync", 0)
+    if opcode != ARTNET_OP_DMX or len(data) < ARTNET_HEADER_LEN:
+        return None
+
+    # 15-bit port address: Net (7 bits) + SubNet/Universe (8 bits)
+    universe = ((data[15] & 0x7F) << 8) | data[14]
+    length = int.from_bytes(data[16:18], "big")
+    slots = memoryview(data)[ARTNET_HEADER_LEN:ARTNET_HEADER_LEN + length]
+    return ("data", universe, 0, slots)
+
+
+class DmxFrameAssembler:
+    """Maps DMX universes onto the pixel buffer and assembles whole frames.
+
+    Universe ``start_universe`` holds pixels 0..n-1, the next one n..2n-1 and so
+    on, with n = channels_per_universe // 3. Without synchronization a frame is
+    complete once every universe of the panel arrived; with E1.31 sync
+    addresses or ArtSync the frame is only complete on the sync packet, so one
+    whole frame is sent per sync instead of one per universe.
+    """
+
+    def __init__(
+        self,
+        num_pixels: int,
+        start_universe: int = 1,
+        channels_per_universe: int = 510,
+    ):
+        """Initialize the assembler.
+
+        Args:
+            num_pixels: Number of pixels in the buffer
+            start_universe: Universe holding the first pixel
+            channels_per_universe: DMX channels used per universe (3 per pixel)
+        """
+        self.num_pixels = num_pixels
+        self.start_universe = start_universe
+        self.pixels_per_universe = max(1, min(512, channels_per_universe) // 3)
+        self.universe_count = math.ceil(num_pixels / self.pixels_per_universe)
+
+        self._received: set[int] = set()
+        self._sync_address = 0
+        self._artnet_sync_seen = 0.0
+        self.frames_incomplete = 0
+
+    @property
+    def universes(self) -> range:
+        """Return the universes mapped onto the buffer."""
+        return range(self.start_universe, self.start_universe + self.universe_count)
+
+    def pixel_offset(self, universe: int) -> Optional[int]:
+        """Return the first pixel of a universe, or None if it is not mapped."""
+        index = universe - self.start_universe
+        if 0 <= index < self.universe_count:
+            return index * self.pixels_per_universe
+        return None
+
+    def apply(self, buffer: bytearray, universe: int, slots: memoryview) -> bool:
+        """Copy a universe into the buffer.
+
+        Returns True if the universe is mapped onto the buffer.
+        """
+        offset = self.pixel_offset(universe)
+        if offset is None:
+            return False
+
+        start = offset * 3
+        length = min(
+            len(slots) // 3 * 3,
+            self.pixels_per_universe * 3,
+            len(buffer) - start,
+        )
+        if length > 0:
+            buffer[start:start + length] = slots[:length]
+        return True
+
+    def on_data(self, source: str, universe: int, sync_address: int) -> bool:
+        """Record a received universe.
+
+        Returns True if the frame is complete and should be sent now.
+        """
+        if universe in self._received:
+            # Next frame started before the previous one was complete
+            self.frames_incomplete += 1
+            self._received.clear()
+        self._received.add(universe)
+        self._sync_address = sync_address
+
+        if self._synchronized(source, sync_address):
+            return False
+        if len(self._received) >= self.universe_count:
+            self._received.clear()
+            return True
+        return False
+
+    def on_sync(self, source: str, sync_address: int) -> bool:
+        """Handle a sync packet.
+
+        Only a sync for the address the received universes wait for releases
+        the frame, syncs meant for other universes are ignored.
+
+        Returns True if the frame is complete and should be sent now.
+        """
+        if source == SOURCE_ARTNET:
+            self._artnet_sync_seen = time.monotonic()
+        if not self._received or sync_address != self._sync_address:
+            return False
+        self._received.clear()
+        return True
+
+    def _synchronized(self, source: str, sync_address: int) -> bool:
+        """Return True if the source releases frames with sync packets."""
+        if source == SOURCE_E131:
+            return sync_address != 0
+        return time.monotonic() - self._artnet_sync_seen < ARTNET_SYNC_TIMEOUT
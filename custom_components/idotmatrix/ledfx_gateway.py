@@ -2,13 +2,36 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 import io
-import hashlib
+import logging
+import socket
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, TYPE_CHECKING
 
-from PIL import Image
+from PIL import Image, ImageChops
+
+from .client.modules.frameDelta import FrameDelta
+from .ledfx_capture import (
+    CAPTURE_ARTNET,
+    CAPTURE_DDP,
+    CAPTURE_E131,
+    CAPTURE_WLED,
+    CaptureWriter,
+)
+from .ledfx_color import ColorCorrection
+from .ledfx_mapping import PixelMapper, tile_slices
+from .ledfx_dmx import (
+    ARTNET_PORT,
+    E131_PORT,
+    SOURCE_ARTNET,
+    SOURCE_E131,
+    DmxFrameAssembler,
+    e131_multicast_group,
+    parse_artnet,
+    parse_e131,
+)
 
 if TYPE_CHECKING:
     from .coordinator import IDotMatrixCoordinator
@@ -19,6 +42,32 @@ _LOGGER = logging.getLogger(__name__)
 WLED_DRGB = 2  # DRGB protocol (timeout, R, G, B, R, G, B, ...)
 WLED_DRGBW = 3  # DRGBW protocol
 WLED_DNRGB = 4  # DNRGB protocol (timeout, start_idx_high, start_idx_low, R, G, B, ...)
+WLED_TIMEOUT_NONE = 255  # Timeout byte value: stay in realtime mode until stopped
+
+# Realtime mode ends after this many seconds without datagrams, unless the
+# WLED timeout byte says otherwise (DDP, E1.31 and Art-Net carry no timeout)
+DEFAULT_IDLE_TIMEOUT = 2.5
+# Poll interval of the idle watchdog while no timeout is running
+IDLE_CHECK_INTERVAL = 1.0
+
+# A DNRGB frame still missing pixels after this long is dropped as incomplete
+FRAME_ASSEMBLY_TIMEOUT = 0.1
+
+# Every Nth corrected frame is also PNG-encoded uncorrected to measure the size effect
+COLOR_SAMPLE_INTERVAL = 30
+
+# Buffered capture data is written to disk in chunks of about this size
+CAPTURE_FLUSH_BYTES = 64 * 1024
+
+# DDP Protocol Constants (http://www.3waylabs.com/ddp/)
+DDP_PORT = 4048
+DDP_HEADER_LEN = 10
+DDP_FLAG_VERSION_MASK = 0xC0
+DDP_FLAG_VERSION_1 = 0x40
+DDP_FLAG_TIMECODE = 0x10  # 4 extra header bytes
+DDP_FLAG_QUERY = 0x02
+DDP_FLAG_PUSH = 0x01  # Last packet of a frame, display now
+DDP_ID_CONTROL = 246  # IDs 246..254 are control/config/status, not pixel data
 
 
 class LedFxGateway:
@@ -30,6 +79,21 @@ class LedFxGateway:
         host: str = "0.0.0.0",
         port: int = 21324,
         screen_size: int = 32,
+        keyframe_interval: int = 60,
+        ddp_port: Optional[int] = DDP_PORT,
+        e131_enabled: bool = False,
+        artnet_enabled: bool = False,
+        start_universe: int = 1,
+        channels_per_universe: int = 510,
+        source_width: Optional[int] = None,
+        source_height: Optional[int] = None,
+        serpentine: bool = False,
+        rotation: int = 0,
+        mirror_x: bool = False,
+        mirror_y: bool = False,
+        connection=None,
+        tiles: Optional[list[tuple[Optional[str], int, int]]] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
     ):
         """Initialize the LedFx Gateway.
         
@@ -38,32 +102,159 @@ class LedFxGateway:
             host: Host to bind UDP server to
             port: Port to listen on (default 21324 for WLED)
             screen_size: Size of the display (16, 32, or 64)
+            keyframe_interval: Frames between forced full PNG frames when sending pixel deltas
+            ddp_port: Port for the DDP listener (default 4048, None disables it)
+            e131_enabled: Listen for E1.31 (sACN) on port 5568
+            artnet_enabled: Listen for Art-Net on port 6454
+            start_universe: DMX universe holding the first pixel
+            channels_per_universe: DMX channels used per universe (510 = 170 pixels)
+            source_width: Width of the LedFx matrix (None = screen_size)
+            source_height: Height of the LedFx matrix (None = screen_size)
+            serpentine: Odd rows of the source run right to left
+            rotation: Clockwise rotation of the source in degrees (0, 90, 180, 270)
+            mirror_x: Mirror the source horizontally
+            mirror_y: Mirror the source vertically
+            connection: Object with async connect() and send(data) used instead of
+                the ConnectionManager, e.g. a simulated link for replays
+            tiles: Panels of a tiled wall as (address, column, row), each panel
+                screen_size pixels square; address None is this device. None
+                drives a single panel.
+            idle_timeout: Seconds without datagrams before the gateway goes
+                idle (0 = never), used when the sender sets no timeout
         """
         self.coordinator = coordinator
         self.host = host
         self.port = port
+        self.ddp_port = ddp_port
+        self.e131_enabled = e131_enabled
+        self.artnet_enabled = artnet_enabled
         self.screen_size = screen_size
+
+        # Panels the frame is sent to, a wall is sliced into one tile per panel
+        if tiles:
+            self.wall_width = (max(column for _, column, _ in tiles) + 1) * screen_size
+            self.wall_height = (max(row for _, _, row in tiles) + 1) * screen_size
+            self._outputs = [
+                PanelOutput(
+                    screen_size,
+                    keyframe_interval,
+                    tile_slices(self.wall_width, screen_size, column, row),
+                    address,
+                    None if address else connection,
+                )
+                for address, column, row in tiles
+            ]
+        else:
+            self.wall_width = self.wall_height = screen_size
+            self._outputs = [PanelOutput(screen_size, keyframe_interval, connection=connection)]
+
+        # Source layout to display mapping, precomputed once per configuration.
+        # The pixel buffer holds frames in the source geometry.
+        self._mapper = PixelMapper(
+            source_width or self.wall_width,
+            source_height or self.wall_height,
+            self.wall_width,
+            self.wall_height,
+            serpentine=serpentine,
+            rotation=rotation,
+            mirror_x=mirror_x,
+            mirror_y=mirror_y,
+        )
+        source_pixels = self._mapper.source_pixels
+        self._color = ColorCorrection()
         
         self._server: Optional[asyncio.DatagramProtocol] = None
         self._transport: Optional[asyncio.DatagramTransport] = None
+        # Listeners for the additional protocols (DDP, E1.31, Art-Net)
+        self._extra_transports: list[asyncio.DatagramTransport] = []
         self._running = False
-        self._task: Optional[asyncio.Task] = None
+        self._tasks: list[asyncio.Task] = []
+
+        # Receive -> encode -> transmit: frames are encoded in a worker thread
+        # while the previous one is on the air. The one-slot queue holds the
+        # encoded frame waiting for the radio, _slot_free tells the encoder it
+        # may take the next frame from the mailbox.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._slot_free: Optional[asyncio.Event] = None
+
+        # Realtime timeout: after _realtime_timeout seconds (0 = never)
+        # without datagrams the gateway goes idle and stops sending until
+        # data returns, the watchdog starts with the first datagram. Frames
+        # wait for _ready while the panels re-enter DIY mode, _send_lock
+        # keeps sends and idle transitions apart.
+        self.idle_timeout = max(0.0, float(idle_timeout))
+        self._realtime_timeout = self.idle_timeout
+        self._last_datagram = 0.0
+        self._idle = False
+        self._idle_count = 0
+        # Wakes the watchdog when the timeout changes while it sleeps
+        self._timeout_changed: Optional[asyncio.Event] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._send_lock: Optional[asyncio.Lock] = None
+        self._resume_task: Optional[asyncio.Task] = None
+
+        # Datagram recording, see start_capture()
+        self._capture: Optional[CaptureWriter] = None
+        self._capture_write: Optional[asyncio.Future] = None
+
+        # One-slot mailbox between receive and send: newer frames overwrite
+        # older ones, a single consumer task always sends the freshest frame
+        self._pending_frame: Optional[bytes] = None
+        self._frame_event: Optional[asyncio.Event] = None
+        # Monotonic receive time of the first datagram of the frame being
+        # built, and (received, published) of the frame in the mailbox
+        self._frame_received_at: Optional[float] = None
+        self._pending_times: tuple[float, float] = (0.0, 0.0)
+
+        # DNRGB frame assembly: pixel ranges covered by the current frame
+        self._covered: list[tuple[int, int]] = []
+        self._last_start_idx = -1
+        self._frame_started = 0.0
+        # Pixel count of sources smaller than the panel, learned from start index wraps
+        self._frame_extent: Optional[int] = None
+
+        # E1.31 / Art-Net universe mapping and multi-universe assembly
+        self._dmx = DmxFrameAssembler(
+            source_pixels, start_universe, channels_per_universe
+        )
         
         # Frame buffer and optimization
-        self._pixel_buffer = bytearray(screen_size * screen_size * 3)
-        self._last_frame_hash: Optional[str] = None
+        self._pixel_buffer = bytearray(source_pixels * 3)
         self._frame_count = 0
         self._last_fps_time = time.time()
         self._fps = 0.0
         
-        # Rate limiting
+        # Rate limiting, adapted to what the BLE link sustains
         self._last_send_time = 0.0
-        self._min_frame_interval = 0.033  # ~30 FPS max by default
+        self._fps_controller = AdaptiveFpsController(max_fps=30.0)  # ~30 FPS max by default
+        # Rolling per-stage latencies of sent frames
+        self._latency = LatencyTracker()
+
+        # Perceptual frame skipping: a pixel only counts as changed if one of its
+        # channels moved by more than _min_channel_delta, and a frame is only sent
+        # if at least _min_changed_pixels pixels changed (1/0 = exact duplicates only)
+        self._min_changed_pixels = 1
+        self._min_channel_delta = 0
         
         # Statistics
         self._frames_received = 0
         self._frames_sent = 0
         self._frames_skipped = 0
+        self._frames_superseded = 0
+        self._frames_incomplete = 0
+        self._frames_torn = 0
+        self._ddp_frames = 0
+        self._dmx_frames = 0
+        self._skip_reasons = {"superseded": 0, "duplicate": 0, "below_threshold": 0}
+        self._keyframes_sent = 0
+        self._tiles_skipped = 0
+        self._delta_frames_sent = 0
+        self._bytes_sent = 0
+        # PNG sizes of sampled frames with and without color correction
+        self._color_frames = 0
+        self._png_bytes_uncorrected = 0
+        self._png_bytes_corrected = 0
 
     @property
     def is_running(self) -> bool:
@@ -75,24 +266,100 @@ class LedFxGateway:
         """Return current FPS."""
         return self._fps
 
+    @property
+    def target_fps(self) -> float:
+        """Return the FPS the gateway currently aims for."""
+        return self._fps_controller.target_fps
+
     @property
     def stats(self) -> dict:
         """Return gateway statistics."""
         return {
             "running": self._running,
             "fps": round(self._fps, 1),
+            "target_fps": round(self._fps_controller.target_fps, 1),
+            "send_time_ms": round(self._fps_controller.frame_time * 1000, 1),
             "frames_received": self._frames_received,
             "frames_sent": self._frames_sent,
             "frames_skipped": self._frames_skipped,
+            "frames_superseded": self._frames_superseded,
+            "frames_incomplete": self._frames_incomplete,
+            "frames_torn": self._frames_torn,
+            "skip_reasons": dict(self._skip_reasons),
+            "keyframes_sent": self._keyframes_sent,
+            "tiles": len(self._outputs),
+            "tiles_skipped": self._tiles_skipped,
+            "delta_frames_sent": self._delta_frames_sent,
+            "bytes_sent": self._bytes_sent,
+            "png_bytes_uncorrected": self._png_bytes_uncorrected,
+            "png_bytes_corrected": self._png_bytes_corrected,
+            "color_size_saving_pct": (
+                round(100 * (1 - self._png_bytes_corrected / self._png_bytes_uncorrected), 1)
+                if self._png_bytes_uncorrected else 0.0
+            ),
+            "ddp_frames": self._ddp_frames,
+            "dmx_frames": self._dmx_frames,
+            "dmx_frames_incomplete": self._dmx.frames_incomplete,
             "port": self.port,
+            "ddp_port": self.ddp_port,
+            "latency_ms": self._latency.percentiles(),
+            "capturing": self._capture is not None,
+            "realtime": self._running and not self._idle,
+            "idle_timeout": self._realtime_timeout,
+            "idle_count": self._idle_count,
+            "e131_enabled": self.e131_enabled,
+            "artnet_enabled": self.artnet_enabled,
+            "start_universe": self._dmx.start_universe,
+            "source_size": f"{self._mapper.source_width}x{self._mapper.source_height}",
         }
 
     def set_max_fps(self, max_fps: float) -> None:
-        """Set maximum FPS (rate limiting)."""
-        if max_fps > 0:
-            self._min_frame_interval = 1.0 / max_fps
-        else:
-            self._min_frame_interval = 0.0
+        """Set maximum FPS (rate limiting), the adaptive target never exceeds it."""
+        self._fps_controller.set_max_fps(max_fps)
+
+    def set_change_threshold(self, min_changed_pixels: int, min_channel_delta: int) -> None:
+        """Set when a frame counts as changed enough to be sent.
+
+        Args:
+            min_changed_pixels: Minimum number of changed pixels (1 = any change)
+            min_channel_delta: Per-channel difference a pixel must exceed to count as changed
+        """
+        self._min_changed_pixels = max(1, int(min_changed_pixels))
+        self._min_channel_delta = max(0, min(254, int(min_channel_delta)))
+
+    def set_idle_timeout(self, idle_timeout: float) -> None:
+        """Set the seconds without datagrams before the panels are released (0 = never)."""
+        self.idle_timeout = max(0.0, float(idle_timeout))
+        self._set_realtime_timeout(self.idle_timeout)
+
+    def _set_realtime_timeout(self, timeout: float) -> None:
+        """Set the timeout in effect and wake the watchdog if it changed."""
+        if timeout != self._realtime_timeout:
+            self._realtime_timeout = timeout
+            if self._timeout_changed:
+                self._timeout_changed.set()
+
+    def set_color_correction(
+        self,
+        gamma: float = 1.0,
+        white_balance: tuple[int, int, int] = (255, 255, 255),
+        black_level: int = 0,
+    ) -> None:
+        """Set the gamma, white balance and black level applied before encoding.
+
+        Args:
+            gamma: Gamma exponent (1.0 = linear)
+            white_balance: Maximum of the red, green and blue channel
+            black_level: Channel values at or below this become 0
+        """
+        self._color = ColorCorrection(
+            max(0.1, float(gamma)),
+            tuple(max(0, min(255, int(gain))) for gain in white_balance),
+            max(0, min(254, int(black_level))),
+        )
+        self._color_frames = 0
+        self._png_bytes_uncorrected = 0
+        self._png_bytes_corrected = 0
 
     async def start(self) -> bool:
         """Start the UDP gateway server."""
@@ -108,10 +375,46 @@ class LedFxGateway:
                 lambda: LedFxProtocol(self._on_data_received),
                 local_addr=(self.host, self.port),
             )
+
+            # Additional protocols are optional: a busy port must not take
+            # the WLED listener down
+            if self.ddp_port:
+                await self._start_listener("DDP", self.ddp_port, self._on_ddp_received)
+            if self.e131_enabled:
+                transport = await self._start_listener("E1.31", E131_PORT, self._on_e131_received)
+                if transport:
+                    self._join_e131_groups(transport)
+            if self.artnet_enabled:
+                await self._start_listener("Art-Net", ARTNET_PORT, self._on_artnet_received)
             
             self._running = True
             self._last_fps_time = time.time()
             self._frame_count = 0
+            self._pending_frame = None
+            self._frame_received_at = None
+            self._latency.clear()
+            self._frame_event = asyncio.Event()
+            for output in self._outputs:
+                output.reset()
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idotmatrix_ledfx")
+            self._send_queue = asyncio.Queue(maxsize=1)
+            self._slot_free = asyncio.Event()
+            self._slot_free.set()
+            self._idle = False
+            self._last_datagram = 0.0
+            self._timeout_changed = asyncio.Event()
+            self._ready = asyncio.Event()
+            self._ready.set()
+            self._send_lock = asyncio.Lock()
+            self._tasks = [
+                loop.create_task(self._encoder_loop()),
+                loop.create_task(self._transmit_loop()),
+                loop.create_task(self._idle_loop()),
+            ]
+            # The coordinator puts its own device into DIY mode
+            others = [output for output in self._outputs if output.address]
+            if others:
+                self._tasks.append(loop.create_task(self._prepare_panels(others)))
             
             _LOGGER.info(f"LedFx Gateway started on {self.host}:{self.port}")
             return True
@@ -120,17 +423,101 @@ class LedFxGateway:
             _LOGGER.error(f"Failed to start LedFx Gateway: {e}")
             return False
 
+    async def _start_listener(
+        self, name: str, port: int, callback: Callable[[bytes], None]
+    ) -> Optional[asyncio.DatagramTransport]:
+        """Bind an additional protocol listener, returns None if the port is unavailable."""
+        try:
+            transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: LedFxProtocol(callback),
+                local_addr=(self.host, port),
+            )
+        except OSError as e:
+            _LOGGER.warning(f"Could not start {name} listener on port {port}: {e}")
+            return None
+        self._extra_transports.append(transport)
+        _LOGGER.info(f"LedFx Gateway {name} listener on {self.host}:{port}")
+        return transport
+
+    def _join_e131_groups(self, transport: asyncio.DatagramTransport) -> None:
+        """Join the multicast groups of the mapped universes, unicast works regardless."""
+        sock = transport.get_extra_info("socket")
+        if sock is None:
+            return
+        for universe in self._dmx.universes:
+            group = e131_multicast_group(universe)
+            try:
+                sock.setsockopt(
+                    socket.IPPROTO_IP,
+                    socket.IP_ADD_MEMBERSHIP,
+                    socket.inet_aton(group) + socket.inet_aton("0.0.0.0"),
+                )
+            except OSError as e:
+                _LOGGER.debug(f"Could not join E1.31 multicast group {group}: {e}")
+
+    async def start_capture(self, path: str) -> None:
+        """Record every received datagram with its timestamp to a capture file.
+
+        Args:
+            path: Capture file, replaced if it exists
+        """
+        await self.stop_capture()
+        writer = CaptureWriter(path)
+        await asyncio.get_running_loop().run_in_executor(None, writer.open)
+        self._capture = writer
+        self._capture_write = None
+        _LOGGER.info(f"LedFx Gateway capturing datagrams to {path}")
+
+    async def stop_capture(self) -> Optional[dict]:
+        """Finish the capture file, returns its path, datagram and byte counts."""
+        writer = self._capture
+        if writer is None:
+            return None
+        self._capture = None
+
+        loop = asyncio.get_running_loop()
+        if self._capture_write:
+            await self._capture_write
+            self._capture_write = None
+        await loop.run_in_executor(None, writer.write, writer.take())
+        await loop.run_in_executor(None, writer.close)
+        _LOGGER.info(f"LedFx Gateway captured {writer.datagrams} datagrams to {writer.path}")
+        return {"path": writer.path, "datagrams": writer.datagrams, "bytes": writer.bytes_written}
+
     async def stop(self) -> None:
         """Stop the UDP gateway server."""
         if not self._running:
             return
 
         self._running = False
+        await self.stop_capture()
         
         if self._transport:
             self._transport.close()
             self._transport = None
             self._server = None
+        for transport in self._extra_transports:
+            transport.close()
+        self._extra_transports = []
+
+        if self._resume_task:
+            self._tasks.append(self._resume_task)
+            self._resume_task = None
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        # The wall's other panels are only connected while the gateway runs
+        await self._disconnect_panels([output for output in self._outputs if output.address])
+        self._pending_frame = None
 
         _LOGGER.info("LedFx Gateway stopped")
 
@@ -139,37 +526,233 @@ class LedFxGateway:
         if not self._running:
             return
             
-        self._frames_received += 1
+        self._mark_received(CAPTURE_WLED, data)
         
-        # Schedule async processing
-        asyncio.create_task(self._process_frame(data))
+        # Decode synchronously into the pixel buffer, complete frames are
+        # handed to the sender through the mailbox
+        self._process_frame(data)
+
+    def _on_ddp_received(self, data: bytes) -> None:
+        """Handle received DDP data (called from protocol)."""
+        if not self._running:
+            return
+
+        self._mark_received(CAPTURE_DDP, data)
+        self._process_ddp(data)
 
-    async def _process_frame(self, data: bytes) -> None:
+    def _on_e131_received(self, data: bytes) -> None:
+        """Handle received E1.31 data (called from protocol)."""
+        if not self._running:
+            return
+
+        self._mark_received(CAPTURE_E131, data)
+        self._process_dmx(SOURCE_E131, parse_e131(data))
+
+    def _on_artnet_received(self, data: bytes) -> None:
+        """Handle received Art-Net data (called from protocol)."""
+        if not self._running:
+            return
+
+        self._mark_received(CAPTURE_ARTNET, data)
+        self._process_dmx(SOURCE_ARTNET, parse_artnet(data))
+
+    def _mark_received(self, source: int, data: bytes) -> None:
+        """Count a datagram and remember when the current frame started arriving."""
+        now = time.monotonic()
+        self._frames_received += 1
+        if self._frame_received_at is None:
+            self._frame_received_at = now
+
+        self._last_datagram = now
+        if source == CAPTURE_WLED and len(data) > 1:
+            self._set_realtime_timeout(self._wled_timeout(data[1]))
+        else:
+            self._set_realtime_timeout(self.idle_timeout)
+        if self._idle:
+            # Data is back: the panels re-enter DIY mode while this frame is encoded
+            self._idle = False
+            self._resume_task = asyncio.get_running_loop().create_task(self._resume())
+
+        if self._capture:
+            self._capture.add(source, data, now)
+            if self._capture.pending >= CAPTURE_FLUSH_BYTES and (
+                self._capture_write is None or self._capture_write.done()
+            ):
+                # One write at a time keeps the chunks in order
+                self._capture_write = asyncio.get_running_loop().run_in_executor(
+                    None, self._capture.write, self._capture.take()
+                )
+
+    def _publish_frame(self) -> None:
+        """Put a snapshot of the pixel buffer into the mailbox and wake the sender."""
+        if self._pending_frame is not None:
+            # The sender never picked up the previous frame, it is stale now
+            self._frames_superseded += 1
+            self._frames_skipped += 1
+            self._skip_reasons["superseded"] += 1
+        self._pending_frame = bytes(self._pixel_buffer)
+        published = time.monotonic()
+        self._pending_times = (self._frame_received_at or published, published)
+        self._frame_received_at = None
+        if self._frame_event:
+            self._frame_event.set()
+
+    async def _encoder_loop(self) -> None:
+        """Encode the freshest frame from the mailbox in the worker thread."""
+        loop = asyncio.get_running_loop()
+        while self._running:
+            # Double buffering: prepare the next frame as soon as the transmit
+            # stage took the previous one, so it is ready when the radio is
+            await self._slot_free.wait()
+            await self._frame_event.wait()
+            self._frame_event.clear()
+
+            frame = self._pending_frame
+            self._pending_frame = None
+            if frame is None:
+                continue
+
+            times = self._pending_times + (time.monotonic(),)
+            encoded, counts = await loop.run_in_executor(self._executor, self._encode_frame, frame)
+            if encoded:
+                self._slot_free.clear()
+                await self._send_queue.put((encoded, counts, times + (time.monotonic(),)))
+            else:
+                self._count_encoded(counts)
+
+    async def _transmit_loop(self) -> None:
+        """Send encoded frames, one at a time."""
+        while self._running:
+            # Rate limiting: wait out the interval before taking the next
+            # frame, the encoder keeps replacing it with fresher ones meanwhile
+            delay = self._last_send_time + self._fps_controller.frame_interval - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            encoded, counts, times = await self._send_queue.get()
+            self._slot_free.set()
+            self._count_encoded(counts)
+            # After an idle period, wait until the panels are back in DIY mode
+            await self._ready.wait()
+            async with self._send_lock:
+                # Drop tiles encoded against a frame their panel never showed
+                encoded = [
+                    (output, kind, payload)
+                    for output, generation, kind, payload in encoded
+                    if generation == output.generation
+                ]
+                if encoded:
+                    await self._transmit_frame(encoded, times)
+
+    def _wled_timeout(self, value: int) -> float:
+        """Return the realtime timeout in seconds for a WLED timeout byte."""
+        if value == WLED_TIMEOUT_NONE:
+            return 0.0
+        # 0 leaves the timeout to the receiver
+        return float(value) if value else self.idle_timeout
+
+    async def _idle_loop(self) -> None:
+        """Watchdog ending realtime mode when the sender stopped."""
+        while self._running:
+            self._timeout_changed.clear()
+            timeout = self._realtime_timeout
+            if self._idle or not timeout or not self._last_datagram:
+                # Nothing to time out before LedFx sent its first datagram
+                await self._wait_timeout_change(IDLE_CHECK_INTERVAL)
+                continue
+            remaining = self._last_datagram + timeout - time.monotonic()
+            if remaining > 0:
+                await self._wait_timeout_change(remaining)
+            else:
+                await self._enter_idle(timeout)
+
+    async def _wait_timeout_change(self, delay: float) -> None:
+        """Sleep for delay seconds or until the timeout changes."""
+        try:
+            await asyncio.wait_for(self._timeout_changed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _enter_idle(self, timeout: float) -> None:
+        """Stop sending, restore the previous content and release the panels."""
+        self._idle = True
+        async with self._send_lock:
+            if not self._idle:
+                # Data came back while the last frame was sent
+                return
+            _LOGGER.info(f"LedFx Gateway idle: no data for {timeout:.1f}s")
+            self._idle_count += 1
+            self._ready.clear()
+            self._pending_frame = None
+            for output in self._outputs:
+                # The panel shows other content now, start over with a keyframe
+                output.generation += 1
+            if self.coordinator:
+                try:
+                    await self.coordinator.async_ledfx_idle()
+                except Exception as e:
+                    _LOGGER.warning(f"Could not restore content after LedFx stopped: {e}")
+            await self._disconnect_panels(self._outputs)
+
+    async def _resume(self) -> None:
+        """Put the panels back into DIY mode and let frames through again."""
+        async with self._send_lock:
+            if self._idle or self._ready.is_set():
+                return
+            _LOGGER.info("LedFx Gateway resuming realtime mode")
+            await self._prepare_panels(self._outputs)
+            self._ready.set()
+
+    def _correct_frame(self, frame: bytes, counts: dict) -> bytes:
+        """Apply the color correction, sampling its effect on the PNG size into counts."""
+        corrected = self._color.apply(frame)
+        counts["color_frames"] = 1
+        if self._color_frames % COLOR_SAMPLE_INTERVAL == 0:
+            counts["png_bytes"] = (self._png_size(frame), self._png_size(corrected))
+        return corrected
+
+    def _png_size(self, frame: bytes) -> int:
+        """Return the size of a frame encoded like a keyframe."""
+        buffer = io.BytesIO()
+        Image.frombytes("RGB", (self.wall_width, self.wall_height), frame).save(
+            buffer, format="PNG", optimize=True, compress_level=1
+        )
+        return buffer.tell()
+
+    def _process_frame(self, data: bytes) -> None:
         """Process received WLED protocol frame."""
         if len(data) < 2:
             return
 
         protocol = data[0]
+        # Zero-copy view, pixel payload slices below don't copy the datagram
+        data = memoryview(data)
         
         try:
             if protocol == WLED_DRGB:
                 # DRGB: timeout, R, G, B, R, G, B, ...
-                # timeout = data[1]  # Not used
+                # timeout = data[1], see _mark_received
                 pixel_data = data[2:]
-                await self._update_pixels_rgb(pixel_data)
+                self._update_pixels_rgb(pixel_data)
+                self._reset_assembly()
+                self._publish_frame()
                 
             elif protocol == WLED_DNRGB:
                 # DNRGB: timeout, start_high, start_low, R, G, B, ...
-                # timeout = data[1]  # Not used
+                # timeout = data[1], see _mark_received
                 start_idx = (data[2] << 8) | data[3]
                 pixel_data = data[4:]
-                await self._update_pixels_rgb(pixel_data, start_idx)
+                self._begin_packet(start_idx)
+                count = self._update_pixels_rgb(pixel_data, start_idx)
+                self._end_packet(start_idx, start_idx + count)
                 
             elif protocol == WLED_DRGBW:
                 # DRGBW: timeout, R, G, B, W, R, G, B, W, ...
-                # timeout = data[1]  # Not used
+                # timeout = data[1], see _mark_received
                 pixel_data = data[2:]
-                await self._update_pixels_rgbw(pixel_data)
+                self._update_pixels_rgbw(pixel_data)
+                self._reset_assembly()
+                self._publish_frame()
                 
             else:
                 _LOGGER.debug(f"Unknown WLED protocol: {protocol}")
@@ -177,58 +760,230 @@ class LedFxGateway:
         except Exception as e:
             _LOGGER.debug(f"Error processing frame: {e}")
 
-    async def _update_pixels_rgb(self, pixel_data: bytes, start_idx: int = 0) -> None:
-        """Update pixel buffer with RGB data."""
-        num_pixels = len(pixel_data) // 3
-        
-        for i in range(num_pixels):
-            pixel_idx = start_idx + i
-            if pixel_idx >= self.screen_size * self.screen_size:
-                break
-                
-            buffer_idx = pixel_idx * 3
-            data_idx = i * 3
-            
-            self._pixel_buffer[buffer_idx] = pixel_data[data_idx]      # R
-            self._pixel_buffer[buffer_idx + 1] = pixel_data[data_idx + 1]  # G
-            self._pixel_buffer[buffer_idx + 2] = pixel_data[data_idx + 2]  # B
+    def _process_ddp(self, data: bytes) -> None:
+        """Process a received DDP packet.
+
+        Packets carry a byte offset into the frame, the push flag marks the
+        last packet of a frame, so no assembly heuristics are needed.
+        """
+        if len(data) < DDP_HEADER_LEN:
+            return
 
-        await self._send_frame()
+        flags = data[0]
+        if flags & DDP_FLAG_VERSION_MASK != DDP_FLAG_VERSION_1 or flags & DDP_FLAG_QUERY:
+            return
+        if DDP_ID_CONTROL <= data[3] < 255:
+            return
 
-    async def _update_pixels_rgbw(self, pixel_data: bytes) -> None:
-        """Update pixel buffer with RGBW data (ignoring W channel)."""
-        num_pixels = len(pixel_data) // 4
-        
-        for i in range(num_pixels):
-            if i >= self.screen_size * self.screen_size:
-                break
-                
-            buffer_idx = i * 3
-            data_idx = i * 4
-            
-            self._pixel_buffer[buffer_idx] = pixel_data[data_idx]      # R
-            self._pixel_buffer[buffer_idx + 1] = pixel_data[data_idx + 1]  # G
-            self._pixel_buffer[buffer_idx + 2] = pixel_data[data_idx + 2]  # B
-            # W channel (data_idx + 3) is ignored
+        header_len = DDP_HEADER_LEN + (4 if flags & DDP_FLAG_TIMECODE else 0)
+        offset = int.from_bytes(data[4:8], "big")
+        length = int.from_bytes(data[8:10], "big")
+        pixel_data = memoryview(data)[header_len:header_len + length]
 
-        await self._send_frame()
+        # Byte offsets, clipped to the buffer
+        end = min(offset + len(pixel_data), len(self._pixel_buffer))
+        if end > offset:
+            self._pixel_buffer[offset:end] = pixel_data[:end - offset]
 
-    async def _send_frame(self) -> None:
-        """Send current frame to iDotMatrix display."""
-        current_time = time.time()
-        
-        # Rate limiting
-        if current_time - self._last_send_time < self._min_frame_interval:
-            self._frames_skipped += 1
+        if flags & DDP_FLAG_PUSH:
+            self._ddp_frames += 1
+            self._publish_frame()
+
+    def _process_dmx(self, source: str, packet: Optional[tuple]) -> None:
+        """Process a parsed E1.31 or Art-Net packet.
+
+        Universes are written into the pixel buffer as they arrive, the frame
+        is published on the sync packet or once every universe arrived.
+        """
+        if packet is None:
             return
 
-        # Frame skip optimization - check if frame is identical
-        frame_hash = hashlib.md5(self._pixel_buffer).hexdigest()
-        if frame_hash == self._last_frame_hash:
-            self._frames_skipped += 1
+        if packet[0] == "sync":
+            complete = self._dmx.on_sync(source, packet[1])
+        else:
+            _, universe, sync_address, slots = packet
+            if not self._dmx.apply(self._pixel_buffer, universe, slots):
+                return
+            complete = self._dmx.on_data(source, universe, sync_address)
+
+        if complete:
+            self._dmx_frames += 1
+            self._publish_frame()
+
+    # --- DNRGB frame assembly ---
+
+    def _reset_assembly(self) -> None:
+        """Forget the pixel ranges of the frame being assembled."""
+        self._covered = []
+        self._last_start_idx = -1
+
+    def _merged_coverage(self) -> list[tuple[int, int]]:
+        """Return the covered pixel ranges of the current frame, merged and sorted."""
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(self._covered):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _begin_packet(self, start_idx: int) -> None:
+        """Close the current frame if this packet starts a new one.
+
+        Must run before the packet is written, so a frame completed by the
+        start index wrapping is published without pixels of the next frame.
+        """
+        if not self._covered:
             return
 
-        self._last_frame_hash = frame_hash
+        if time.monotonic() - self._frame_started > FRAME_ASSEMBLY_TIMEOUT:
+            # Packets of the previous frame got lost
+            self._frames_incomplete += 1
+            self._reset_assembly()
+        elif start_idx <= self._last_start_idx:
+            # Start index wrapped: the previous frame is over. If it covered
+            # [0, n) without gaps the source is just smaller than the panel.
+            merged = self._merged_coverage()
+            if len(merged) == 1 and merged[0][0] == 0:
+                self._frame_extent = merged[0][1]
+                self._publish_frame()
+            else:
+                self._frames_torn += 1
+                self._frame_extent = None
+            self._reset_assembly()
+
+    def _end_packet(self, start_idx: int, end_idx: int) -> None:
+        """Record a written packet and publish the frame once it is complete."""
+        if not self._covered:
+            self._frame_started = time.monotonic()
+        self._covered.append((start_idx, end_idx))
+        self._last_start_idx = start_idx
+
+        target = self._frame_extent or self._mapper.source_pixels
+        merged = self._merged_coverage()
+        if merged[0][0] == 0 and merged[0][1] >= target:
+            self._publish_frame()
+            self._reset_assembly()
+
+    def _update_pixels_rgb(self, pixel_data: bytes, start_idx: int = 0) -> int:
+        """Update pixel buffer with RGB data.
+
+        Returns the number of pixels written.
+        """
+        buffer_start = start_idx * 3
+        # Whole pixels only, clipped to the end of the buffer
+        length = min(len(pixel_data) // 3 * 3, len(self._pixel_buffer) - buffer_start)
+
+        if length > 0:
+            self._pixel_buffer[buffer_start:buffer_start + length] = memoryview(pixel_data)[:length]
+            return length // 3
+        return 0
+
+    def _update_pixels_rgbw(self, pixel_data: bytes) -> None:
+        """Update pixel buffer with RGBW data (ignoring W channel)."""
+        num_pixels = min(len(pixel_data) // 4, self._mapper.source_pixels)
+        end = num_pixels * 3
+
+        # Strided copies: every 4th byte of R, G and B into every 3rd buffer byte
+        # W channel (offset 3) is dropped. Striding over bytes is much faster
+        # than over a memoryview, so take one contiguous copy first.
+        rgbw = bytes(pixel_data[:num_pixels * 4])
+        self._pixel_buffer[0:end:3] = rgbw[0::4]
+        self._pixel_buffer[1:end:3] = rgbw[1::4]
+        self._pixel_buffer[2:end:3] = rgbw[2::4]
+
+    def _changed_pixels(self, frame: bytes, reference: bytes) -> int:
+        """Count pixels where any channel differs by more than the channel delta."""
+        size = (self.screen_size, self.screen_size)
+        diff = ImageChops.difference(
+            Image.frombytes("RGB", size, frame),
+            Image.frombytes("RGB", size, reference),
+        )
+        # Per-pixel max over the channels, then count everything above the delta
+        r, g, b = diff.split()
+        max_delta = ImageChops.lighter(ImageChops.lighter(r, g), b)
+        return sum(max_delta.histogram()[self._min_channel_delta + 1:])
+
+    def _encode_frame(
+        self, frame: bytes
+    ) -> tuple[list[tuple["PanelOutput", int, str, bytearray]], dict]:
+        """Map, correct and encode a frame. Runs in the worker thread.
+
+        Returns (output, generation, kind, payload) for every panel whose tile
+        changed. Each tile becomes its panel's delta reference, so the payloads
+        must be sent. The statistics counters belong to the event loop, their
+        increments are returned as well and applied by _count_encoded().
+        """
+        counts = {}
+        # Map only frames that are actually encoded, not superseded ones
+        if not self._mapper.is_identity:
+            frame = self._mapper.apply(frame)
+        if not self._color.is_identity:
+            frame = self._correct_frame(frame, counts)
+
+        encoded = []
+        reasons = set()
+        for output in self._outputs:
+            generation = output.generation
+            if generation != output.encoded_generation:
+                # A send failed, the panel state is unknown
+                output.encoded_generation = generation
+                output.delta.reset()
+                output.last_frame = None
+
+            tile = output.crop(frame)
+            # Frame skip optimization - compare against the last encoded tile
+            reason = self._skip_reason(tile, output.last_frame)
+            if reason:
+                reasons.add(reason)
+                continue
+
+            output.last_frame = tile
+            # Pixel delta burst or full PNG frame, whichever is cheaper
+            encoded.append((output, generation, *output.delta.encode(tile)))
+
+        if len(self._outputs) > 1:
+            counts["tiles_skipped"] = len(self._outputs) - len(encoded)
+        if not encoded:
+            counts["skip_reason"] = "below_threshold" if "below_threshold" in reasons else "duplicate"
+        return encoded, counts
+
+    def _count_encoded(self, counts: dict) -> None:
+        """Add the counter increments returned by _encode_frame() to the statistics."""
+        self._tiles_skipped += counts.get("tiles_skipped", 0)
+        if "skip_reason" in counts:
+            self._frames_skipped += 1
+            self._skip_reasons[counts["skip_reason"]] += 1
+        self._color_frames += counts.get("color_frames", 0)
+        if "png_bytes" in counts:
+            uncorrected, corrected = counts["png_bytes"]
+            self._png_bytes_uncorrected += uncorrected
+            self._png_bytes_corrected += corrected
+
+    def _skip_reason(self, tile: bytes, last: Optional[bytes]) -> Optional[str]:
+        """Return why a tile need not be sent, None if it changed enough."""
+        if last is None:
+            return None
+        if tile == last:
+            return "duplicate"
+        if (
+            (self._min_changed_pixels > 1 or self._min_channel_delta > 0)
+            and self._changed_pixels(tile, last) < self._min_changed_pixels
+        ):
+            return "below_threshold"
+        return None
+
+    async def _transmit_frame(
+        self, encoded: list[tuple["PanelOutput", str, bytearray]], times: tuple[float, ...]
+    ) -> None:
+        """Send the encoded tiles of a frame to their panels.
+
+        Panels are sent to concurrently and the next frame waits for the
+        slowest one, which keeps the wall in step. times holds the monotonic
+        received, published, encode start and encode done timestamps.
+        """
+        current_time = time.time()
+        started = time.monotonic()
         self._last_send_time = current_time
 
         # Update FPS counter
@@ -240,37 +995,248 @@ class LedFxGateway:
             self._last_fps_time = current_time
             _LOGGER.debug(f"LedFx Gateway FPS: {self._fps:.1f}")
 
-        try:
-            # Convert pixel buffer to image
-            image = Image.frombytes(
-                "RGB",
-                (self.screen_size, self.screen_size),
-                bytes(self._pixel_buffer),
-            )
+        results = await asyncio.gather(
+            *(self._send_tile(output, payload) for output, _, payload in encoded)
+        )
+        if not any(results):
+            return
 
-            # Compress to PNG with optimization
-            png_buffer = io.BytesIO()
-            image.save(png_buffer, format="PNG", optimize=True, compress_level=1)
-            png_data = png_buffer.getvalue()
+        # Encoding overlaps with the previous send, so the slower of the two
+        # stages bounds the frame rate and drives the adaptive FPS target
+        finished = time.monotonic()
+        encode_start, encode_done = times[2], times[3]
+        self._fps_controller.record(max(finished - started, encode_done - encode_start))
+        self._latency.record(*times, started, finished)
+        self._frames_sent += 1
+        for (_, kind, payload), sent in zip(encoded, results):
+            if not sent:
+                continue
+            self._bytes_sent += len(payload)
+            if kind == "delta":
+                self._delta_frames_sent += 1
+            else:
+                self._keyframes_sent += 1
 
-            # Send to display using the Image module
-            from .client.modules.image import Image as IDMImage
-            from .client.connectionManager import ConnectionManager
-            
-            # Ensure we're in DIY mode and send the image
-            idm_image = IDMImage()
-            
-            # Create payloads from PNG data
-            payloads = idm_image._createPayloads(png_data)
-            
-            conn = ConnectionManager()
+    async def _send_tile(self, output: "PanelOutput", payload: bytearray) -> bool:
+        """Send one panel's payload, returns True on success."""
+        try:
+            conn = output.get_connection()
             if conn:
                 await conn.connect()
-                await conn.send(data=payloads)
-                self._frames_sent += 1
-                
+                if await conn.send(data=payload):
+                    return True
         except Exception as e:
             _LOGGER.debug(f"Error sending frame to display: {e}")
+        # Device state unknown, start over with a keyframe
+        output.generation += 1
+        return False
+
+    async def _prepare_panels(self, outputs: list["PanelOutput"]) -> None:
+        """Put panels into DIY mode."""
+        from .client.modules.image import Image as IDMImage
+
+        async def prepare(output: PanelOutput) -> None:
+            image = IDMImage()
+            image.conn = output.get_connection()
+            if not await image.setMode(1):
+                _LOGGER.warning(f"Could not enter DIY mode on {output.address or 'this device'}")
+
+        await asyncio.gather(*(prepare(output) for output in outputs))
+
+    async def _disconnect_panels(self, outputs: list["PanelOutput"]) -> None:
+        """Release the Bluetooth connections of panels."""
+        for output in outputs:
+            try:
+                await output.get_connection().disconnect()
+            except Exception as e:
+                _LOGGER.debug(f"Error disconnecting panel {output.address}: {e}")
+
+
+class PanelOutput:
+    """One panel the gateway sends to: its connection, tile and delta encoder."""
+
+    def __init__(
+        self,
+        size: int,
+        keyframe_interval: int,
+        slices: Optional[list[slice]] = None,
+        address: Optional[str] = None,
+        connection=None,
+    ):
+        """Initialize the output.
+
+        Args:
+            size: Width and height of the panel
+            keyframe_interval: Frames between forced full PNG frames
+            slices: Rows of the tile in the wall frame, None for the whole frame
+            address: Bluetooth address, None for the integration's device
+            connection: Connection to use instead of the ConnectionManager
+        """
+        self.address = address
+        self.connection = connection
+        self.slices = slices
+        # Chooses per frame between Graffiti pixel deltas and a full PNG frame
+        self.delta = FrameDelta(size, size, keyframe_interval)
+        self.last_frame: Optional[bytes] = None
+        # Bumped when a send fails: tiles encoded against the old panel state
+        # are dropped and the encoder starts over with a keyframe
+        self.generation = 0
+        self.encoded_generation = 0
+
+    def reset(self) -> None:
+        """Forget the panel state, the next tile is sent as a keyframe."""
+        self.delta.reset()
+        self.last_frame = None
+        self.generation = 0
+        self.encoded_generation = 0
+
+    def crop(self, frame: bytes) -> bytes:
+        """Return the panel's tile of a display frame."""
+        if self.slices is None:
+            return frame
+        return b"".join([frame[rows] for rows in self.slices])
+
+    def get_connection(self):
+        """Return the connection to the panel."""
+        if self.connection is not None:
+            return self.connection
+        from .client.connectionManager import ConnectionManager
+
+        if self.address:
+            return ConnectionManager.forAddress(self.address)
+        return ConnectionManager()
+
+
+class AdaptiveFpsController:
+    """Adapts the target FPS to the measured capacity of the BLE link.
+
+    Every sent frame reports the time of its slower pipeline stage: encoding
+    in the worker thread or the BLE send. The stages overlap, so that is the
+    time a frame costs. The smoothed frame time gives the rate the link sustains; the target drops to
+    it right away when the link slows down and climbs back slowly when it
+    recovers, never above the configured maximum.
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 30.0,
+        min_fps: float = 2.0,
+        smoothing: float = 0.2,
+        headroom: float = 0.9,
+        increase: float = 1.05,
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_fps: Upper limit (0 = only limited by the link)
+            min_fps: Lower limit of the target
+            smoothing: Weight of a new sample in the moving average
+            headroom: Fraction of the measured link capacity to aim for
+            increase: Factor the target may grow by per sample
+        """
+        self.max_fps = max_fps
+        self.min_fps = min_fps
+        self.smoothing = smoothing
+        self.headroom = headroom
+        self.increase = increase
+        self._frame_time = 0.0
+        self._target_fps = max_fps
+
+    @property
+    def target_fps(self) -> float:
+        """Return the current target FPS (0 = unlimited)."""
+        return self._target_fps
+
+    @property
+    def frame_time(self) -> float:
+        """Return the smoothed end-to-end time of a sent frame in seconds."""
+        return self._frame_time
+
+    @property
+    def frame_interval(self) -> float:
+        """Return the minimum time between two frame sends."""
+        return 1.0 / self._target_fps if self._target_fps > 0 else 0.0
+
+    def set_max_fps(self, max_fps: float) -> None:
+        """Set the upper limit, the target restarts from there."""
+        self.max_fps = max(0.0, max_fps)
+        self._target_fps = self.max_fps
+
+    def record(self, frame_time: float) -> None:
+        """Record the time of the slower pipeline stage of a sent frame and adapt the target."""
+        if frame_time <= 0:
+            return
+        if self._frame_time == 0.0:
+            self._frame_time = frame_time
+        else:
+            self._frame_time += self.smoothing * (frame_time - self._frame_time)
+
+        capacity = self.headroom / self._frame_time
+        if self._target_fps <= 0 or capacity < self._target_fps:
+            # Link slowed down: follow it immediately
+            target = capacity
+        else:
+            # Link has spare capacity: probe upwards gradually
+            target = min(capacity, self._target_fps * self.increase)
+        if self.max_fps > 0:
+            target = min(target, self.max_fps)
+        self._target_fps = max(self.min_fps, target)
+
+
+class LatencyTracker:
+    """Rolling per-stage latencies of the frames that reached the display.
+
+    Stages: buffer (first datagram to complete frame), queue (waiting in the
+    mailbox), encode, send_wait (encoded frame waiting for the radio), send
+    (BLE write) and glass (first datagram to send complete).
+    """
+
+    STAGES = ("buffer", "queue", "encode", "send_wait", "send", "glass")
+
+    def __init__(self, window: int = 256):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent frames the percentiles are taken over
+        """
+        self._samples = {stage: deque(maxlen=window) for stage in self.STAGES}
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        for samples in self._samples.values():
+            samples.clear()
+
+    def record(
+        self,
+        received: float,
+        published: float,
+        encode_start: float,
+        encode_done: float,
+        send_start: float,
+        send_done: float,
+    ) -> None:
+        """Record the monotonic timestamps of one sent frame."""
+        samples = self._samples
+        samples["buffer"].append(published - received)
+        samples["queue"].append(encode_start - published)
+        samples["encode"].append(encode_done - encode_start)
+        samples["send_wait"].append(send_start - encode_done)
+        samples["send"].append(send_done - send_start)
+        samples["glass"].append(send_done - received)
+
+    def percentiles(self) -> dict:
+        """Return p50/p95/p99 in milliseconds per stage."""
+        result = {}
+        for stage, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            result[stage] = {
+                name: round(ordered[round(last * q)] * 1000, 1)
+                for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+            }
+        return result
 
 
 class LedFxProtocol(asyncio.DatagramProtocol):
@@ -0,0 +1,146 @@
+"""Pixel mapping for the LedFx Gateway - source layout, orientation, scaling and tiles."""
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Optional
+
+from PIL import Image
+
+ROTATIONS = (0, 90, 180, 270)
+
+
+class PixelMapper:
+    """Maps frames in the source layout onto the panel.
+
+    The index table for serpentine wiring, rotation and mirroring is computed
+    once per configuration, so every frame is reordered with a single gather.
+    Sources larger than the display are then box-filtered down to it.
+    """
+
+    def __init__(
+        self,
+        source_width: int,
+        source_height: int,
+        target_width: int,
+        target_height: int,
+        serpentine: bool = False,
+        rotation: int = 0,
+        mirror_x: bool = False,
+        mirror_y: bool = False,
+    ):
+        """Initialize the mapper.
+
+        Args:
+            source_width: Width of the incoming matrix in pixels
+            source_height: Height of the incoming matrix in pixels
+            target_width: Width of the display (all panels of a wall)
+            target_height: Height of the display
+            serpentine: Odd rows of the source run right to left
+            rotation: Clockwise rotation in degrees (0, 90, 180 or 270)
+            mirror_x: Mirror horizontally after rotating
+            mirror_y: Mirror vertically after rotating
+        """
+        if rotation not in ROTATIONS:
+            raise ValueError(f"Unsupported rotation: {rotation}")
+
+        self.source_width = source_width
+        self.source_height = source_height
+        self.target_width = target_width
+        self.target_height = target_height
+        target = (target_width, target_height)
+
+        # Size of the source once rotated
+        if rotation in (90, 270):
+            self._width, self._height = source_height, source_width
+        else:
+            self._width, self._height = source_width, source_height
+
+        self._getter: Optional[itemgetter] = None
+        table = self._build_table(serpentine, rotation, mirror_x, mirror_y)
+        if table != list(range(len(table))):
+            self._getter = itemgetter(*(3 * p + c for p in table for c in range(3)))
+
+        # Exact integer factors use Image.reduce(), which is a plain box filter
+        self._reduce: Optional[tuple[int, int]] = None
+        if (self._width, self._height) != target:
+            if self._width % target_width == 0 and self._height % target_height == 0:
+                self._reduce = (self._width // target_width, self._height // target_height)
+
+    @property
+    def source_pixels(self) -> int:
+        """Return the number of pixels in a source frame."""
+        return self.source_width * self.source_height
+
+    @property
+    def is_identity(self) -> bool:
+        """Return True if frames pass through unchanged."""
+        return self._getter is None and (self._width, self._height) == (
+            self.target_width, self.target_height
+        )
+
+    def _build_table(
+        self, serpentine: bool, rotation: int, mirror_x: bool, mirror_y: bool
+    ) -> list[int]:
+        """Return the source pixel index for every pixel of the oriented frame."""
+        w, h = self.source_width, self.source_height
+        table = []
+        for v in range(self._height):
+            for u in range(self._width):
+                u_ = self._width - 1 - u if mirror_x else u
+                v_ = self._height - 1 - v if mirror_y else v
+
+                # Undo the clockwise rotation
+                if rotation == 90:
+                    x, y = v_, h - 1 - u_
+                elif rotation == 180:
+                    x, y = w - 1 - u_, h - 1 - v_
+                elif rotation == 270:
+                    x, y = w - 1 - v_, u_
+                else:
+                    x, y = u_, v_
+
+                if serpentine and y % 2:
+                    x = w - 1 - x
+                table.append(y * w + x)
+        return table
+
+    def apply(self, frame: bytes) -> bytes:
+        """Map a source frame onto the panel.
+
+        Args:
+            frame: RGB bytes in the source layout (source_width * source_height * 3)
+
+        Returns:
+            RGB bytes of the display (target_width * target_height * 3)
+        """
+        if self._getter is not None:
+            frame = bytes(self._getter(frame))
+        size = (self.target_width, self.target_height)
+        if (self._width, self._height) == size:
+            return bytes(frame)
+
+        img = Image.frombytes("RGB", (self._width, self._height), bytes(frame))
+        if self._reduce:
+            img = img.reduce(self._reduce)
+        elif self._width >= self.target_width and self._height >= self.target_height:
+            img = img.resize(size, Image.BOX)
+        else:
+            img = img.resize(size, Image.NEAREST)
+        return img.tobytes()
+
+
+def tile_slices(width: int, tile_size: int, column: int, row: int) -> list[slice]:
+    """Return the byte slices of one tile's rows in an RGB frame of the given width.
+
+    Args:
+        width: Width of the whole frame in pixels
+        tile_size: Width and height of the tile
+        column: Tile column, 0 = left
+        row: Tile row, 0 = top
+    """
+    stride = width * 3
+    left = column * tile_size * 3
+    return [
+        slice(y * stride + left, y * stride + left + tile_size * 3)
+        for y in range(row * tile_size, (row + 1) * tile_size)
+    ]
@@ -78,8 +78,8 @@ class IDotMatrixLight(IDotMatrixEntity, LightEntity):
             rgb = kwargs[ATTR_RGB_COLOR]
             self.coordinator.text_settings["color"] = list(rgb)
             
-            # Send color update immediately (resends Text or Clock based on state)
-            await self.coordinator.async_update_device()
+            # Send color update (resends Text or Clock based on state)
+            self.coordinator.async_schedule_device_update()
             
         self.async_write_ha_state()
 
@@ -24,8 +24,22 @@ async def async_setup_entry(
         IDotMatrixTextBlur(coordinator, entry),
         IDotMatrixTextFontSize(coordinator, entry),
         IDotMatrixFunTextDelay(coordinator, entry),
+        IDotMatrixUpdateDebounce(coordinator, entry),
+        IDotMatrixGifMaxSize(coordinator, entry),
         IDotMatrixLedFxPort(coordinator, entry),
+        IDotMatrixLedFxDdpPort(coordinator, entry),
+        IDotMatrixLedFxStartUniverse(coordinator, entry),
+        IDotMatrixLedFxSourceWidth(coordinator, entry),
+        IDotMatrixLedFxSourceHeight(coordinator, entry),
         IDotMatrixLedFxMaxFps(coordinator, entry),
+        IDotMatrixLedFxMinChangedPixels(coordinator, entry),
+        IDotMatrixLedFxMinChannelDelta(coordinator, entry),
+        IDotMatrixLedFxIdleTimeout(coordinator, entry),
+        IDotMatrixLedFxGamma(coordinator, entry),
+        IDotMatrixLedFxBlackLevel(coordinator, entry),
+        IDotMatrixLedFxWhiteBalance(coordinator, entry, 0, "Red"),
+        IDotMatrixLedFxWhiteBalance(coordinator, entry, 1, "Green"),
+        IDotMatrixLedFxWhiteBalance(coordinator, entry, 2, "Blue"),
     ])
 
 class IDotMatrixLedFxPort(IDotMatrixEntity, NumberEntity):
@@ -60,6 +74,134 @@ class IDotMatrixLedFxPort(IDotMatrixEntity, NumberEntity):
         
         self.async_write_ha_state()
 
+class IDotMatrixLedFxDdpPort(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx DDP UDP Port configuration."""
+
+    _attr_icon = "mdi:lan-connect"
+    _attr_name = "LedFx DDP Port"
+    _attr_native_min_value = 1024
+    _attr_native_max_value = 65535
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_ddp_port"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_ddp_port", 4048)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        old_port = self.coordinator.text_settings.get("ledfx_ddp_port", 4048)
+        new_port = int(value)
+        
+        self.coordinator.text_settings["ledfx_ddp_port"] = new_port
+        await self.coordinator.async_save_settings()
+        
+        # Restart gateway if running and port changed
+        if old_port != new_port and self.coordinator.text_settings.get("ledfx_enabled", False):
+            await self.coordinator.async_restart_ledfx_gateway()
+        
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxStartUniverse(IDotMatrixEntity, NumberEntity):
+    """Representation of the first E1.31 / Art-Net universe mapped onto the panel."""
+
+    _attr_icon = "mdi:counter"
+    _attr_name = "LedFx Start Universe"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 63999
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_start_universe"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_start_universe", 1)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        old_universe = self.coordinator.text_settings.get("ledfx_start_universe", 1)
+        new_universe = int(value)
+        
+        self.coordinator.text_settings["ledfx_start_universe"] = new_universe
+        await self.coordinator.async_save_settings()
+        
+        # Restart gateway if running and the mapping changed
+        if old_universe != new_universe and self.coordinator.text_settings.get("ledfx_enabled", False):
+            await self.coordinator.async_restart_ledfx_gateway()
+        
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxSourceWidth(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx matrix width (0 = screen size)."""
+
+    _attr_icon = "mdi:arrow-left-right"
+    _attr_name = "LedFx Source Width"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 256
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_source_width"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_source_width", 0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        old_size = self.coordinator.text_settings.get("ledfx_source_width", 0)
+        new_size = int(value)
+        
+        self.coordinator.text_settings["ledfx_source_width"] = new_size
+        await self.coordinator.async_save_settings()
+        
+        # Restart gateway if running, the pixel buffer follows the source size
+        if old_size != new_size and self.coordinator.text_settings.get("ledfx_enabled", False):
+            await self.coordinator.async_restart_ledfx_gateway()
+        
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxSourceHeight(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx matrix height (0 = screen size)."""
+
+    _attr_icon = "mdi:arrow-up-down"
+    _attr_name = "LedFx Source Height"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 256
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_source_height"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_source_height", 0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        old_size = self.coordinator.text_settings.get("ledfx_source_height", 0)
+        new_size = int(value)
+        
+        self.coordinator.text_settings["ledfx_source_height"] = new_size
+        await self.coordinator.async_save_settings()
+        
+        # Restart gateway if running, the pixel buffer follows the source size
+        if old_size != new_size and self.coordinator.text_settings.get("ledfx_enabled", False):
+            await self.coordinator.async_restart_ledfx_gateway()
+        
+        self.async_write_ha_state()
+
 class IDotMatrixLedFxMaxFps(IDotMatrixEntity, NumberEntity):
     """Representation of the LedFx Max FPS configuration."""
 
@@ -90,6 +232,183 @@ class IDotMatrixLedFxMaxFps(IDotMatrixEntity, NumberEntity):
         
         self.async_write_ha_state()
 
+class IDotMatrixLedFxMinChangedPixels(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx minimum changed pixels per frame."""
+
+    _attr_icon = "mdi:image-filter-center-focus"
+    _attr_name = "LedFx Min Changed Pixels"
+    _attr_native_min_value = 1
+    _attr_native_max_value = 4096
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_min_changed_pixels"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_min_changed_pixels", 1)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["ledfx_min_changed_pixels"] = int(value)
+        await self.coordinator.async_save_settings()
+        
+        # Update gateway if running
+        gateway = self.coordinator.ledfx_gateway
+        if gateway:
+            gateway.set_change_threshold(
+                int(value), self.coordinator.text_settings.get("ledfx_min_channel_delta", 0)
+            )
+        
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxMinChannelDelta(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx per-channel change threshold."""
+
+    _attr_icon = "mdi:contrast-box"
+    _attr_name = "LedFx Min Channel Delta"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 64
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_min_channel_delta"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_min_channel_delta", 0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["ledfx_min_channel_delta"] = int(value)
+        await self.coordinator.async_save_settings()
+        
+        # Update gateway if running
+        gateway = self.coordinator.ledfx_gateway
+        if gateway:
+            gateway.set_change_threshold(
+                self.coordinator.text_settings.get("ledfx_min_changed_pixels", 1), int(value)
+            )
+        
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxIdleTimeout(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx idle timeout (0 = never)."""
+
+    _attr_icon = "mdi:timer-sand"
+    _attr_name = "LedFx Idle Timeout"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 60
+    _attr_native_step = 0.5
+    _attr_native_unit_of_measurement = "s"
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_idle_timeout"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_idle_timeout", 2.5)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["ledfx_idle_timeout"] = float(value)
+        await self.coordinator.async_save_settings()
+        
+        # Update gateway if running
+        gateway = self.coordinator.ledfx_gateway
+        if gateway:
+            gateway.set_idle_timeout(value)
+        
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxGamma(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx gamma correction."""
+
+    _attr_icon = "mdi:gamma"
+    _attr_name = "LedFx Gamma"
+    _attr_native_min_value = 0.5
+    _attr_native_max_value = 3.0
+    _attr_native_step = 0.1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_gamma"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_gamma", 1.0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["ledfx_gamma"] = round(value, 2)
+        await self.coordinator.async_save_settings()
+        self.coordinator.apply_ledfx_color_correction()
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxBlackLevel(IDotMatrixEntity, NumberEntity):
+    """Representation of the LedFx black level cutoff."""
+
+    _attr_icon = "mdi:brightness-4"
+    _attr_name = "LedFx Black Level"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 64
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_black_level"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_black_level", 0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["ledfx_black_level"] = int(value)
+        await self.coordinator.async_save_settings()
+        self.coordinator.apply_ledfx_color_correction()
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxWhiteBalance(IDotMatrixEntity, NumberEntity):
+    """Representation of one channel of the LedFx white balance."""
+
+    _attr_icon = "mdi:white-balance-sunny"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 255
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+
+    def __init__(self, coordinator, entry, channel: int, color: str):
+        super().__init__(coordinator, entry)
+        self._channel = channel
+        self._attr_name = f"LedFx White Balance {color}"
+        self._key = color.lower()
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_white_balance_{self._key}"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("ledfx_white_balance", [255, 255, 255])[self._channel]
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        balance = list(self.coordinator.text_settings.get("ledfx_white_balance", [255, 255, 255]))
+        balance[self._channel] = int(value)
+        self.coordinator.text_settings["ledfx_white_balance"] = balance
+        await self.coordinator.async_save_settings()
+        self.coordinator.apply_ledfx_color_correction()
+        self.async_write_ha_state()
+
 class IDotMatrixFunTextDelay(IDotMatrixEntity, NumberEntity):
     """Representation of the Fun Text Delay control."""
 
@@ -111,7 +430,55 @@ class IDotMatrixFunTextDelay(IDotMatrixEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         self.coordinator.text_settings["fun_text_delay"] = float(value)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
+        self.async_write_ha_state()
+
+class IDotMatrixUpdateDebounce(IDotMatrixEntity, NumberEntity):
+    """Representation of the window that collects setting changes into one upload."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_name = "Update Debounce (sec)"
+    _attr_native_min_value = 0.0
+    _attr_native_max_value = 2.0
+    _attr_native_step = 0.05
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_update_debounce"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("update_debounce", 0.15)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["update_debounce"] = round(value, 2)
+        await self.coordinator.async_save_settings()
+        self.async_write_ha_state()
+
+class IDotMatrixGifMaxSize(IDotMatrixEntity, NumberEntity):
+    """Representation of the byte budget of converted GIFs."""
+
+    _attr_icon = "mdi:file-gif-box"
+    _attr_name = "GIF Size Budget (KB)"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 256
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_gif_max_kb"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("gif_max_kb", 0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["gif_max_kb"] = int(value)
+        await self.coordinator.async_save_settings()
         self.async_write_ha_state()
 
 class IDotMatrixTextFontSize(IDotMatrixEntity, NumberEntity):
@@ -135,7 +502,7 @@ class IDotMatrixTextFontSize(IDotMatrixEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         self.coordinator.text_settings["font_size"] = int(value)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixTextBlur(IDotMatrixEntity, NumberEntity):
@@ -159,7 +526,7 @@ class IDotMatrixTextBlur(IDotMatrixEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         self.coordinator.text_settings["blur"] = int(value)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixTextSpeed(IDotMatrixEntity, NumberEntity):
@@ -184,7 +551,7 @@ class IDotMatrixTextSpeed(IDotMatrixEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         self.coordinator.text_settings["speed"] = int(value)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixTextSpacing(IDotMatrixEntity, NumberEntity):
@@ -209,7 +576,7 @@ class IDotMatrixTextSpacing(IDotMatrixEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         self.coordinator.text_settings["spacing"] = int(value)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixTextSpacingVertical(IDotMatrixEntity, NumberEntity):
@@ -233,5 +600,5 @@ class IDotMatrixTextSpacingVertical(IDotMatrixEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         self.coordinator.text_settings["spacing_y"] = int(value)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
@@ -11,7 +11,7 @@ from .const import DOMAIN, ANIMATION_MODES, COLOR_MODES
 from .entity import IDotMatrixEntity
 from .client.modules.clock import Clock
 from .client.modules.effect import Effect
-import os
+from .client.modules.fontCatalog import DEFAULT_FONT
 
 CLOCK_STYLES = [
     "Default", "Christmas", "Racing", "Inverted Full Screen",
@@ -28,27 +28,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up the iDotMatrix select."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    # Scan for fonts asynchronously to avoid blocking the loop
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    fonts_path = os.path.join(base_path, "fonts")
-    
-    def get_fonts():
-        options = []
-        if os.path.isdir(fonts_path):
-            for file in os.listdir(fonts_path):
-                if file.endswith((".otf", ".ttf", ".bdf")):
-                    options.append(file)
-        return sorted(options) if options else ["Rain-DRM3.otf"]
-
-    fonts = await hass.async_add_executor_job(get_fonts)
-
     async_add_entities([
         IDotMatrixClockFace(coordinator, entry),
-        IDotMatrixFont(coordinator, entry, fonts),
+        IDotMatrixFont(coordinator, entry),
         IDotMatrixTextAnimation(coordinator, entry),
         IDotMatrixTextColorMode(coordinator, entry),
         IDotMatrixScreenSize(coordinator, entry),
         IDotMatrixClockFormat(coordinator, entry),
+        IDotMatrixLedFxRotation(coordinator, entry),
     ])
 
 class IDotMatrixClockFormat(IDotMatrixEntity, SelectEntity):
@@ -71,8 +58,34 @@ class IDotMatrixClockFormat(IDotMatrixEntity, SelectEntity):
         self.coordinator.text_settings["clock_format"] = option
         self._attr_current_option = option
         
-        # Update clock immediately via coordinator logic
-        await self.coordinator.async_update_device()
+        # Update clock via coordinator logic
+        self.coordinator.async_schedule_device_update()
+        self.async_write_ha_state()
+
+class IDotMatrixLedFxRotation(IDotMatrixEntity, SelectEntity):
+    """Selector for the rotation of the LedFx source."""
+    _attr_icon = "mdi:screen-rotation"
+    _attr_name = "LedFx Rotation"
+    _attr_options = ["0", "90", "180", "270"]
+    _attr_entity_category = EntityCategory.CONFIG
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._attr_current_option = str(self.coordinator.text_settings.get("ledfx_rotation", 0))
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_rotation"
+
+    async def async_select_option(self, option: str) -> None:
+        """Select rotation."""
+        self.coordinator.text_settings["ledfx_rotation"] = int(option)
+        self._attr_current_option = option
+        await self.coordinator.async_save_settings()
+
+        # The mapping table is built on start, restart a running gateway
+        if self.coordinator.text_settings.get("ledfx_enabled", False):
+            await self.coordinator.async_restart_ledfx_gateway()
         self.async_write_ha_state()
 
 class IDotMatrixScreenSize(IDotMatrixEntity, SelectEntity):
@@ -107,7 +120,7 @@ class IDotMatrixScreenSize(IDotMatrixEntity, SelectEntity):
              
         self.coordinator.text_settings["screen_size"] = size
         self._attr_current_option = option
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixClockFace(IDotMatrixEntity, SelectEntity):
@@ -133,7 +146,7 @@ class IDotMatrixClockFace(IDotMatrixEntity, SelectEntity):
             # Use this action to CLEAR text and switch to clock
             self.coordinator.text_settings["current_text"] = ""
             
-            await self.coordinator.async_update_device()
+            self.coordinator.async_schedule_device_update()
             self._attr_current_option = option
             self.async_write_ha_state()
 
@@ -146,39 +159,41 @@ class IDotMatrixFont(IDotMatrixEntity, SelectEntity):
     _attr_name = "Text Font"
     _attr_entity_category = EntityCategory.CONFIG
 
-    def __init__(self, coordinator, entry, fonts):
+    def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
-        self._attr_options = fonts
-        # Set default option to first available or saved
-        current = self.coordinator.text_settings.get("font", "Rain-DRM3.otf")
+        catalog = self.coordinator.font_catalog
+        self._attr_options = catalog.names() or [DEFAULT_FONT]
+        # Set default option to saved or the font it falls back to
+        current = self.coordinator.text_settings.get("font", DEFAULT_FONT)
         if current in self._attr_options:
             self._attr_current_option = current
-        elif self._attr_options:
-            self._attr_current_option = self._attr_options[0]
+        else:
+            self._attr_current_option = catalog.resolve(current) or self._attr_options[0]
 
     @property
     def unique_id(self) -> str:
         return f"{self._mac}_text_font"
 
-    def _get_fonts(self) -> list[str]:
-        """Scan fonts directory."""
-        # Locate fonts dir relative to this file
-        # select.py -> custom_components/idotmatrix/select.py
-        # fonts -> custom_components/idotmatrix/fonts/
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        fonts_path = os.path.join(base_path, "fonts")
-        options = []
-        if os.path.isdir(fonts_path):
-            for file in os.listdir(fonts_path):
-                if file.endswith((".otf", ".ttf", ".bdf")):
-                    options.append(file)
-        return sorted(options) if options else ["Rain-DRM3.otf"]
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the indexed metrics of the selected font."""
+        font = self.coordinator.font_catalog.get(self._attr_current_option)
+        if not font:
+            return {}
+        return {
+            "family": font["family"],
+            "format": font["format"],
+            "native_size": font["pixel_size"],
+            "ascent": font["ascent"],
+            "descent": font["descent"],
+            "glyphs": sum(last - first + 1 for first, last in font["coverage"]),
+        }
 
     async def async_select_option(self, option: str) -> None:
         """Select font."""
         self.coordinator.text_settings["font"] = option
         self._attr_current_option = option
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixTextAnimation(IDotMatrixEntity, SelectEntity):
@@ -205,7 +220,7 @@ class IDotMatrixTextAnimation(IDotMatrixEntity, SelectEntity):
         """Select animation."""
         self.coordinator.text_settings["animation_mode"] = ANIMATION_MODES[option]
         self._attr_current_option = option
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixTextColorMode(IDotMatrixEntity, SelectEntity):
@@ -231,5 +246,5 @@ class IDotMatrixTextColorMode(IDotMatrixEntity, SelectEntity):
         """Select color mode."""
         self.coordinator.text_settings["color_mode"] = COLOR_MODES[option]
         self._attr_current_option = option
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
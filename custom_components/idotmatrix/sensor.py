@@ -21,11 +21,13 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([
         IDotMatrixLedFxFpsSensor(coordinator, entry),
+        IDotMatrixLedFxTargetFpsSensor(coordinator, entry),
+        IDotMatrixPlaylistSlipSensor(coordinator, entry),
     ])
 
 
 class IDotMatrixLedFxFpsSensor(IDotMatrixEntity, SensorEntity):
-    """Sensor showing LedFx Gateway current FPS."""
+    """Sensor showing LedFx Gateway current (achieved) FPS."""
 
     _attr_icon = "mdi:gauge"
     _attr_name = "LedFx Gateway FPS"
@@ -52,7 +54,102 @@ class IDotMatrixLedFxFpsSensor(IDotMatrixEntity, SensorEntity):
             "frames_received": stats.get("frames_received", 0),
             "frames_sent": stats.get("frames_sent", 0),
             "frames_skipped": stats.get("frames_skipped", 0),
+            "frames_superseded": stats.get("frames_superseded", 0),
+            "frames_incomplete": stats.get("frames_incomplete", 0),
+            "frames_torn": stats.get("frames_torn", 0),
+            "skip_reasons": stats.get("skip_reasons", {}),
+            "keyframes_sent": stats.get("keyframes_sent", 0),
+            "tiles": stats.get("tiles", 1),
+            "tiles_skipped": stats.get("tiles_skipped", 0),
+            "delta_frames_sent": stats.get("delta_frames_sent", 0),
+            "bytes_sent": stats.get("bytes_sent", 0),
+            "png_bytes_uncorrected": stats.get("png_bytes_uncorrected", 0),
+            "png_bytes_corrected": stats.get("png_bytes_corrected", 0),
+            "color_size_saving_pct": stats.get("color_size_saving_pct", 0.0),
+            "ddp_frames": stats.get("ddp_frames", 0),
+            "dmx_frames": stats.get("dmx_frames", 0),
+            "dmx_frames_incomplete": stats.get("dmx_frames_incomplete", 0),
             "port": stats.get("port", 21324),
+            "ddp_port": stats.get("ddp_port", 4048),
+            "latency_ms": stats.get("latency_ms", {}),
+            "capturing": stats.get("capturing", False),
+            "realtime": stats.get("realtime", False),
+            "idle_timeout": stats.get("idle_timeout", 0),
+            "idle_count": stats.get("idle_count", 0),
+            "e131_enabled": stats.get("e131_enabled", False),
+            "artnet_enabled": stats.get("artnet_enabled", False),
+            "start_universe": stats.get("start_universe", 1),
+            "source_size": stats.get("source_size", ""),
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return True
+
+class IDotMatrixLedFxTargetFpsSensor(IDotMatrixEntity, SensorEntity):
+    """Sensor showing the FPS the LedFx Gateway adapts to the BLE link."""
+
+    _attr_icon = "mdi:speedometer-medium"
+    _attr_name = "LedFx Gateway Target FPS"
+    _attr_native_unit_of_measurement = "FPS"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_ledfx_target_fps"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the target FPS."""
+        stats = self.coordinator.ledfx_stats
+        return round(stats.get("target_fps", 0), 1)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return extra state attributes."""
+        stats = self.coordinator.ledfx_stats
+        return {
+            "running": stats.get("running", False),
+            "send_time_ms": stats.get("send_time_ms", 0.0),
+            "max_fps": self.coordinator.text_settings.get("ledfx_max_fps", 30),
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return True
+
+class IDotMatrixPlaylistSlipSensor(IDotMatrixEntity, SensorEntity):
+    """Sensor showing how far the last playlist item landed from its deadline."""
+
+    _attr_icon = "mdi:timer-sync-outline"
+    _attr_name = "Playlist Slip"
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_playlist_slip"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the slip of the last item, positive when it landed late."""
+        return self.coordinator.playlist_stats.get("last_slip_ms", 0.0)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return extra state attributes."""
+        stats = self.coordinator.playlist_stats
+        return {
+            "running": stats.get("running", False),
+            "item": stats.get("item", 0),
+            "items": stats.get("items", 0),
+            "shown": stats.get("shown", 0),
+            "failed": stats.get("failed", 0),
+            "reanchored": stats.get("reanchored", 0),
+            "max_slip_ms": stats.get("max_slip_ms", 0.0),
+            "mean_slip_ms": stats.get("mean_slip_ms", 0.0),
         }
 
     @property
@@ -0,0 +1,276 @@
+"""Services for iDotMatrix."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    CONF_MAC,
+    DOMAIN,
+    SERVICE_LEDFX_CAPTURE_START,
+    SERVICE_LEDFX_CAPTURE_STOP,
+    SERVICE_LEDFX_SET_WALL,
+    SERVICE_PLAYLIST_START,
+    SERVICE_PLAYLIST_STOP,
+    SERVICE_PREPROCESS_MEDIA,
+    SERVICE_SCENE_DELETE,
+    SERVICE_SCENE_RECALL,
+    SERVICE_SCENE_SAVE,
+    SERVICE_UPLOAD_MEDIA,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PREPROCESS_MEDIA_SCHEMA = vol.Schema(
+    {
+        vol.Required("folder"): cv.string,
+        vol.Optional("screen_size"): vol.All(vol.Coerce(int), vol.In([16, 32, 64])),
+        vol.Optional("workers"): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+        vol.Optional("max_kb"): vol.All(vol.Coerce(float), vol.Range(min=0, max=1024)),
+    }
+)
+
+UPLOAD_MEDIA_SCHEMA = vol.Schema(
+    {
+        vol.Required("file"): cv.string,
+    }
+)
+
+LEDFX_CAPTURE_START_SCHEMA = vol.Schema(
+    {
+        vol.Required("file"): cv.string,
+    }
+)
+
+LEDFX_TILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("address"): cv.string,
+        vol.Required("column"): vol.All(vol.Coerce(int), vol.Range(min=0, max=15)),
+        vol.Required("row"): vol.All(vol.Coerce(int), vol.Range(min=0, max=15)),
+    }
+)
+
+LEDFX_SET_WALL_SCHEMA = vol.Schema(
+    {
+        vol.Required("tiles"): vol.All(cv.ensure_list, [LEDFX_TILE_SCHEMA]),
+    }
+)
+
+SCENE_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): vol.All(cv.string, vol.Length(min=1, max=64)),
+        vol.Optional("device_id"): cv.string,
+    }
+)
+
+PLAYLIST_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive("text", "content"): cv.string,
+            vol.Exclusive("clock", "content"): cv.boolean,
+            vol.Exclusive("image", "content"): cv.string,
+            vol.Exclusive("scene", "content"): cv.string,
+            vol.Optional("duration"): vol.All(vol.Coerce(float), vol.Range(min=1, max=86400)),
+            vol.Optional("settings"): dict,
+        }
+    ),
+    cv.has_at_least_one_key("text", "clock", "image", "scene"),
+)
+
+PLAYLIST_START_SCHEMA = vol.Schema(
+    {
+        vol.Required("items"): vol.All(cv.ensure_list, vol.Length(min=1), [PLAYLIST_ITEM_SCHEMA]),
+        vol.Optional("interval", default=10): vol.All(vol.Coerce(float), vol.Range(min=1, max=86400)),
+        vol.Optional("repeat", default=True): cv.boolean,
+        vol.Optional("device_id"): cv.string,
+    }
+)
+
+PLAYLIST_STOP_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device_id"): cv.string,
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant) -> list:
+    """Return the coordinators of all loaded iDotMatrix devices."""
+    from .coordinator import IDotMatrixCoordinator
+
+    return [
+        coordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        if isinstance(coordinator, IDotMatrixCoordinator)
+    ]
+
+
+def _targets(hass: HomeAssistant, call: ServiceCall) -> list:
+    """Return the coordinator of the device_id of a call, all coordinators without one."""
+    coordinators = _coordinators(hass)
+    device_id = call.data.get("device_id")
+    if device_id is None:
+        return coordinators
+    device = dr.async_get(hass).async_get(device_id)
+    targets = [
+        coordinator
+        for coordinator in coordinators
+        if device is not None and coordinator.entry.entry_id in device.config_entries
+    ]
+    if not targets:
+        raise HomeAssistantError(f"Device {device_id} is not a loaded iDotMatrix device")
+    return targets
+
+
+def _check_path(hass: HomeAssistant, path: str) -> None:
+    """Refuse paths outside of the allowlisted external directories."""
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Path {path} is not allowed, add it to allowlist_external_dirs")
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the iDotMatrix services (once for all devices)."""
+    if hass.services.has_service(DOMAIN, SERVICE_PREPROCESS_MEDIA):
+        return
+
+    async def async_preprocess_media(call: ServiceCall) -> None:
+        folder = call.data["folder"]
+        _check_path(hass, folder)
+        coordinators = _coordinators(hass)
+        max_kb = call.data.get("max_kb")
+        if "screen_size" in call.data:
+            runs = {(call.data["screen_size"], max_kb): coordinators[0]} if coordinators else {}
+        else:
+            runs = {}
+            for coordinator in coordinators:
+                runs.setdefault(
+                    (
+                        int(coordinator.text_settings.get("screen_size", 32)),
+                        max_kb if max_kb is not None else coordinator.text_settings.get("gif_max_kb", 0),
+                    ),
+                    coordinator,
+                )
+        # one run per panel size and GIF budget, the cache is shared between devices
+        for (size, budget), coordinator in runs.items():
+            await coordinator.async_preprocess_media(folder, size, call.data.get("workers"), budget)
+
+    async def async_upload_media(call: ServiceCall) -> None:
+        file_path = call.data["file"]
+        _check_path(hass, file_path)
+        for coordinator in _coordinators(hass):
+            await coordinator.async_upload_media(file_path)
+
+    async def async_ledfx_capture_start(call: ServiceCall) -> None:
+        file_path = call.data["file"]
+        _check_path(hass, file_path)
+        # One capture file, taken from the first device with a running gateway
+        for coordinator in _coordinators(hass):
+            if await coordinator.async_start_ledfx_capture(file_path):
+                return
+        raise HomeAssistantError("The LedFx gateway is not running")
+
+    async def async_ledfx_capture_stop(call: ServiceCall) -> None:
+        for coordinator in _coordinators(hass):
+            await coordinator.async_stop_ledfx_capture()
+
+    async def async_ledfx_set_wall(call: ServiceCall) -> None:
+        tiles = call.data["tiles"]
+        positions = [(tile["column"], tile["row"]) for tile in tiles]
+        if len(set(positions)) != len(positions):
+            raise HomeAssistantError("Two panels share the same column and row")
+        coordinators = _coordinators(hass)
+        addresses = {tile["address"].upper() for tile in tiles if "address" in tile}
+        # The wall is driven by the device that is part of it (tiles without
+        # an address mean that device), or by the only device
+        owners = [
+            coordinator
+            for coordinator in coordinators
+            if coordinator.entry.data[CONF_MAC].upper() in addresses
+        ]
+        if not owners and len(coordinators) == 1:
+            owners = coordinators
+        if len(owners) != 1:
+            raise HomeAssistantError("Include the address of exactly one configured iDotMatrix device in the wall")
+        await owners[0].async_set_ledfx_wall([dict(tile) for tile in tiles])
+
+    async def async_scene_save(call: ServiceCall) -> None:
+        # Every device keeps its own scene of the same name
+        for coordinator in _targets(hass, call):
+            await coordinator.async_save_scene(call.data["name"])
+
+    async def async_scene_recall(call: ServiceCall) -> None:
+        recalled = [
+            await coordinator.async_recall_scene(call.data["name"])
+            for coordinator in _targets(hass, call)
+        ]
+        if not any(recalled):
+            raise HomeAssistantError(f"No device has a scene named {call.data['name']}")
+
+    async def async_scene_delete(call: ServiceCall) -> None:
+        for coordinator in _targets(hass, call):
+            await coordinator.async_delete_scene(call.data["name"])
+
+    async def async_playlist_start(call: ServiceCall) -> None:
+        items = call.data["items"]
+        for item in items:
+            if "image" in item:
+                _check_path(hass, item["image"])
+        for coordinator in _targets(hass, call):
+            try:
+                await coordinator.async_start_playlist(items, call.data["interval"], call.data["repeat"])
+            except ValueError as error:
+                raise HomeAssistantError(str(error)) from error
+
+    async def async_playlist_stop(call: ServiceCall) -> None:
+        for coordinator in _targets(hass, call):
+            await coordinator.async_stop_playlist()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PREPROCESS_MEDIA, async_preprocess_media, schema=PREPROCESS_MEDIA_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PLAYLIST_START, async_playlist_start, schema=PLAYLIST_START_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PLAYLIST_STOP, async_playlist_stop, schema=PLAYLIST_STOP_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_SCENE_SAVE, async_scene_save, schema=SCENE_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_SCENE_RECALL, async_scene_recall, schema=SCENE_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_SCENE_DELETE, async_scene_delete, schema=SCENE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_UPLOAD_MEDIA, async_upload_media, schema=UPLOAD_MEDIA_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LEDFX_CAPTURE_START,
+        async_ledfx_capture_start,
+        schema=LEDFX_CAPTURE_START_SCHEMA,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_LEDFX_CAPTURE_STOP, async_ledfx_capture_stop)
+    hass.services.async_register(
+        DOMAIN, SERVICE_LEDFX_SET_WALL, async_ledfx_set_wall, schema=LEDFX_SET_WALL_SCHEMA
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the iDotMatrix services once the last device is unloaded."""
+    if _coordinators(hass):
+        return
+    for service in (
+        SERVICE_PREPROCESS_MEDIA,
+        SERVICE_UPLOAD_MEDIA,
+        SERVICE_LEDFX_CAPTURE_START,
+        SERVICE_LEDFX_CAPTURE_STOP,
+        SERVICE_LEDFX_SET_WALL,
+        SERVICE_SCENE_SAVE,
+        SERVICE_SCENE_RECALL,
+        SERVICE_SCENE_DELETE,
+        SERVICE_PLAYLIST_START,
+        SERVICE_PLAYLIST_STOP,
+    ):
+        hass.services.async_remove(DOMAIN, service)
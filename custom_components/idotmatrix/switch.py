@@ -23,6 +23,12 @@ async def async_setup_entry(
         IDotMatrixAutosize(coordinator, entry),
         IDotMatrixClockDate(coordinator, entry),
         IDotMatrixLedFxGateway(coordinator, entry),
+        IDotMatrixLedFxE131(coordinator, entry),
+        IDotMatrixLedFxArtNet(coordinator, entry),
+        IDotMatrixLedFxSerpentine(coordinator, entry),
+        IDotMatrixLedFxMirrorX(coordinator, entry),
+        IDotMatrixLedFxMirrorY(coordinator, entry),
+        IDotMatrixLedFxIdleRestore(coordinator, entry),
     ])
 
 class IDotMatrixLedFxGateway(IDotMatrixEntity, SwitchEntity):
@@ -63,6 +69,78 @@ class IDotMatrixLedFxGateway(IDotMatrixEntity, SwitchEntity):
         await self.coordinator.async_stop_ledfx_gateway()
         self.async_write_ha_state()
 
+class IDotMatrixLedFxSettingSwitch(IDotMatrixEntity, SwitchEntity):
+    """Base switch for a LedFx Gateway setting that applies on gateway start."""
+
+    _attr_entity_category = EntityCategory.CONFIG
+    _setting: str
+    _restart_gateway = True
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_{self._setting}"
+
+    @property
+    def is_on(self) -> bool:
+        return self.coordinator.text_settings.get(self._setting, False)
+
+    async def _async_set(self, enabled: bool) -> None:
+        self.coordinator.text_settings[self._setting] = enabled
+        await self.coordinator.async_save_settings()
+        # Listeners and the pixel mapping are set up on start, restart a running gateway
+        if self._restart_gateway and self.coordinator.text_settings.get("ledfx_enabled", False):
+            await self.coordinator.async_restart_ledfx_gateway()
+        self.async_write_ha_state()
+
+    async def async_turn_on(self, **kwargs) -> None:
+        await self._async_set(True)
+
+    async def async_turn_off(self, **kwargs) -> None:
+        await self._async_set(False)
+
+class IDotMatrixLedFxE131(IDotMatrixLedFxSettingSwitch):
+    """Switch to enable the E1.31 (sACN) input of the LedFx Gateway."""
+
+    _attr_icon = "mdi:lan"
+    _attr_name = "LedFx E1.31 (sACN)"
+    _setting = "ledfx_e131_enabled"
+
+class IDotMatrixLedFxArtNet(IDotMatrixLedFxSettingSwitch):
+    """Switch to enable the Art-Net input of the LedFx Gateway."""
+
+    _attr_icon = "mdi:lan"
+    _attr_name = "LedFx Art-Net"
+    _setting = "ledfx_artnet_enabled"
+
+class IDotMatrixLedFxSerpentine(IDotMatrixLedFxSettingSwitch):
+    """Switch for LedFx matrices wired in serpentine (zig-zag) order."""
+
+    _attr_icon = "mdi:sine-wave"
+    _attr_name = "LedFx Serpentine Layout"
+    _setting = "ledfx_serpentine"
+
+class IDotMatrixLedFxMirrorX(IDotMatrixLedFxSettingSwitch):
+    """Switch to mirror the LedFx source horizontally."""
+
+    _attr_icon = "mdi:flip-horizontal"
+    _attr_name = "LedFx Mirror Horizontal"
+    _setting = "ledfx_mirror_x"
+
+class IDotMatrixLedFxMirrorY(IDotMatrixLedFxSettingSwitch):
+    """Switch to mirror the LedFx source vertically."""
+
+    _attr_icon = "mdi:flip-vertical"
+    _attr_name = "LedFx Mirror Vertical"
+    _setting = "ledfx_mirror_y"
+
+class IDotMatrixLedFxIdleRestore(IDotMatrixLedFxSettingSwitch):
+    """Switch to show text / clock again when LedFx stops sending."""
+
+    _attr_icon = "mdi:restore"
+    _attr_name = "LedFx Restore Content When Idle"
+    _setting = "ledfx_idle_restore"
+    _restart_gateway = False
+
 class IDotMatrixAutosize(IDotMatrixEntity, SwitchEntity):
     """Switch to toggle automatic font sizing (Perfect Fit)."""
 
@@ -90,12 +168,12 @@ class IDotMatrixAutosize(IDotMatrixEntity, SwitchEntity):
         if not self.coordinator.text_settings.get("multiline"):
              self.coordinator.text_settings["multiline"] = True
              
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         self.coordinator.text_settings["autosize"] = False
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         self.async_write_ha_state()
 
 class IDotMatrixClockDate(IDotMatrixEntity, SwitchEntity):
@@ -45,7 +45,7 @@ class IDotMatrixText(IDotMatrixEntity, TextEntity):
         self.coordinator.text_settings["current_text"] = value
         
         # Trigger update (sends command to device)
-        await self.coordinator.async_update_device()
+        self.coordinator.async_schedule_device_update()
         
         self.async_write_ha_state() # Update HA state immediately
 
@@ -71,41 +71,6 @@ class IDotMatrixFunText(IDotMatrixEntity, TextEntity):
         # Use simple default text if empty, similar to user script logic
         input_text = value if value else "How did I end up here?"
         
-        # Spawn the animation task
-        self.hass.async_create_task(self._animate_text(input_text))
-
-    async def _animate_text(self, text: str):
-        """Run the animation loop."""
-        import asyncio
-        import random
-        
-        words = text.split()
-        palette = [
-            [255, 0, 0],
-            [0, 255, 0],
-            [0, 120, 255],
-            [160, 0, 255],
-            [255, 255, 255],
-            [255, 120, 0],
-            [255, 0, 170],
-            [0, 255, 220]
-        ]
-        
-        for word in words:
-            color = random.choice(palette)
-            
-            # Update Settings
-            self.coordinator.text_settings["color"] = color
-            self.coordinator.text_settings["current_text"] = word
-            
-            # Send to Device
-            await self.coordinator.async_update_device()
-            
-            # Delay (Adjustable, Default 400ms)
-            delay = self.coordinator.text_settings.get("fun_text_delay", 0.4)
-            await asyncio.sleep(delay)
-            
-        # Final update to ensure state is consistent (optional config choice)
-        # Maybe show the full sentence at the end? Or leave the last word?
-        # User script leaves the last word. We'll stick to that "exactly same thing".
-
+        # Words are pre-rendered and played in the background, a new text
+        # replaces a running sequence
+        await self.coordinator.async_play_fun_text(input_text)
@@ -0,0 +1,18 @@
+"""Loads the integration's client modules without Home Assistant.
+
+The integration package itself runs its Home Assistant setup on import, so it
+is registered as a bare namespace here, like the benchmarks do.
+"""
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.idotmatrix"
+PACKAGE_PATH = os.path.join(ROOT, "custom_components", "idotmatrix")
+
+for name, path in (("custom_components", os.path.join(ROOT, "custom_components")), (PACKAGE, PACKAGE_PATH)):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [path]
+        sys.modules[name] = package
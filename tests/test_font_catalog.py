@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from custom_components.idotmatrix.client.modules.fontCatalog import DEFAULT_FONT, FontCatalog
+from conftest import PACKAGE_PATH
+
+FONTS = os.path.join(PACKAGE_PATH, "fonts")
+
+
+@pytest.fixture(scope="module")
+def catalog(tmp_path_factory):
+    catalog = FontCatalog(FONTS, str(tmp_path_factory.mktemp("fonts") / "index.json"))
+    catalog.build()
+    return catalog
+
+
+def test_covers(catalog):
+    assert catalog.covers("5x7.bdf", "Hello, World")
+    assert not catalog.covers("5x7.bdf", "★")
+    assert catalog.covers("6x13.bdf", "★ star")
+    assert not catalog.covers("missing.ttf", "a")
+
+
+def test_fallback_keeps_a_covering_font(catalog):
+    assert catalog.fallback("5x7.bdf", "Hello") == "5x7.bdf"
+    assert catalog.fallback(DEFAULT_FONT, "Hello") == DEFAULT_FONT
+
+
+def test_fallback_prefers_a_font_of_the_same_kind(catalog):
+    # The default font has no Cyrillic, the next scalable font with it is used
+    fallback = catalog.fallback(DEFAULT_FONT, "Привет")
+    assert catalog.get(fallback)["pixel_size"] is None
+    assert catalog.covers(fallback, "Привет")
+
+    fallback = catalog.fallback("5x7.bdf", "★")
+    assert catalog.get(fallback)["pixel_size"]
+    assert catalog.covers(fallback, "★")
+
+
+def test_fallback_without_a_covering_font(catalog):
+    assert catalog.fallback("5x7.bdf", "日本") == "5x7.bdf"
+
+
+def test_atlases_only_for_bitmap_fonts(tmp_path):
+    index = tmp_path / "index.json"
+    stale = tmp_path / "index" / "Arial.ttf.10.atlas"
+    stale.parent.mkdir()
+    stale.write_bytes(b"old scalable render")
+    catalog = FontCatalog(FONTS, str(index))
+    catalog.build()
+
+    assert catalog.atlas("Arial.ttf") is None
+    atlas = catalog.atlas("6x10.bdf")
+    assert atlas is not None and atlas.pixel_size == 10
+    assert sorted(os.listdir(tmp_path / "index")) == [
+        f"{name}.{catalog.get(name)['pixel_size']}.atlas" for name in catalog.names() if name.endswith(".bdf")
+    ]
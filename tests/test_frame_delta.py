@@ -0,0 +1,63 @@
+from custom_components.idotmatrix.client.modules.frameDelta import PIXEL_COMMAND_SIZE, FrameDelta
+
+SIZE = 16
+# DIY mode 3: enter drawing, keep the shown image
+MODE = bytes([5, 0, 4, 1, 3])
+
+
+def _frame(pixels=(), background=(0, 0, 0)):
+    frame = bytearray(bytes(background) * SIZE * SIZE)
+    for x, y, color in pixels:
+        frame[(y * SIZE + x) * 3:(y * SIZE + x) * 3 + 3] = bytes(color)
+    return bytes(frame)
+
+
+def _commands(payload):
+    return [bytes(payload[i:i + PIXEL_COMMAND_SIZE]) for i in range(0, len(payload), PIXEL_COMMAND_SIZE)]
+
+
+def _pixel(x, y, color):
+    return bytes([10, 0, 5, 1, 0, *color, x, y])
+
+
+def test_count_changed():
+    delta = FrameDelta(SIZE, SIZE)
+    changed, bbox = delta._countChanged(_frame([(2, 3, (1, 0, 0)), (5, 9, (0, 0, 9))]), _frame())
+    assert changed == 2
+    assert bbox == (2, 3, 6, 10)
+    assert delta._countChanged(_frame(), _frame()) == (0, None)
+
+
+def test_first_delta_enters_draw_mode_over_the_keyframe():
+    delta = FrameDelta(SIZE, SIZE)
+    assert delta.encode(_frame([(0, 0, (9, 9, 9)), (1, 1, (7, 0, 0))]))[0] == "keyframe"
+
+    kind, payload = delta.encode(_frame([(0, 0, (9, 9, 9)), (2, 2, (0, 5, 0))]))
+    assert kind == "delta"
+    assert bytes(payload[:len(MODE)]) == MODE
+    # only the changes, (0, 0) is kept from the keyframe
+    assert _commands(payload[len(MODE):]) == [_pixel(1, 1, (0, 0, 0)), _pixel(2, 2, (0, 5, 0))]
+
+    kind, payload = delta.encode(_frame([(0, 0, (9, 9, 9)), (3, 3, (0, 5, 0))]))
+    assert kind == "delta"
+    assert _commands(payload) == [_pixel(2, 2, (0, 0, 0)), _pixel(3, 3, (0, 5, 0))]
+
+
+def test_keyframe_when_deltas_cost_more():
+    delta = FrameDelta(SIZE, SIZE)
+    delta.encode(_frame())
+    # A full frame of changes costs more than the PNG
+    assert delta.encode(_frame(background=(200, 10, 10)))[0] == "keyframe"
+    changed = [(x, y, (x * 16, y * 16, 1)) for x in range(SIZE) for y in range(SIZE)]
+    assert delta.encode(_frame(changed))[0] == "keyframe"
+
+
+def test_keyframe_interval_and_reset():
+    delta = FrameDelta(SIZE, SIZE, keyframe_interval=3)
+    kinds = [delta.encode(_frame([(index, 0, (255, 0, 0))]))[0] for index in range(7)]
+    assert kinds == ["keyframe", "delta", "delta", "keyframe", "delta", "delta", "keyframe"]
+
+    delta.reset()
+    assert delta.encode(_frame())[0] == "keyframe"
+    kind, payload = delta.encode(_frame([(1, 1, (1, 1, 1))]))
+    assert kind == "delta" and bytes(payload[:len(MODE)]) == MODE
@@ -0,0 +1,89 @@
+import os
+import random
+
+from PIL import Image as PilImage
+import pytest
+
+from custom_components.idotmatrix.client.modules.gif import Gif
+from custom_components.idotmatrix.client.modules.mediaLibrary import MediaLibrary
+
+COLORS = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]
+
+
+def _write(path, frames, duration=100):
+    frames[0].save(
+        path, format="GIF", save_all=True, append_images=frames[1:], loop=0,
+        duration=duration, disposal=2, optimize=False,
+    )
+
+
+def _decode(data, path):
+    with open(path, "wb") as file:
+        file.write(data)
+    frames = []
+    with PilImage.open(path) as img:
+        try:
+            while True:
+                frames.append(img.convert("RGB").tobytes())
+                img.seek(img.tell() + 1)
+        except EOFError:
+            pass
+    return frames
+
+
+@pytest.fixture
+def moving_square(tmp_path):
+    frames = []
+    for step in range(8):
+        frame = PilImage.new("RGB", (32, 32), COLORS[0])
+        frame.paste(COLORS[1 + step % 4], (step * 3, step * 2, step * 3 + 8, step * 2 + 8))
+        frames.append(frame)
+    # a repeated frame is merged into its predecessor
+    frames.insert(4, frames[3].copy())
+    path = str(tmp_path / "square.gif")
+    _write(path, frames)
+    return path, frames
+
+
+@pytest.fixture
+def noise(tmp_path):
+    rng = random.Random(1)
+    frames = []
+    for _ in range(24):
+        frame = PilImage.new("RGB", (32, 32))
+        frame.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(32 * 32)])
+        frames.append(frame.quantize(colors=256).convert("RGB"))
+    path = str(tmp_path / "noise.gif")
+    _write(path, frames)
+    return path
+
+
+def test_optimized_frames_match_source(moving_square, tmp_path):
+    path, source = moving_square
+    decoded = _decode(Gif().processFile(path, 32), str(tmp_path / "out.gif"))
+    expected = [frame.tobytes() for index, frame in enumerate(source) if index != 4]
+    assert decoded == expected
+
+
+def test_budget_is_kept(noise, tmp_path):
+    unconstrained = Gif().processFile(noise, 32)
+    max_bytes = len(unconstrained) // 3
+    data = Gif().processFile(noise, 32, max_bytes=max_bytes)
+    assert len(data) <= max_bytes
+    decoded = _decode(data, str(tmp_path / "out.gif"))
+    assert 0 < len(decoded) <= 24
+    assert all(len(frame) == 32 * 32 * 3 for frame in decoded)
+
+
+def test_media_library_converts_again_for_a_new_budget(noise, tmp_path):
+    library = MediaLibrary(str(tmp_path / "cache"))
+    kind, unconstrained = library.load(noise, 32)
+    assert kind == "gif"
+    assert library.get(noise, 32) == (kind, unconstrained)
+
+    max_bytes = len(unconstrained) // 3
+    assert library.get(noise, 32, max_bytes) is None
+    kind, data = library.load(noise, 32, max_bytes)
+    assert len(data) <= max_bytes
+    assert library.get(noise, 32, max_bytes) == (kind, data)
+    assert os.path.exists(library._cachePath(noise, 32) + ".gif")
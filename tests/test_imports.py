@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+
+from conftest import PACKAGE, PACKAGE_PATH, ROOT
+
+BOOTSTRAP = f"""
+import json, os, sys, types
+for name, path in (("custom_components", os.path.join({ROOT!r}, "custom_components")), ({PACKAGE!r}, {PACKAGE_PATH!r})):
+    package = types.ModuleType(name)
+    package.__path__ = [path]
+    sys.modules[name] = package
+"""
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", BOOTSTRAP + code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_client_import_loads_no_heavy_dependencies():
+    loaded = _run(
+        "import custom_components.idotmatrix.client as client\n"
+        "print(json.dumps(sorted({name.split('.')[0] for name in sys.modules} & {'PIL', 'cryptography'})))"
+    )
+    assert loaded == []
+
+
+def test_client_reexports_the_module_classes():
+    same = _run(
+        "from custom_components.idotmatrix import client\n"
+        "from custom_components.idotmatrix.client.modules.clock import Clock\n"
+        "print(json.dumps([client.Clock is Clock, client.modules.Clock is Clock, 'Gif' in dir(client)]))"
+    )
+    assert same == [True, True, True]
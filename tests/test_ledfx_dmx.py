@@ -0,0 +1,62 @@
+from custom_components.idotmatrix.ledfx_dmx import (
+    E131_ACN_ID,
+    E131_VECTOR_EXTENDED_SYNC,
+    E131_VECTOR_FRAMING_DATA,
+    E131_VECTOR_ROOT_DATA,
+    E131_VECTOR_ROOT_EXTENDED,
+    SOURCE_ARTNET,
+    SOURCE_E131,
+    DmxFrameAssembler,
+    parse_e131,
+)
+
+SYNC_UNIVERSE = 7
+
+
+def _e131_data(universe, sync_address, slots=b"\x00" * 6):
+    packet = bytearray(126 + len(slots))
+    packet[4:16] = E131_ACN_ID
+    packet[18:22] = E131_VECTOR_ROOT_DATA.to_bytes(4, "big")
+    packet[40:44] = E131_VECTOR_FRAMING_DATA.to_bytes(4, "big")
+    packet[109:111] = sync_address.to_bytes(2, "big")
+    packet[113:115] = universe.to_bytes(2, "big")
+    packet[123:125] = (len(slots) + 1).to_bytes(2, "big")
+    packet[126:] = slots
+    return bytes(packet)
+
+
+def _e131_sync(sync_address):
+    packet = bytearray(49)
+    packet[4:16] = E131_ACN_ID
+    packet[18:22] = E131_VECTOR_ROOT_EXTENDED.to_bytes(4, "big")
+    packet[40:44] = E131_VECTOR_EXTENDED_SYNC.to_bytes(4, "big")
+    packet[45:47] = sync_address.to_bytes(2, "big")
+    return bytes(packet)
+
+
+def _synced_frame(assembler):
+    for universe in assembler.universes:
+        _, universe, sync_address, _ = parse_e131(_e131_data(universe, SYNC_UNIVERSE))
+        assert not assembler.on_data(SOURCE_E131, universe, sync_address)
+
+
+def test_parse_e131_sync_address():
+    assert parse_e131(_e131_data(1, SYNC_UNIVERSE))[:3] == ("data", 1, SYNC_UNIVERSE)
+    assert parse_e131(_e131_sync(SYNC_UNIVERSE)) == ("sync", SYNC_UNIVERSE)
+
+
+def test_sync_for_other_universe_keeps_frame():
+    assembler = DmxFrameAssembler(num_pixels=340, channels_per_universe=510)
+    _synced_frame(assembler)
+    _, address = parse_e131(_e131_sync(SYNC_UNIVERSE + 1))
+    assert not assembler.on_sync(SOURCE_E131, address)
+    assert assembler.on_sync(SOURCE_E131, SYNC_UNIVERSE)
+    # Released once, a repeated sync has nothing left to send
+    assert not assembler.on_sync(SOURCE_E131, SYNC_UNIVERSE)
+
+
+def test_artnet_sync_releases_frame():
+    assembler = DmxFrameAssembler(num_pixels=170, channels_per_universe=510)
+    assert not assembler.on_sync(SOURCE_ARTNET, 0)
+    assert not assembler.on_data(SOURCE_ARTNET, 1, 0)
+    assert assembler.on_sync(SOURCE_ARTNET, 0)
@@ -0,0 +1,105 @@
+import asyncio
+
+from custom_components.idotmatrix import ledfx_gateway
+from custom_components.idotmatrix.client.connectionManager import ConnectionManager
+
+
+class FakeConnection:
+    def __init__(self):
+        self.sent = []
+        self.is_connected = False
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def disconnect(self):
+        self.is_connected = False
+
+    async def send(self, data, response=False):
+        self.sent.append(bytes(data))
+        return True
+
+
+def _gateway(**kwargs):
+    return ledfx_gateway.LedFxGateway(None, port=0, ddp_port=None, screen_size=16, **kwargs)
+
+
+async def _stream(gateway, frames=3):
+    for _ in range(frames):
+        gateway._mark_received(ledfx_gateway.CAPTURE_DDP, b"")
+        gateway._publish_frame()
+        await asyncio.sleep(0.05)
+
+
+def test_idle_releases_the_wall_panels(monkeypatch):
+    panels = {}
+    monkeypatch.setattr(
+        ConnectionManager, "forAddress", classmethod(lambda cls, address: panels.setdefault(address, FakeConnection()))
+    )
+
+    async def run():
+        gateway = _gateway(
+            tiles=[("AA:00:00:00:00:01", 0, 0), ("AA:00:00:00:00:02", 1, 0)], idle_timeout=0.3
+        )
+        await gateway.start()
+        try:
+            await _stream(gateway)
+            assert all(panel.is_connected for panel in panels.values())
+            await asyncio.sleep(0.6)
+            assert not gateway.stats["realtime"]
+            assert len(panels) == 2
+            assert not any(panel.is_connected for panel in panels.values())
+        finally:
+            await gateway.stop()
+
+    asyncio.run(run())
+
+
+def test_no_idle_before_the_first_datagram():
+    async def run():
+        connection = FakeConnection()
+        gateway = _gateway(connection=connection, idle_timeout=0.2)
+        await gateway.start()
+        try:
+            await asyncio.sleep(0.5)
+            assert gateway.stats["realtime"]
+        finally:
+            await gateway.stop()
+
+    asyncio.run(run())
+
+
+def test_shorter_timeout_wakes_the_watchdog():
+    async def run():
+        gateway = _gateway(connection=FakeConnection(), idle_timeout=30)
+        await gateway.start()
+        try:
+            await _stream(gateway, frames=1)
+            await asyncio.sleep(0.1)
+            # A WLED packet with a 1 s timeout replaces the 30 s one mid-sleep
+            gateway._mark_received(ledfx_gateway.CAPTURE_WLED, bytes([2, 1]))
+            await asyncio.sleep(1.4)
+            assert not gateway.stats["realtime"]
+
+            gateway._mark_received(ledfx_gateway.CAPTURE_DDP, b"")
+            gateway.set_idle_timeout(0.2)
+            await asyncio.sleep(0.5)
+            assert gateway._idle_count == 2
+        finally:
+            await gateway.stop()
+
+    asyncio.run(run())
+
+
+def test_fps_target_includes_the_encode_time(monkeypatch):
+    gateway = _gateway(connection=FakeConnection())
+    recorded = []
+    monkeypatch.setattr(gateway._fps_controller, "record", recorded.append)
+    output = gateway._outputs[0]
+
+    async def run():
+        # encoding took 0.2 s, longer than the send
+        await gateway._transmit_frame([(output, "keyframe", bytearray(8))], (0.0, 0.0, 1.0, 1.2))
+
+    asyncio.run(run())
+    assert len(recorded) == 1 and abs(recorded[0] - 0.2) < 1e-6